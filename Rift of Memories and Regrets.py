@@ -5,8 +5,22 @@ import pygame
 import sys
 import os
 import math
+import zlib
 import ctypes
 from collections import deque
+from simulation import BulletSimulation, RewindHistory
+from patterns import spawn_schedule, CHANCE_PERIOD
+from canvas_view import BulletCanvasView, BULLET_STYLES, ItemPool, CanvasBatch, CanvasLayers, TINT_STEPS, tint_ramp
+from game_loop import LoopClock, SIM_RATES, rate_label, render_choices
+from hud import Hud
+from background import BakedBackground
+from particles import ParticleSystem
+from quality import QualityGovernor
+from replay import Replay, CHECK_EVERY
+from bench import StressRamp, run_benchmark, run_stress
+from memory_canvas import MemoryCanvas, MemoryRoot
+from profiler import FrameProfiler
+from telemetry import SessionTelemetry
 try:
     import pyi_splash
     # Disable on macOS due to incompatibilities
@@ -30,18 +44,52 @@ _atan2 = math.atan2
 _pi = math.pi
 _tau = getattr(math, 'tau', 2 * math.pi)
 
+# Canvas size when running without a window (benchmarks)
+HEADLESS_SIZE = (1280, 720)
+
 class bullet_hell_game:
-    def __init__(self, root, bg_color_interval=6):
+    # Replay input kinds -> the methods that apply them
+    REPLAY_INPUTS = {
+        'move': 'apply_player_move',
+        'shoot': 'player_shoot',
+        'focus': '_focus_key_pressed',
+        'unfocus': '_focus_key_released',
+        'trap': '_static_trap_key',
+        'practice': 'toggle_practice_mode',
+    }
+
+    def __init__(self, root, bg_color_interval=6, seed=None, record_path=None, replay=None, headless=False,
+                 profile_path=None):
+        # Headless runs (benchmarks) get no window, audio, controllers or menu
+        self.headless = headless
         # Initialize pygame mixer and play music
         if pyi_splash is not None:
             pyi_splash.update_text("Loading...")
-        pygame.init()
-        pygame.mixer.init()
+        if not headless:
+            pygame.init()
+            pygame.mixer.init()
+        
+        # Gameplay randomness comes from `rng`, reseeded for every run from the
+        # session seed; cosmetic effects use `fx_rng` so they never shift a run
+        self.session_rng = random.Random(seed)
+        self.rng = random.Random()
+        self.fx_rng = random.Random()
+        # Input recording and playback (see replay.py)
+        self.record_path = record_path
+        self.replay_source = replay  # played as the first run
+        self.replay = None
+        self._applying_replay = False
+        self._replay_checked = -1
+        self.sim_ticks = 0
+        self.game_time = 0.0  # simulated seconds this run
+        self.stress = None  # StressRamp while one runs (see bench.py)
+        self.telemetry = None  # SessionTelemetry of the run being played (see telemetry.py)
         
         # Initialize joystick/controller support
-        pygame.joystick.init()
         self.joysticks = []
-        for i in range(pygame.joystick.get_count()):
+        if not headless:
+            pygame.joystick.init()
+        for i in range(0 if headless else pygame.joystick.get_count()):
             try:
                 joy = pygame.joystick.Joystick(i)
                 joy.init()
@@ -73,6 +121,10 @@ class bullet_hell_game:
             'difficulty_multiplier': 1.0,
             'bg_color_interval': bg_color_interval,
             'player_speed': 15,
+            'sim_rate': 20,      # gameplay ticks per second
+            'render_rate': 0,    # canvas redraws per second, 0 = after every tick
+            'background_mode': 'baked',  # 'baked' colour tables or 'live' per-frame recompute
+            'auto_quality': True,  # shed cosmetic effects when frames run long
             'unlock_times': {
             'vertical': 0,
             'horizontal': 8,
@@ -106,8 +158,11 @@ class bullet_hell_game:
             'pause': ['Escape'],
             'restart': ['r'],
             'practice': ['p'],
-            'debug': ['F3']
+            'debug': ['F3'],
+            'stress': ['F6']  # practice mode only: spawn-rate ramp for finding the tick budget's limit
         },
+        'stress_log': 'stress_ramp.csv',
+        'telemetry_dir': 'telemetry',  # a performance report per run goes here; '' turns it off
         'mouse_enabled': True,
         'controller_enabled': True,
         'touchscreen_enabled': True,
@@ -119,12 +174,20 @@ class bullet_hell_game:
         self.previous_music_position = 0
         
         self.root = root
-        self.root.title("Rift of Memories and Regrets")
-        self.root.state('zoomed')  # Maximize window (Windows only)
-        self.root.update_idletasks()
-        self.width = self.root.winfo_width()
-        self.height = self.root.winfo_height()
-        self.canvas = tk.Canvas(self.root, width=self.width, height=self.height, bg="black")
+        if headless:
+            self.root.withdraw()
+            self.width, self.height = HEADLESS_SIZE
+        else:
+            self.root.title("Rift of Memories and Regrets")
+            self.root.state('zoomed')  # Maximize window (Windows only)
+            self.root.update_idletasks()
+            self.width = self.root.winfo_width()
+            self.height = self.root.winfo_height()
+        if headless:
+            # Nothing is shown, so keep the items in memory instead of paying for Tk
+            self.canvas = MemoryCanvas(self.root, width=self.width, height=self.height, bg="black")
+        else:
+            self.canvas = tk.Canvas(self.root, width=self.width, height=self.height, bg="black")
         self.canvas.pack(fill=tk.BOTH, expand=True)
         # Store customizable background color change interval (seconds)
         self.bg_color_interval = self.settings['bg_color_interval']
@@ -197,6 +260,8 @@ class bullet_hell_game:
             self.root.bind(key, self.toggle_practice_mode)
         for key in self.settings['keybinds']['debug']:
             self.root.bind(f"<{key}>", self.toggle_debug_hud)
+        for key in self.settings['keybinds']['stress']:
+            self.root.bind(f"<{key}>", self.toggle_stress_ramp)
         
         # Debug HUD state
         self.debug_hud_enabled = False
@@ -204,6 +269,16 @@ class bullet_hell_game:
         self._frame_time_buffer = deque(maxlen=120)
         self._last_frame_time_stamp = time.perf_counter()
         
+        # Fixed-timestep game loop: tick and redraw pacing (see game_loop.py)
+        self.loop_clock = LoopClock(self.settings['sim_rate'], self.settings['render_rate'])
+        # Time per subsystem for the debug HUD, optionally logged per frame (see profiler.py)
+        self.profiler = FrameProfiler()
+        if profile_path:
+            try:
+                self.profiler.open_csv(profile_path)
+            except OSError as e:
+                print("Could not open profile log:", e)
+        
         # Freeze tint palette
         self.freeze_tint_palette = {
             'vertical': '#a8ecff',
@@ -227,6 +302,11 @@ class bullet_hell_game:
             'split': '#e0ffa8',
             'static': '#cccccc'
         }
+        # Per-kind ramps from the style fill to the palette colour, built once
+        self.freeze_tint_ramps = {
+            kind: tint_ramp(style[1].get('fill') or '#ffffff', self.freeze_tint_palette.get(kind, '#a8ecff'))
+            for kind, style in BULLET_STYLES.items()
+        }
         
         # Reset count for dialog
         self.resetcount = 1
@@ -235,7 +315,8 @@ class bullet_hell_game:
             pyi_splash.close()
         
         # Show main menu
-        self.show_main_menu()
+        if not headless:
+            self.show_main_menu()
 
     def _resolve_asset_path(self, filename: str) -> str:
         """Return an absolute path to bundled assets both in dev and PyInstaller builds."""
@@ -255,6 +336,12 @@ class bullet_hell_game:
             return
         if dx == 0 and dy == 0:
             return
+        if not self._take_input('move', dx, dy):
+            return
+        self._shift_player(dx, dy)
+
+    def _shift_player(self, dx, dy):
+        """Move the player by (dx, dy), kept on screen."""
         x1, y1, x2, y2 = self.canvas.coords(self.player)
         width = x2 - x1
         height = y2 - y1
@@ -293,9 +380,10 @@ class bullet_hell_game:
         glow_r = 34
         glow = self.canvas.create_oval(cx-glow_r/2, cy-glow_r/2, cx+glow_r/2, cy+glow_r/2, outline="#ffffff", width=2)
         self.player_deco_items = [diamond, inner, glow]
-        # Ensure base is above background but below bullets initially
+        # Decorations go in the player layer first so the base ends up on top of them
         for item in self.player_deco_items:
-            self.canvas.tag_lower(item, self.player)
+            self.layers.place(item, 'player')
+        self.layers.place(self.player, 'player')
 
     def update_player_sprite_position(self):
         if not self.player_deco_items or self.player is None:
@@ -317,11 +405,11 @@ class bullet_hell_game:
         glow_r = 34
         self.canvas.coords(glow, cx-glow_r/2, cy-glow_r/2, cx+glow_r/2, cy+glow_r/2)
 
-    def animate_player_sprite(self):
+    def animate_player_sprite(self, dt):
         if not self.player_deco_items:
             return
-        self.player_glow_phase += 0.15
-        self.player_rgb_phase += 0.02
+        self.player_glow_phase += 3.0 * dt
+        self.player_rgb_phase += 0.4 * dt
         diamond, inner, glow = self.player_deco_items
         # Pulsing glow color
         pulse = (_sin(self.player_glow_phase) + 1)/2  # 0..1
@@ -369,37 +457,19 @@ class bullet_hell_game:
 
     # ---------------- Health / Lives Display ----------------
     def update_health_display(self):
-        """Render heart icons (❤) in top-left under score to represent remaining lives.
-        Clears previous icons and recreates based on self.lives. Uses text items for simplicity."""
-        # Remove any existing heart items
-        if getattr(self, 'health_icon_items', None):
-            for hid in self.health_icon_items:
-                try:
-                    self.canvas.delete(hid)
-                except Exception:
-                    pass
-            self.health_icon_items = []
-        # Spacing & position: start just below score text
-        base_x = 20
-        base_y = 46  # score at ~20, hearts below
-        spacing = 28
-        for i in range(getattr(self, 'lives', 0)):
-            try:
-                heart = self.canvas.create_text(base_x + i*spacing, base_y, text='❤', fill='#ff4d6d', font=("Arial", 22, 'bold'))
-            except Exception:
-                # fallback rectangle if emoji not supported
-                heart = self.canvas.create_rectangle(base_x + i*spacing, base_y, base_x + i*spacing + 20, base_y+20, outline='#ff4d6d')
-            self.health_icon_items.append(heart)
-        # Ensure hearts appear above background but under pause/game over overlays
-        for hid in self.health_icon_items:
-            try:
-                self.canvas.lift(hid)
-            except Exception:
-                pass
+        """Show one heart icon (❤) per remaining life in the top-left, under the score.
+        Heart items belong to the HUD and are shown or hidden, not recreated."""
+        self.hud.set_hearts(getattr(self, 'lives', 0))
+        self.health_icon_items = self.hud.hearts
 
 
     # ---------------- Vaporwave background setup ----------------
     def init_background(self):
+        if self.settings.get('background_mode', 'baked') == 'baked':
+            self.background = BakedBackground(self.canvas, self.width, self.height,
+                                              self.bg_color_interval, self.render_batch)
+            return
+        self.background = None
         # Parameters
         self.bg_color_cycle = ["#0d0221", "#1a0533", "#32054e", "#4b0a67", "#6d117b", "#8f1f85", "#b1387f", "#d25872"]
         self.bg_cycle_index = 0
@@ -408,7 +478,7 @@ class bullet_hell_game:
         self.grid_h_lines = []
         self.grid_v_lines = []
         self.grid_depth = 40  # number of perspective rows
-        self.grid_scroll_speed = 0.6
+        self.grid_scroll_speed = 12  # px/s
         self.grid_vertical_count = 18
         self.grid_perspective_power = 1.55
         # Extend grid to near bottom of window for full coverage
@@ -419,6 +489,8 @@ class bullet_hell_game:
         self._create_grid_lines()
 
     def toggle_practice_mode(self, event=None):
+        if not self._take_input('practice'):
+            return
         was = self.practice_mode
         self.practice_mode = not self.practice_mode
         if self.practice_mode:
@@ -426,9 +498,9 @@ class bullet_hell_game:
             color = "#33ff77"
             if self.practice_text is None:
                 self.practice_text = self.canvas.create_text(self.width-120, 80, text=label, fill=color, font=("Arial", 14))
+                self.layers.place(self.practice_text, 'hud')
             else:
                 self.canvas.itemconfig(self.practice_text, text=label, fill=color)
-            self.canvas.lift(self.practice_text)
         else:
             if self.practice_text is not None:
                 self.canvas.delete(self.practice_text)
@@ -453,7 +525,10 @@ class bullet_hell_game:
             line = self.canvas.create_line(x_screen, self.grid_base_y, self.width/2, self.grid_horizon_y, fill="#222", width=1)
             self.grid_v_lines.append((line, x_norm))
 
-    def update_background(self):
+    def update_background(self, dt):
+        if self.background is not None:
+            self.background.update(dt, getattr(self, 'freeze_active', False))
+            return
         now = time.time()
         # Color cycle
         if now - self.bg_last_color_change > self.bg_color_interval:
@@ -491,14 +566,14 @@ class bullet_hell_game:
         def _mix(a, b, t):
             return tuple(int(a[i] + (b[i]-a[i])*t) for i in range(3))
         # Glow/pulse factor for line brightness
-        self.grid_glow_cycle += 0.05
+        self.grid_glow_cycle += 1.0 * dt
         glow = (_sin(self.grid_glow_cycle) + 1)/2  # 0..1
         # Update horizontal lines to scroll downward; wrap to top with new perspective
         new_h_lines = []
         for line_id, t in self.grid_h_lines:
             # Move line by scroll speed scaled by its depth (closer lines move faster)
             depth_factor = (t ** self.grid_perspective_power)
-            base_dy = self.grid_scroll_speed * (0.3 + depth_factor*2)
+            base_dy = self.grid_scroll_speed * dt * (0.3 + depth_factor*2)
             if getattr(self, 'freeze_active', False):
                 base_dy *= 0.25  # slow during freeze
             dy = base_dy
@@ -536,11 +611,14 @@ class bullet_hell_game:
             self.canvas.itemconfig(line_id, fill=f"#{r:02x}{g:02x}{b:02x}")
             new_v_lines.append((line_id, x_norm))
         self.grid_v_lines = new_v_lines
-        # Send lines to back so gameplay elements appear above
-        for line_id, _ in self.grid_h_lines:
-            self.canvas.tag_lower(line_id)
-        for line_id, _ in self.grid_v_lines:
-            self.canvas.tag_lower(line_id)
+
+    def start_headless(self):
+        """Start a run without binding input or starting the loop; the caller drives the ticks."""
+        self.in_main_menu = False
+        self.in_settings_menu = False
+        self.game_started = True
+        self.canvas.delete("all")
+        self._initialize_game()
 
     def restart_game(self, event=None, force=False):
         if not self.game_over and not force:
@@ -574,21 +652,15 @@ class bullet_hell_game:
 
     def shoot_quad_bullet(self):
         if self.game_over: return
-        x = random.randint(0, self.width-110)
-        new_ids = []
+        x = self.rng.randint(0, self.width-110)
         for offset in (0,30,60,90):
-            bid = self.canvas.create_oval(x+offset, 0, x+offset+20, 20, fill="red")
-            new_ids.append(bid)
-        self.quad_bullets.extend(new_ids)
+            self.sim.spawn('quad', x+offset, 0, 20, 20, vy=140)
 
     def shoot_triangle_bullet(self):
         if not self.game_over:
-            x = random.randint(0, self.width-20)
-            direction = random.choice([1, -1])
-            # Draw triangle using create_polygon
-            points = [x, 0, x+20, 0, x+10, 20]
-            bullet = self.canvas.create_polygon(points, fill="#bfff00")
-            self.triangle_bullets.append((bullet, direction))
+            x = self.rng.randint(0, self.width-20)
+            direction = self.rng.choice([1, -1])
+            self.sim.spawn('triangle', x, 0, 20, 20, vx=140*direction, vy=140)
 
     def get_dialog_string(self):
         dialogs = [
@@ -644,179 +716,150 @@ class bullet_hell_game:
             "Fun isn't something one considers when balancing the universe. But this... does put a smile on my face.",
             "You should see the other games I've trapped players in. They never leave."
         ]
-        self.dial=random.choice(dialogs)
-        if self.dial == ":)":
-            self.canvas.itemconfig(self.dialog, fill="red")
-        else:
-            self.canvas.itemconfig(self.dialog, fill="white")
+        self.dial=self.fx_rng.choice(dialogs)
+        if getattr(self, 'dialog', None) is not None:
+            self.canvas.itemconfig(self.dialog, fill="red" if self.dial == ":)" else "white")
         return self.dial
 
     def shoot_horizontal_laser(self):
         if not self.game_over:
-            y = random.randint(50, self.height-50)
-            indicator = self.canvas.create_line(0, y, self.width, y, fill="red", dash=(5, 2), width=3)
-            self.laser_indicators.append((indicator, y, 30))  # 30 frames indicator
+            y = self.rng.randint(50, self.height-50)
+            self.sim.spawn('laser_indicator', 0, y, self.width, 0, timer=1.5)  # 1.5s warning
 
     def shoot_exploding_bullet(self):
         if not self.game_over:
-            x = random.randint(0, self.width-20)
-            bullet = self.canvas.create_oval(x, 0, x + 20, 20, fill="white")
-            self.exploding_bullets.append(bullet)
+            x = self.rng.randint(0, self.width-20)
+            self.sim.spawn('exploding', x, 0, 20, 20, vy=100 + 20*(self.difficulty // 3))
 
     def shoot_star_bullet(self):
         if not self.game_over:
-            # Proper 5-point star with outline. Keep hit area similar size.
+            # 5-point star; the view draws it inside this box, rotated by its phase
             outer_r = 18
-            inner_r = outer_r * 0.45
-            # Ensure it fits horizontally
-            cx = random.randint(outer_r+2, self.width - outer_r - 2)
-            cy = outer_r  # start near top
-            pts = []
-            # Star points (10 vertices alternating outer/inner)
-            for i in range(10):
-                angle = -math.pi/2 + i * math.pi/5  # start pointing up
-                r = outer_r if i % 2 == 0 else inner_r
-                px = cx + r * _cos(angle)
-                py = cy + r * _sin(angle)
-                pts.extend([px, py])
-            bullet = self.canvas.create_polygon(pts, fill="magenta", outline="white", width=2)
-            self.star_bullets.append(bullet)
+            cx = self.rng.randint(outer_r+2, self.width - outer_r - 2)
+            self.sim.spawn('star', cx - outer_r, 0, outer_r*2, outer_r*2, vy=160, rate=3.6)
 
     def shoot_rect_bullet(self):
         if not self.game_over:
-            x = random.randint(0, self.width-60)
-            bullet = self.canvas.create_rectangle(x, 0, x+60, 15, fill="blue")
-            self.rect_bullets.append(bullet)
+            x = self.rng.randint(0, self.width-60)
+            self.sim.spawn('rect', x, 0, 60, 15, vy=160)
 
     def shoot_zigzag_bullet(self):
         if not self.game_over:
-            x = random.randint(0, self.width-20)
-            bullet = self.canvas.create_oval(x, 0, x + 20, 20, fill="cyan")
-            # Zigzag state: (bullet, direction, step_count)
-            direction = random.choice([1, -1])
-            self.zigzag_bullets.append((bullet, direction, 0))
+            x = self.rng.randint(0, self.width-20)
+            # Horizontal velocity flips every 0.5s; time to the next flip in `timer`
+            direction = self.rng.choice([1, -1])
+            self.sim.spawn('zigzag', x, 0, 20, 20, vx=100*direction, vy=100)
 
     def shoot_fast_bullet(self):
         if not self.game_over:
-            x = random.randint(0, self.width-20)
-            bullet = self.canvas.create_oval(x, 0, x + 20, 20, fill="orange")
-            self.fast_bullets.append(bullet)
+            x = self.rng.randint(0, self.width-20)
+            self.sim.spawn('fast', x, 0, 20, 20, vy=280)
 
     # ---------------- New bullet spawners ----------------
     def shoot_homing_bullet(self):
         """Spawn a bullet that gradually steers toward the player."""
         if not self.game_over:
-            x = random.randint(0, self.width-20)
-            bullet = self.canvas.create_oval(x, 0, x + 16, 16, fill="#ffdd00")
-            # Start with simple downward motion; vx adjusted over time
-            self.homing_bullets.append((bullet, 0.0, 4.0, self.homing_bullet_max_life))  # (id,vx,vy,life)
+            x = self.rng.randint(0, self.width-20)
+            # Start with simple downward motion; vx adjusted over time, life in `timer`
+            self.sim.spawn('homing', x, 0, 16, 16, vx=0.0, vy=80.0, timer=self.homing_bullet_max_life)
 
     def shoot_spiral_bullet(self):
         """Spawn a bullet that spirals outward from a point (random near center)."""
         if not self.game_over:
-            cx = random.randint(self.width//3, self.width*2//3)
-            cy = random.randint(60, self.height//3)
-            angle = random.uniform(0, math.tau if hasattr(math, 'tau') else 2*math.pi)
-            bullet = self.canvas.create_oval(cx-10, cy-10, cx+10, cy+10, fill="#00ff88")
-            ang_speed = 0.35  # radians per frame
-            rad_speed = 2.0 + self.difficulty/6
-            self.spiral_bullets.append((bullet, angle, 0.0, ang_speed, rad_speed, cx, cy))
+            cx = self.rng.randint(self.width//3, self.width*2//3)
+            cy = self.rng.randint(60, self.height//3)
+            angle = self.rng.uniform(0, math.tau if hasattr(math, 'tau') else 2*math.pi)
+            ang_speed = 7.0  # radians per second
+            rad_speed = 40 + self.difficulty*10/3
+            # Polar state: angle in `phase`, radius in `amp` (grows by vy px/s), origin in (ox, oy)
+            self.sim.spawn('spiral', cx-10, cy-10, 20, 20, phase=angle, rate=ang_speed,
+                           vy=rad_speed, ox=cx, oy=cy)
 
     def shoot_radial_burst(self):
         """Spawn a radial burst of small bullets from a random point."""
         if not self.game_over:
-            cx = random.randint(self.width//4, self.width*3//4)
-            cy = random.randint(80, self.height//2)
+            cx = self.rng.randint(self.width//4, self.width*3//4)
+            cy = self.rng.randint(80, self.height//2)
             count = 8
-            base_speed = 3.5 + self.difficulty/5
+            base_speed = 70 + self.difficulty*4
             for i in range(count):
-                ang = (2*math.pi / count) * i + random.uniform(-0.1, 0.1)
+                ang = (2*math.pi / count) * i + self.rng.uniform(-0.1, 0.1)
                 vx = _cos(ang) * base_speed
                 vy = _sin(ang) * base_speed
-                bullet = self.canvas.create_oval(cx-8, cy-8, cx+8, cy+8, fill="#ff00ff")
-                self.radial_bullets.append((bullet, vx, vy))
+                self.sim.spawn('radial', cx-8, cy-8, 16, 16, vx=vx, vy=vy)
 
     # ---------- New bullet pattern spawners (Wave, Boomerang, Split) ----------
     def shoot_wave_bullet(self):
         """Bullet that moves downward while wobbling horizontally (sinusoidal)."""
         if not self.game_over:
-            x = random.randint(40, self.width-40)
+            x = self.rng.randint(40, self.width-40)
             size = 18
-            bullet = self.canvas.create_oval(x-size//2, 0, x+size//2, size, fill="#33aaff")
-            base_x = x
-            phase = random.uniform(0, 2*math.pi)
-            amp = random.randint(40, 90)
-            vy = 5 + self.difficulty/4
-            phase_speed = 0.25 + self.difficulty/30
-            self.wave_bullets.append((bullet, base_x, phase, amp, vy, phase_speed))
+            phase = self.rng.uniform(0, 2*math.pi)
+            amp = self.rng.randint(40, 90)
+            vy = 100 + self.difficulty*5
+            phase_speed = 5 + self.difficulty*2/3
+            self.sim.spawn('wave', x-size//2, 0, size, size, ox=x, phase=phase, amp=amp,
+                           vy=vy, rate=phase_speed)
 
     def shoot_boomerang_bullet(self):
         """Bullet that goes down then returns upward (boomerang)."""
         if not self.game_over:
-            x = random.randint(30, self.width-30)
+            x = self.rng.randint(30, self.width-30)
             size = 22
-            bullet = self.canvas.create_oval(x-size//2, 0, x+size//2, size, fill="#ffaa33")
-            vy = 8 + self.difficulty/3
-            timer = random.randint(18, 30)  # frames moving down before returning
-            self.boomerang_bullets.append((bullet, vy, timer, 'down'))
+            vy = 160 + self.difficulty*20/3
+            timer = self.rng.randint(18, 30) / 20  # seconds moving down before returning
+            self.sim.spawn('boomerang', x-size//2, 0, size, size, vy=vy, timer=timer)
 
     def shoot_split_bullet(self):
         """Bullet that falls then splits into fragments that spread out."""
         if not self.game_over:
-            x = random.randint(30, self.width-30)
+            x = self.rng.randint(30, self.width-30)
             size = 24
-            bullet = self.canvas.create_oval(x-size//2, 0, x+size//2, size, fill="#ffffff", outline="#ff55ff", width=2)
-            timer = random.randint(20, 35)
-            self.split_bullets.append((bullet, timer))
+            timer = self.rng.randint(20, 35) / 20  # seconds before splitting
+            self.sim.spawn('split', x-size//2, 0, size, size, vy=100 + self.difficulty*5, timer=timer)
 
     def shoot_bouncing_bullet(self):
         if not self.game_over:
-            x = random.randint(0, self.width-20)
-            bullet = self.canvas.create_oval(x, 0, x + 20, 20, fill="pink")
+            x = self.rng.randint(0, self.width-20)
             # Random angle in radians
-            angle = random.uniform(0, 2 * 3.14159)
-            speed = 7 + self.difficulty // 2
+            angle = self.rng.uniform(0, 2 * 3.14159)
+            speed = 140 + 20*(self.difficulty // 2)
             x_velocity = speed * _cos(angle)
             y_velocity = speed * _sin(angle)
-            # Bouncing state: (bullet, x_velocity, y_velocity, bounces_left)
-            self.bouncing_bullets.append((bullet, x_velocity, y_velocity, 3))
+            # Bounces left are kept in `timer`
+            self.sim.spawn('bouncing', x, 0, 20, 20, vx=x_velocity, vy=y_velocity, timer=3)
 
     def shoot_static_bullet(self):
         """Spawn a 'static' bullet that triggers a static trap mini-escape on hit instead of immediate damage."""
         if self.game_over:
             return
-        x = random.randint(0, self.width-26)
-        # Visual: white core with gray outline to differentiate
-        try:
-            bid = self.canvas.create_oval(x, 0, x+26, 26, fill="#bbbbbb", outline="#ffffff", width=2)
-        except Exception:
-            bid = self.canvas.create_rectangle(x, 0, x+26, 26, fill="#bbbbbb", outline="#ffffff")
-        self.static_bullets.append(bid)
+        x = self.rng.randint(0, self.width-26)
+        # Visual: white core with gray outline to differentiate (see canvas_view)
+        self.sim.spawn('static', x, 0, 26, 26, vy=120)
 
     def shoot_ring_burst(self):
         """Spawn a circular ring of bullets that fly outward."""
         if self.game_over:
             return
-        cx = random.randint(self.width//4, self.width*3//4)
-        cy = random.randint(100, self.height//2)
+        cx = self.rng.randint(self.width//4, self.width*3//4)
+        cy = self.rng.randint(100, self.height//2)
         count = 12
-        speed = 4 + self.difficulty/6
+        speed = 80 + self.difficulty*10/3
         radius = 24
         for i in range(count):
             ang = (2*math.pi / count) * i
             bx = cx + _cos(ang)*radius
             by = cy + _sin(ang)*radius
-            bullet = self.canvas.create_oval(bx-10, by-10, bx+10, by+10, fill="#55ffdd", outline="#ffffff")
             vx = _cos(ang) * speed
             vy = _sin(ang) * speed
-            self.ring_bullets.append((bullet, vx, vy))
+            self.sim.spawn('ring', bx-10, by-10, 20, 20, vx=vx, vy=vy)
 
     def shoot_fan_burst(self):
         """Spawn a fan spread of bullets aimed roughly at player with angular spread."""
         if self.game_over:
             return
         # Origin near top center-ish
-        base_x = random.randint(self.width//3, self.width*2//3)
+        base_x = self.rng.randint(self.width//3, self.width*2//3)
         base_y = 40
         px1, py1, px2, py2 = self.canvas.coords(self.player)
         pcx = (px1 + px2)/2
@@ -826,28 +869,26 @@ class bullet_hell_game:
         base_ang = math.atan2(dy, dx)
         spread = math.radians(50)  # total spread angle
         bullets_in_fan = 7
-        speed = 7 + self.difficulty/8
+        speed = 140 + self.difficulty*5/2
         for i in range(bullets_in_fan):
             frac = 0 if bullets_in_fan == 1 else i/(bullets_in_fan-1)
             ang = base_ang - spread/2 + spread * frac
             vx = _cos(ang) * speed
             vy = _sin(ang) * speed
-            bullet = self.canvas.create_oval(base_x-8, base_y-8, base_x+8, base_y+8, fill="#ffcc55", outline="#ffffff")
-            self.fan_bullets.append((bullet, vx, vy))
+            self.sim.spawn('fan', base_x-8, base_y-8, 16, 16, vx=vx, vy=vy)
         # Slight random extra bullet occasionally for variation
-        if random.random() < 0.25:
-            ang = base_ang + random.uniform(-spread/2, spread/2)
-            vx = _cos(ang) * (speed+1)
-            vy = _sin(ang) * (speed+1)
-            bullet = self.canvas.create_oval(base_x-8, base_y-8, base_x+8, base_y+8, fill="#ffaa33", outline="#ffffff")
-            self.fan_bullets.append((bullet, vx, vy))
+        if self.rng.random() < 0.25:
+            ang = base_ang + self.rng.uniform(-spread/2, spread/2)
+            vx = _cos(ang) * (speed+20)
+            vy = _sin(ang) * (speed+20)
+            self.sim.spawn('fan', base_x-8, base_y-8, 16, 16, vx=vx, vy=vy)
 
     # ---------------- Freeze Power-Up Methods ----------------
     def spawn_freeze_powerup(self):
         """Spawn a freeze power-up (blue snowflake-like polygon or circle) descending from top."""
         if self.game_over:
             return
-        x = random.randint(40, self.width - 40)
+        x = self.rng.randint(40, self.width - 40)
         y = 30
         # Simple 6-point snowflake/star representation
         radius = 18
@@ -862,7 +903,7 @@ class bullet_hell_game:
             p_id = self.canvas.create_polygon(pts, fill="#66d9ff", outline="#ffffff", width=2)
         except Exception:
             p_id = self.canvas.create_oval(x-radius, y-radius, x+radius, y+radius, fill="#66d9ff", outline="#ffffff")
-        self.freeze_powerups.append(p_id)
+        self.freeze_powerups.append(self.layers.place(p_id, 'actors'))
 
     def activate_freeze(self, mode='full', duration=5.0):
         """Activate freeze effect.
@@ -871,7 +912,7 @@ class bullet_hell_game:
         """
         self.freeze_mode = mode if mode in ('full','slow') else 'full'
         self.freeze_active = True
-        self.freeze_end_time = time.time() + duration
+        self.freeze_end_time = self.game_time + duration
         self._freeze_motion_phase_over = False
         # Start tint fade-in
         self.freeze_tint_target = 1.0
@@ -889,7 +930,7 @@ class bullet_hell_game:
             except Exception: pass
         try:
             label = 'FREEZE' if self.freeze_mode=='full' else 'SLOW FREEZE'
-            self.freeze_text = self.canvas.create_text(self.width//2, self.height//2, text=f"{label} {duration:0.1f}s", fill="#66d9ff", font=("Arial", 48, "bold"))
+            self.freeze_text = self.layers.place(self.canvas.create_text(self.width//2, self.height//2, text=f"{label} {duration:0.1f}s", fill="#66d9ff", font=("Arial", 48, "bold")), 'overlay')
         except Exception:
             self.freeze_text = None
         # Optional subtle flash effect: tint background lines (skip heavy effects for simplicity)
@@ -900,112 +941,65 @@ class bullet_hell_game:
         try:
             self.freeze_overlay = self.canvas.create_rectangle(0,0,self.width,self.height, fill="#66d9ff", outline="")
             self.canvas.itemconfig(self.freeze_overlay, stipple="gray25")
-            self.canvas.tag_lower(self.freeze_overlay)  # keep it behind text
+            self.layers.place(self.freeze_overlay, 'tint')  # keep it behind gameplay
         except Exception:
             self.freeze_overlay = None
-        # Initialize per-bullet original colors
-        self._initialize_bullet_color_cache()
 
-    def _initialize_bullet_color_cache(self):
-        # Capture original fills only once per activation
-        try:
-            self._bullet_original_fills.clear()
-        except Exception:
-            self._bullet_original_fills = {}
-        collections = [
-            ('vertical', self.bullets), ('horizontal', self.bullets2), ('triangle',[b for b,_ in self.triangle_bullets]),
-            ('diag',[b for b,_ in self.diag_bullets]), ('boss', self.boss_bullets), ('zigzag', self.zigzag_bullets),
-            ('fast', self.fast_bullets), ('star', self.star_bullets), ('rect', self.rect_bullets), ('egg', self.egg_bullets),
-            ('quad', self.quad_bullets), ('bouncing', self.bouncing_bullets), ('exploding', self.exploding_bullets),
-            ('homing',[b for b, *_ in self.homing_bullets]), ('spiral',[b for b,*_ in self.spiral_bullets]),
-            ('radial',[b for b,*_ in self.radial_bullets]), ('wave',[b for b,*_ in self.wave_bullets]),
-            ('boomerang',[b for b,*_ in self.boomerang_bullets]), ('split',[b for b,*_ in self.split_bullets]),
-        ]
-        for cat, coll in collections:
-            for bid in coll:
-                try:
-                    if isinstance(bid, tuple):
-                        bid = bid[0]
-                    if bid not in self._bullet_original_fills:
-                        self._bullet_original_fills[bid] = (self.canvas.itemcget(bid,'fill') or '#ffffff', cat)
-                except Exception:
-                    pass
+    def _apply_quality_tier(self):
+        """Push the current quality tier's effect settings to the background, particles and bullets."""
+        tier = self.quality.current
+        if self.background is not None:
+            self.background.set_detail(tier.grid_step, tier.color_every)
+        self.particles.set_cap(tier.particle_cap)
+        self.bullet_view.spin = tier.star_spin
+        self._rewind_ghost_cap = tier.ghost_cap
+        self.freeze_flake_rate = tier.flake_rate
 
-    def _apply_bullet_tint_fade(self):
-        # Blend original color towards palette color based on freeze_tint_progress (0..1)
+    def _update_freeze_tint(self, dt):
+        """Move freeze_tint_progress towards its target; the fade speed is per legacy 20 Hz frame."""
         prog = self.freeze_tint_progress
-        if abs(prog - self._last_freeze_tint_progress) < 0.01:
+        target = self.freeze_tint_target
+        if prog == target:
             return
-        self._last_freeze_tint_progress = prog
-        for bid, (orig_fill, cat) in list(self._bullet_original_fills.items()):
-            try:
-                target = self.freeze_tint_palette.get(cat, '#a8ecff')
-                of = orig_fill.lstrip('#')
-                tf = target.lstrip('#')
-                if len(of)!=6 or len(tf)!=6:
-                    continue
-                or_,og,ob = int(of[0:2],16), int(of[2:4],16), int(of[4:6],16)
-                tr,tg,tb = int(tf[0:2],16), int(tf[2:4],16), int(tf[4:6],16)
-                r = int(or_ + (tr-or_)*prog)
-                g = int(og + (tg-og)*prog)
-                b = int(ob + (tb-ob)*prog)
-                self.canvas.itemconfig(bid, fill=f"#{r:02x}{g:02x}{b:02x}")
-            except Exception:
-                pass
+        step = self.freeze_tint_fade_speed * dt / CHANCE_PERIOD
+        self.freeze_tint_progress = min(target, prog + step) if target > prog else max(target, prog - step)
+        self._apply_bullet_tint_fade()
+
+    def _apply_bullet_tint_fade(self):
+        # Blend bullets towards their palette colour by freeze_tint_progress (0..1),
+        # one ramp step per kind, recoloured by tag
+        step = int(self.freeze_tint_progress * TINT_STEPS + 0.5)
+        if step == self._freeze_tint_step:
+            return
+        self._freeze_tint_step = step
+        if step == 0:
+            self._restore_bullet_colors()
+            return
+        self.bullet_view.tint({kind: ramp[step] for kind, ramp in self.freeze_tint_ramps.items()})
 
     def _restore_bullet_colors(self):
-        for bid, (orig_fill, _cat) in list(self._bullet_original_fills.items()):
-            try:
-                self.canvas.itemconfig(bid, fill=orig_fill)
-            except Exception:
-                pass
-        self._bullet_original_fills.clear()
+        self.bullet_view.tint(None)
+        self._freeze_tint_step = 0
 
     # Legacy name retained (no-op wrapper for compatibility if referenced elsewhere)
     def _tint_all_bullets(self, freeze: bool):
-        if freeze:
-            self._initialize_bullet_color_cache()
-        else:
-            self._restore_bullet_colors()
+        # Fade towards the target instead of switching at once
+        self.freeze_tint_target = 1.0 if freeze else 0.0
 
     def _spawn_unfreeze_shatter(self):
         """Spawn small particle shards at each bullet position to emphasize thaw."""
+        xs, ys, vxs, vys = [], [], [], []
+        for x1, y1, x2, y2 in self.sim.boxes():
+            cx = (x1 + x2) / 2
+            cy = (y1 + y2) / 2
+            # 4 shards per bullet
+            for i in range(4):
+                ang = (math.pi/2)*i + self.fx_rng.uniform(-0.3,0.3)
+                spd = 60 + self.fx_rng.random()*40
+                xs.append(cx); ys.append(cy)
+                vxs.append(_cos(ang)*spd); vys.append(_sin(ang)*spd)
         try:
-            bullet_ids = []
-            for coll in [self.bullets, self.bullets2, self.triangle_bullets, self.diag_bullets, self.boss_bullets,
-                         self.zigzag_bullets, self.fast_bullets, self.star_bullets, self.rect_bullets,
-                         self.egg_bullets, self.quad_bullets, self.exploding_bullets, self.exploded_fragments,
-                         self.homing_bullets, self.spiral_bullets, self.radial_bullets, self.wave_bullets,
-                         self.boomerang_bullets, self.split_bullets, self.bouncing_bullets]:
-                for entry in coll:
-                    if isinstance(entry, tuple):
-                        bid = entry[0]
-                    else:
-                        bid = entry
-                    bullet_ids.append(bid)
-            for bid in bullet_ids:
-                coords = self.canvas.coords(bid)
-                if not coords:
-                    continue
-                if len(coords) >= 4:
-                    # derive center
-                    if len(coords) == 4:
-                        cx = (coords[0]+coords[2])/2
-                        cy = (coords[1]+coords[3])/2
-                    else:
-                        xs = coords[::2]; ys = coords[1::2]
-                        cx = sum(xs)/len(xs); cy = sum(ys)/len(ys)
-                    # spawn 4 shards
-                    for i in range(4):
-                        ang = (math.pi/2)*i + random.uniform(-0.3,0.3)
-                        spd = 3 + random.random()*2
-                        sx = cx; sy = cy
-                        size = 4
-                        pid = self.canvas.create_oval(sx-size/2, sy-size/2, sx+size/2, sy+size/2, fill="#ffffff", outline="")
-                        vx = _cos(ang)*spd
-                        vy = _sin(ang)*spd
-                        # Reuse freeze_particles list for lifecycle management (short life)
-                        self.freeze_particles.append((pid, vx, vy, 12))
+            self.particles.spawn('shatter', xs, ys, vxs, vys, life=0.6)
         except Exception:
             pass
 
@@ -1014,7 +1008,7 @@ class bullet_hell_game:
         """Spawn a rewind power-up (greenish hourglass/spiral)."""
         if self.game_over:
             return
-        x = random.randint(40, self.width - 40)
+        x = self.rng.randint(40, self.width - 40)
         y = 30
         # Simple hourglass polygon
         try:
@@ -1023,7 +1017,7 @@ class bullet_hell_game:
             rid = self.canvas.create_polygon(pts, fill="#66ff99", outline="#ffffff", width=2)
         except Exception:
             rid = self.canvas.create_oval(x-18, y-18, x+18, y+18, fill="#66ff99", outline="#ffffff")
-        self.rewind_powerups.append(rid)
+        self.rewind_powerups.append(self.layers.place(rid, 'actors'))
 
     def activate_rewind(self, duration=3.0):
         """Begin rewinding bullet positions for a short duration.
@@ -1037,13 +1031,13 @@ class bullet_hell_game:
         if not self._bullet_history:
             return
         self.rewind_active = True
-        self.rewind_end_time = time.time() + duration
+        self.rewind_end_time = self.game_time + duration
         self._rewind_pointer = len(self._bullet_history) - 1  # start from last frame
         if self.rewind_text:
             try: self.canvas.delete(self.rewind_text)
             except Exception: pass
         try:
-            self.rewind_text = self.canvas.create_text(self.width//2, self.height//2 - 80, text="REWIND", fill="#66ff99", font=("Arial", 56, "bold"))
+            self.rewind_text = self.layers.place(self.canvas.create_text(self.width//2, self.height//2 - 80, text="REWIND", fill="#66ff99", font=("Arial", 56, "bold")), 'overlay')
         except Exception:
             self.rewind_text = None
         if self._rewind_overlay:
@@ -1052,7 +1046,7 @@ class bullet_hell_game:
         try:
             self._rewind_overlay = self.canvas.create_rectangle(0,0,self.width,self.height, fill="#003322", outline="")
             self.canvas.itemconfig(self._rewind_overlay, stipple="gray25")
-            self.canvas.tag_lower(self._rewind_overlay)
+            self.layers.place(self._rewind_overlay, 'tint')
         except Exception:
             self._rewind_overlay = None
         # Remove queued text if present
@@ -1062,12 +1056,7 @@ class bullet_hell_game:
             self.rewind_pending_text = None
         # Count bullets at start for bonus
         try:
-            self._rewind_start_bullet_count = sum([
-                len(self.bullets), len(self.bullets2), len(self.triangle_bullets), len(self.diag_bullets), len(self.boss_bullets),
-                len(self.zigzag_bullets), len(self.fast_bullets), len(self.star_bullets), len(self.rect_bullets), len(self.egg_bullets),
-                len(self.quad_bullets), len(self.exploding_bullets), len(self.exploded_fragments), len(self.bouncing_bullets),
-                len(self.homing_bullets), len(self.spiral_bullets), len(self.radial_bullets), len(self.wave_bullets), len(self.boomerang_bullets), len(self.split_bullets)
-            ])
+            self._rewind_start_bullet_count = self.sim.count()
         except Exception:
             self._rewind_start_bullet_count = 0
         # Create vignette visual
@@ -1086,65 +1075,19 @@ class bullet_hell_game:
 
     def _capture_bullet_snapshot(self):
         """Record current bullet positions for rewind history."""
-        frame = {}
-        def capture_list(name, coll):
-            arr = []
-            for entry in coll:
-                if isinstance(entry, tuple):
-                    bid = entry[0]
-                else:
-                    bid = entry
-                coords = self.canvas.coords(bid)
-                if not coords:
-                    continue
-                arr.append((bid, tuple(coords)))
-            frame[name] = arr
-        capture_list('bullets', self.bullets)
-        capture_list('bullets2', self.bullets2)
-        capture_list('triangle_bullets', self.triangle_bullets)
-        capture_list('diag_bullets', self.diag_bullets)
-        capture_list('boss_bullets', self.boss_bullets)
-        capture_list('zigzag_bullets', self.zigzag_bullets)
-        capture_list('fast_bullets', self.fast_bullets)
-        capture_list('star_bullets', self.star_bullets)
-        capture_list('rect_bullets', self.rect_bullets)
-        capture_list('egg_bullets', self.egg_bullets)
-        capture_list('quad_bullets', self.quad_bullets)
-        capture_list('exploding_bullets', self.exploding_bullets)
-        capture_list('exploded_fragments', self.exploded_fragments)
-        capture_list('bouncing_bullets', self.bouncing_bullets)
-        capture_list('homing_bullets', self.homing_bullets)
-        capture_list('spiral_bullets', self.spiral_bullets)
-        capture_list('radial_bullets', self.radial_bullets)
-        capture_list('wave_bullets', self.wave_bullets)
-        capture_list('boomerang_bullets', self.boomerang_bullets)
-        capture_list('split_bullets', self.split_bullets)
-        capture_list('static_bullets', self.static_bullets)
-        # lasers & indicators not rewound (temporal hazards), skip
-        self._bullet_history.append(frame)
-        if len(self._bullet_history) > self._bullet_history_max:
-            self._bullet_history.pop(0)
+        # Lasers & indicators are recorded but not rewound (temporal hazards)
+        self.sim.record(self._bullet_history)
 
-    def _perform_rewind_step(self):
+    def _perform_rewind_step(self, dt):
         if self._rewind_pointer is None or not self._bullet_history:
             return
         # Spawn ghost traces
         self._spawn_rewind_ghosts()
         # apply snapshot
-        frame = self._bullet_history[self._rewind_pointer]
-        for key, arr in frame.items():
-            for tup in arr:
-                bid = tup[0]
-                coords = tup[1]
-                try:
-                    self.canvas.coords(bid, *coords)
-                except Exception:
-                    pass
+        self.sim.restore(self._bullet_history[self._rewind_pointer])
         self._rewind_pointer -= self._rewind_speed
         if self._rewind_pointer < 0:
             self._rewind_pointer = 0
-        # Update ghosts fade
-        self._update_rewind_ghosts()
 
     def _spawn_rewind_ghosts(self):
         if self._rewind_ghost_spawn_skip:
@@ -1152,61 +1095,17 @@ class bullet_hell_game:
             return
         else:
             self._rewind_ghost_spawn_skip = 1
-        ghost_color = '#66ffcc'
-        # Skip spawning if already above cap
-        if len(self._rewind_ghosts) >= self._rewind_ghost_cap:
+        # Ghost outlines of every bullet, under the player, up to the ghost cap
+        room = self._rewind_ghost_cap - self.particles.count('ghost')
+        boxes = self.sim.boxes()[:max(0, room)]
+        if not boxes:
             return
-        groups = [
-            self.bullets, self.bullets2, [b for b,_ in self.triangle_bullets],
-            [b for b,_ in self.diag_bullets], self.boss_bullets, self.zigzag_bullets,
-            self.fast_bullets, self.star_bullets, self.rect_bullets, self.egg_bullets,
-            self.quad_bullets, self.exploding_bullets, [b for b, *_ in self.homing_bullets],
-            [b for b,*_ in self.spiral_bullets], [b for b,*_ in self.radial_bullets],
-            self.wave_bullets, [b for b,*_ in self.boomerang_bullets], [b for b,*_ in self.split_bullets],
-            self.bouncing_bullets, [b for b,*_ in self.exploded_fragments]
-        ]
-        for grp in groups:
-            for bid in grp:
-                try:
-                    c = self.canvas.coords(bid)
-                    if len(c) < 4:
-                        continue
-                    if len(c) == 4:
-                        ghost_id = self.canvas.create_rectangle(c[0],c[1],c[2],c[3], outline=ghost_color, width=1)
-                    else:
-                        xs=c[0::2]; ys=c[1::2]
-                        ghost_id = self.canvas.create_polygon(min(xs),min(ys),max(xs),min(ys),max(xs),max(ys),min(xs),max(ys), outline=ghost_color, fill="", width=1)
-                    self.canvas.tag_lower(ghost_id, self.player)
-                    self._rewind_ghosts.append((ghost_id, self._rewind_ghost_life))
-                    if len(self._rewind_ghosts) >= self._rewind_ghost_cap:
-                        return
-                except Exception:
-                    pass
-
-    def _update_rewind_ghosts(self):
-        new=[]
-        for gid, life in self._rewind_ghosts:
-            life -=1
-            if life<=0:
-                try: self.canvas.delete(gid)
-                except Exception: pass
-                continue
-            try:
-                frac=life/self._rewind_ghost_life
-                r=int(0x66*frac); g=int(0xff*frac); b=int(0xcc*frac)
-                self.canvas.itemconfig(gid, outline=f"#{r:02x}{g:02x}{b:02x}")
-            except Exception:
-                pass
-            new.append((gid,life))
-        self._rewind_ghosts=new
-        # light trimming if somehow exceeded cap
-        if len(self._rewind_ghosts) > self._rewind_ghost_cap:
-            overflow = len(self._rewind_ghosts) - self._rewind_ghost_cap
-            for i in range(overflow):
-                gid, _ = self._rewind_ghosts[i]
-                try: self.canvas.delete(gid)
-                except Exception: pass
-            self._rewind_ghosts = self._rewind_ghosts[overflow:]
+        try:
+            self.particles.spawn('ghost', [(b[0] + b[2]) / 2 for b in boxes], [(b[1] + b[3]) / 2 for b in boxes],
+                                 life=self._rewind_ghost_life,
+                                 w=[b[2] - b[0] for b in boxes], h=[b[3] - b[1] for b in boxes])
+        except Exception:
+            pass
 
     # --- Rewind vignette helpers ---
     def _create_rewind_vignette(self):
@@ -1228,7 +1127,7 @@ class bullet_hell_game:
                 oval = self.canvas.create_oval(cx-r, cy-r, cx+r, cy+r, outline="", fill=color)
                 try: self.canvas.itemconfig(oval, stipple="gray25")
                 except Exception: pass
-                self.canvas.tag_lower(oval)
+                self.layers.place(oval, 'tint')
                 self._rewind_vignette_ids.append(oval)
         except Exception:
             self._rewind_vignette_ids = []
@@ -1244,7 +1143,7 @@ class bullet_hell_game:
         """Spawn a shield power-up (purple hexagon) descending from top."""
         if self.game_over:
             return
-        x = random.randint(40, self.width - 40)
+        x = self.rng.randint(40, self.width - 40)
         y = 30
         # Create hexagon shape for shield
         radius = 18
@@ -1258,7 +1157,7 @@ class bullet_hell_game:
             s_id = self.canvas.create_polygon(pts, fill="#9966ff", outline="#ffffff", width=2)
         except Exception:
             s_id = self.canvas.create_oval(x-radius, y-radius, x+radius, y+radius, fill="#9966ff", outline="#ffffff")
-        self.shield_powerups.append(s_id)
+        self.shield_powerups.append(self.layers.place(s_id, 'actors'))
 
     def activate_shield(self):
         """Activate shield - gives player one extra hit point that absorbs damage."""
@@ -1278,6 +1177,7 @@ class bullet_hell_game:
                 cx + shield_radius, cy + shield_radius,
                 outline="#9966ff", width=3
             )
+            self.layers.place(self.shield_visual, 'effects')
         except Exception:
             self.shield_visual = None
         
@@ -1287,8 +1187,9 @@ class bullet_hell_game:
                 self.width//2, self.height//2 + 60,
                 text="SHIELD ACTIVE", fill="#9966ff", font=("Arial", 32, "bold")
             )
+            self.layers.place(self.shield_text, 'overlay')
             # Auto-remove text after 2 seconds
-            self.shield_text_remove_time = time.time() + 2.0
+            self.shield_text_remove_time = self.game_time + 2.0
         except Exception:
             self.shield_text = None
         
@@ -1308,22 +1209,15 @@ class bullet_hell_game:
 
     def _spawn_shield_particles(self, cx, cy):
         """Spawn particle burst when shield activates."""
+        # Radial burst
+        num_particles = 24
+        angles = [(math.pi * 2 / num_particles) * i for i in range(num_particles)]
+        speeds = [self.fx_rng.uniform(60, 120) for _ in angles]
         try:
-            # Spawn radial burst of particles
-            num_particles = 24
-            for i in range(num_particles):
-                ang = (math.pi * 2 / num_particles) * i
-                speed = random.uniform(3, 6)
-                vx = _cos(ang) * speed
-                vy = _sin(ang) * speed
-                size = random.randint(3, 6)
-                pid = self.canvas.create_oval(
-                    cx - size/2, cy - size/2,
-                    cx + size/2, cy + size/2,
-                    fill="#9966ff", outline=""
-                )
-                life = random.randint(15, 25)
-                self.shield_particles.append((pid, cx, cy, vx, vy, life))
+            self.particles.spawn('shield', cx, cy,
+                                 [_cos(a) * v for a, v in zip(angles, speeds)],
+                                 [_sin(a) * v for a, v in zip(angles, speeds)],
+                                 [self.fx_rng.uniform(0.75, 1.25) for _ in angles])
         except Exception:
             pass
 
@@ -1338,7 +1232,7 @@ class bullet_hell_game:
             cy = (py1 + py2) / 2
             
             # Pulse effect
-            pulse = (_sin(time.time() * 4) + 1) / 2  # 0..1
+            pulse = (_sin(self.game_time * 4) + 1) / 2  # 0..1
             shield_radius = 35 + pulse * 5
             
             self.canvas.coords(
@@ -1378,7 +1272,7 @@ class bullet_hell_game:
         """Spawn a slow-motion power-up (orange clock) descending from top."""
         if self.game_over:
             return
-        x = random.randint(40, self.width - 40)
+        x = self.rng.randint(40, self.width - 40)
         y = 30
         # Create clock shape (circle with clock hands)
         radius = 18
@@ -1394,12 +1288,16 @@ class bullet_hell_game:
             self.slowmo_powerups.append((sm_id, hand1, hand2))
         except Exception:
             sm_id = self.canvas.create_oval(x-radius, y-radius, x+radius, y+radius, fill="#ff9933", outline="#ffffff")
+            hand1 = hand2 = None
             self.slowmo_powerups.append((sm_id, None, None))
+        for item in (sm_id, hand1, hand2):
+            if item:
+                self.layers.place(item, 'actors')
 
     def activate_slowmo(self, duration=4.0):
         """Activate slow-motion effect - all bullets move at reduced speed."""
         self.slowmo_active = True
-        self.slowmo_end_time = time.time() + duration
+        self.slowmo_end_time = self.game_time + duration
         self.slowmo_factor = 0.35  # Bullets move at 35% speed
         
         # Create visual overlay
@@ -1409,7 +1307,7 @@ class bullet_hell_game:
                 fill="#ff9933", outline=""
             )
             self.canvas.itemconfig(self.slowmo_overlay, stipple="gray25")
-            self.canvas.tag_lower(self.slowmo_overlay)
+            self.layers.place(self.slowmo_overlay, 'tint')
         except Exception:
             self.slowmo_overlay = None
         
@@ -1420,6 +1318,7 @@ class bullet_hell_game:
                 text=f"SLOW MOTION {duration:.1f}s",
                 fill="#ff9933", font=("Arial", 42, "bold")
             )
+            self.layers.place(self.slowmo_text, 'overlay')
         except Exception:
             self.slowmo_text = None
         
@@ -1447,23 +1346,15 @@ class bullet_hell_game:
 
     def _spawn_slowmo_particles(self):
         """Spawn time-warp particles when slow-motion activates."""
+        # Slowly drifting particles at random positions
+        num_particles = 40
         try:
-            # Spawn particles at random positions
-            num_particles = 40
-            for _ in range(num_particles):
-                x = random.randint(0, self.width)
-                y = random.randint(0, self.height)
-                size = random.randint(2, 5)
-                pid = self.canvas.create_oval(
-                    x - size/2, y - size/2,
-                    x + size/2, y + size/2,
-                    fill="#ff9933", outline=""
-                )
-                # Slow drift
-                vx = random.uniform(-0.5, 0.5)
-                vy = random.uniform(-1, 1)
-                life = random.randint(20, 40)
-                self.slowmo_particles.append((pid, x, y, vx, vy, life))
+            self.particles.spawn('slowmo',
+                                 [self.fx_rng.randint(0, self.width) for _ in range(num_particles)],
+                                 [self.fx_rng.randint(0, self.height) for _ in range(num_particles)],
+                                 [self.fx_rng.uniform(-10, 10) for _ in range(num_particles)],
+                                 [self.fx_rng.uniform(-20, 20) for _ in range(num_particles)],
+                                 [self.fx_rng.uniform(1.0, 2.0) for _ in range(num_particles)])
         except Exception:
             pass
 
@@ -1584,6 +1475,15 @@ class bullet_hell_game:
         self.touch_start_x = None
         self.touch_start_y = None
     
+    def _analog_step(self):
+        """Pixels per sim tick for mouse, touch and gamepad movement.
+
+        player_speed is per legacy 20 Hz frame (CHANCE_PERIOD), so the step is
+        scaled by the tick length and the distance covered per second does not
+        depend on the sim rate.
+        """
+        return self.player_speed * (self.loop_clock.sim_dt / CHANCE_PERIOD) * (0.5 if self.focus_active else 1.0)
+
     def update_mouse_movement(self):
         """Smoothly move player towards mouse/touch target."""
         if not self.mouse_move_active or self.mouse_target_x is None:
@@ -1604,8 +1504,8 @@ class bullet_hell_game:
                 self.mouse_move_active = False
                 return
             
-            # Normalize and apply speed
-            speed = self.player_speed * (0.5 if self.focus_active else 1.0)
+            # Normalize and apply speed, without overshooting the target
+            speed = min(self._analog_step(), distance)
             if distance > 0:
                 dx = (dx / distance) * speed
                 dy = (dy / distance) * speed
@@ -1637,7 +1537,7 @@ class bullet_hell_game:
                 
                 # Apply movement if there's input
                 if axis_x != 0 or axis_y != 0:
-                    speed = self.player_speed * (0.5 if self.focus_active else 1.0)
+                    speed = self._analog_step()
                     dx = axis_x * speed
                     dy = axis_y * speed
                     self.apply_player_move(dx, dy)
@@ -1680,6 +1580,8 @@ class bullet_hell_game:
         # Check cooldown
         if self.shot_cooldown > 0:
             return
+        if not self._take_input('shoot'):
+            return
         
         # Get player position
         try:
@@ -1696,6 +1598,7 @@ class bullet_hell_game:
             pcx + shot_size // 2, pcy + shot_size // 2,
             fill="#00ffff", outline="#ffffff", width=2
         )
+        self.layers.place(shot, 'bullets')
         self.player_shots.append((shot, pcx, pcy))
         
         # Set cooldown
@@ -1717,24 +1620,25 @@ class bullet_hell_game:
             self.boss_y + self.boss_height // 2,
             fill="#ff00ff", outline="#ffffff", width=4
         )
+        self.layers.place(self.boss_entity, 'actors')
     
-    def update_boss(self):
+    def update_boss(self, dt):
         """Update boss movement and check collisions."""
         if not self.boss_entity:
             return
         
-        # Flash effect when hit
+        # Flash effect when hit (alternates every 0.1s)
         if self.boss_flash_timer > 0:
-            self.boss_flash_timer -= 1
-            flash_color = "#ffffff" if self.boss_flash_timer % 4 < 2 else "#ff00ff"
+            self.boss_flash_timer -= dt
+            flash_color = "#ffffff" if round(self.boss_flash_timer * 20) % 4 < 2 else "#ff00ff"
             try:
                 self.canvas.itemconfig(self.boss_entity, fill=flash_color)
             except Exception:
                 pass
         
         # Move boss
-        self.boss_x += self.boss_vx
-        self.boss_y += self.boss_vy
+        self.boss_x += self.boss_vx * dt
+        self.boss_y += self.boss_vy * dt
         
         # Bounce off walls
         if self.boss_x - self.boss_width // 2 < 0 or self.boss_x + self.boss_width // 2 > self.width:
@@ -1775,21 +1679,21 @@ class bullet_hell_game:
                         push_x = (px1 + px2) / 2 - self.boss_x
                         push_y = (py1 + py2) / 2 - self.boss_y
                         dist = _hypot(push_x, push_y) or 1
-                        self.apply_player_move(push_x / dist * 20, push_y / dist * 20)
+                        self._shift_player(push_x / dist * 20, push_y / dist * 20)
         except Exception:
             pass
     
-    def update_player_shots(self):
+    def update_player_shots(self, dt):
         """Update player shots and check for boss hits."""
         # Update cooldown
         if self.shot_cooldown > 0:
-            self.shot_cooldown -= 0.05  # Frame time
+            self.shot_cooldown -= dt
         
         new_shots = []
         for shot_id, sx, sy in self.player_shots:
             # Move shot upward
             try:
-                self.canvas.move(shot_id, 0, -self.shot_speed)
+                self.canvas.move(shot_id, 0, -self.shot_speed * dt)
                 coords = self.canvas.coords(shot_id)
                 if not coords or coords[1] < -20:
                     # Shot went off screen
@@ -1810,7 +1714,7 @@ class bullet_hell_game:
                 if bx1 < shot_x < bx2 and by1 < shot_y < by2:
                     # Hit the boss!
                     self.boss_health_display += 1
-                    self.boss_flash_timer = 8
+                    self.boss_flash_timer = 0.4  # seconds
                     self.score += 5  # Add score for hitting boss
                     
                     # Delete the shot
@@ -1839,13 +1743,13 @@ class bullet_hell_game:
         if not available:
             return
         
-        item_name = random.choice(available)
+        item_name = self.rng.choice(available)
         item_index = self.collectable_types.index(item_name)
         color = self.collectable_colors[item_index]
         
         # Random position in top half of screen
-        x = random.randint(50, self.width - 50)
-        y = random.randint(80, self.height // 2 - 50)
+        x = self.rng.randint(50, self.width - 50)
+        y = self.rng.randint(80, self.height // 2 - 50)
         
         # Create different shapes for variety
         shape_type = item_index % 5
@@ -1884,15 +1788,17 @@ class bullet_hell_game:
             font=("Arial", 8, "bold"), tags="collectable"
         )
         
+        self.layers.place(item_id, 'actors')
+        self.layers.place(text_id, 'actors')
         self.collectables.append((item_id, text_id, item_name, x, y))
     
     def update_collectables(self):
         """Update collectables and check for collection."""
         # Spawn new collectable if it's time
-        if time.time() >= self.next_collectable_spawn and len(self.collected_items) < self.total_collectables:
+        if self.game_time >= self.next_collectable_spawn and len(self.collected_items) < self.total_collectables:
             if len(self.collectables) < 5:  # Max 5 on screen at once
                 self.spawn_collectable()
-                self.next_collectable_spawn = time.time() + self.collectable_spawn_interval
+                self.next_collectable_spawn = self.game_time + self.collectable_spawn_interval
         
         # Check for collection
         try:
@@ -1900,7 +1806,7 @@ class bullet_hell_game:
             pcx = (px1 + px2) / 2
             pcy = (py1 + py2) / 2
             
-            for item_id, text_id, item_name, x, y in self.collectables[:]:
+            for i, (item_id, text_id, item_name, x, y) in enumerate(self.collectables):
                 # Check distance
                 dist = _hypot(pcx - x, pcy - y)
                 if dist < 30:  # Collection radius
@@ -1915,7 +1821,8 @@ class bullet_hell_game:
                     except Exception:
                         pass
                     
-                    self.collectables.remove((item_id, text_id, item_name, x, y))
+                    # Safe inside the loop: it breaks right after collecting
+                    del self.collectables[i]
                     
                     # Show collection message
                     try:
@@ -1934,18 +1841,13 @@ class bullet_hell_game:
                     break  # Only collect one per frame
         except Exception:
             pass
-        
-        # Lift collectables to be visible
-        for item_id, text_id, _, _, _ in self.collectables:
-            try:
-                self.canvas.lift(item_id)
-                self.canvas.lift(text_id)
-            except Exception:
-                pass
+
     
     def win_game(self):
         """Player collected all items and won!"""
         self.game_over = True
+        self._finish_replay()
+        self._finish_telemetry('win')
         
         # Stop game music
         try:
@@ -1967,11 +1869,11 @@ class bullet_hell_game:
         
         # Victory stars/sparkles
         for _ in range(100):
-            x = random.randint(0, self.width)
-            y = random.randint(0, self.height)
-            size = random.randint(2, 8)
-            brightness = random.randint(200, 255)
-            color = random.choice([f"#{brightness:02x}{brightness:02x}00",
+            x = self.fx_rng.randint(0, self.width)
+            y = self.fx_rng.randint(0, self.height)
+            size = self.fx_rng.randint(2, 8)
+            brightness = self.fx_rng.randint(200, 255)
+            color = self.fx_rng.choice([f"#{brightness:02x}{brightness:02x}00",
                                   f"#{brightness:02x}00{brightness:02x}",
                                   f"#00{brightness:02x}{brightness:02x}"])
             self.canvas.create_oval(x-size//2, y-size//2, x+size//2, y+size//2, fill=color, outline="")
@@ -2088,7 +1990,6 @@ class bullet_hell_game:
             return
         self.paused = not self.paused
         if self.paused:
-            self.pause_start_time = time.time()
             self.show_pause_menu()
             # Play pause music
             try:
@@ -2101,10 +2002,6 @@ class bullet_hell_game:
                 print("Could not play pause music:", e)
         else:
             self.hide_pause_menu()
-            # Add paused duration to total
-            if self.pause_start_time:
-                self.paused_time_total += time.time() - self.pause_start_time
-                self.pause_start_time = None
             # Resume game music
             try:
                 if self.current_music_state != 'game':
@@ -2116,6 +2013,9 @@ class bullet_hell_game:
                 print("Could not resume game music:", e)
         # Resume update loop if unpaused
         if not self.paused:
+            # Time spent paused is not owed to the simulation, nor a slow frame
+            self.loop_clock.reset()
+            self._last_frame_time_stamp = time.perf_counter()
             self.update_game()
     
     def show_pause_menu(self):
@@ -2300,6 +2200,9 @@ class bullet_hell_game:
     
     def quit_to_menu(self):
         """Quit to main menu."""
+        self._finish_replay()
+        self._finish_telemetry('quit')
+        self._finish_stress()
         self.paused = False
         self.game_started = False
         self.hide_pause_menu()
@@ -2307,34 +2210,29 @@ class bullet_hell_game:
 
     def shoot_bullet(self):
         if not self.game_over:
-            x = random.randint(0, self.width-20)
-            bullet = self.canvas.create_oval(x, 0, x + 20, 20, fill="red")
-            self.bullets.append(bullet)
+            x = self.rng.randint(0, self.width-20)
+            self.sim.spawn('vertical', x, 0, 20, 20, vy=140)
 
     def shoot_egg_bullet(self):
         if not self.game_over:
-            x = random.randint(0, self.width-20)
-            bullet = self.canvas.create_oval(x, 0, x + 20, 40, fill="tan")
-            self.egg_bullets.append(bullet)
+            x = self.rng.randint(0, self.width-20)
+            self.sim.spawn('egg', x, 0, 20, 40, vy=120)
 
     def shoot_bullet2(self):
         if not self.game_over:
-            y = random.randint(0, self.height-20)
-            bullet2 = self.canvas.create_oval(0, y, 20, y + 20, fill="yellow")
-            self.bullets2.append(bullet2)
+            y = self.rng.randint(0, self.height-20)
+            self.sim.spawn('horizontal', 0, y, 20, 20, vx=140)
 
     def shoot_diag_bullet(self):
         if not self.game_over:
-            x = random.randint(0, self.width-20)
-            direction = random.choice([1, -1])  # 1 for right-down, -1 for left-down
-            dbullet = self.canvas.create_oval(x, 0, x + 20, 20, fill="green")
-            self.diag_bullets.append((dbullet, direction))
+            x = self.rng.randint(0, self.width-20)
+            direction = self.rng.choice([1, -1])  # 1 for right-down, -1 for left-down
+            self.sim.spawn('diag', x, 0, 20, 20, vx=100*direction, vy=100)
 
     def shoot_boss_bullet(self):
         if not self.game_over:
-            x = random.randint(self.width//4, self.width*3//4)
-            bullet = self.canvas.create_oval(x, 0, x + 40, 40, fill="purple")
-            self.boss_bullets.append(bullet)
+            x = self.rng.randint(self.width//4, self.width*3//4)
+            self.sim.spawn('boss', x, 0, 40, 40, vy=200)
 
     def show_graze_effect(self):
         # Remove previous effect if present
@@ -2348,71 +2246,8 @@ class bullet_hell_game:
             cx + self.grazing_radius, cy + self.grazing_radius,
             outline="white", dash=(5, 5), width=2
         )
-        self.graze_effect_timer = 4  # Number of update cycles to show (200ms)
-
-    def check_graze(self, bullet, player_coords=None):
-        """Returns True if bullet grazes player (close but not colliding).
-        player_coords: Optional cached (px1, py1, px2, py2) to avoid repeated canvas.coords calls
-        """
-        bullet_coords = self.canvas.coords(bullet)
-        if len(bullet_coords) < 4:
-            return False  # Bullet was deleted or invalid
-        # Use cached player coords if provided
-        if player_coords:
-            px1, py1, px2, py2 = player_coords
-        else:
-            px1, py1, px2, py2 = self.canvas.coords(self.player)
-        cx = (px1 + px2) / 2
-        cy = (py1 + py2) / 2
-        # Handle polygons (coords > 4)
-        if len(bullet_coords) > 4:
-            xs = bullet_coords[::2]
-            ys = bullet_coords[1::2]
-            bx = sum(xs) / len(xs)
-            by = sum(ys) / len(ys)
-        else:
-            bx = (bullet_coords[0] + bullet_coords[2]) / 2
-            by = (bullet_coords[1] + bullet_coords[3]) / 2
-        dist = ((cx - bx) ** 2 + (cy - by) ** 2) ** 0.5
-        # Not colliding, but within grazing radius
-        if dist < self.grazing_radius + 10 and not self.check_collision(bullet, player_coords):
-            return True
-        return False
-
-    def check_collision(self, bullet, player_coords=None):
-        """Axis-aligned hitbox collision between player rectangle and a bullet shape.
-        Supports ovals/rectangles (4 coords) and polygons (>=6 coords). Returns True on hit.
-        player_coords: Optional cached (px1, py1, px2, py2) to avoid repeated canvas.coords calls
-        """
-        if self.practice_mode or self.game_over:
-            return False
-        # brief invulnerability after static trap escape
-        if self.static_trap_invuln_end and time.time() < self.static_trap_invuln_end:
-            return False
-        try:
-            b = self.canvas.coords(bullet)
-            if not b:
-                return False
-            # Player rectangle (use cached if provided, else fetch)
-            if player_coords:
-                px1, py1, px2, py2 = player_coords
-            else:
-                px1, py1, px2, py2 = self.canvas.coords(self.player)
-            # Bullet bounding box
-            if len(b) == 4:
-                bx1, by1, bx2, by2 = b
-            else:
-                xs = b[::2]
-                ys = b[1::2]
-                bx1, bx2 = min(xs), max(xs)
-                by1, by2 = min(ys), max(ys)
-            # AABB overlap
-            if px1 < bx2 and px2 > bx1 and py1 < by2 and py2 > by1:
-                self.handle_player_hit()
-                return True
-        except Exception:
-            return False
-        return False
+        self.layers.place(self.graze_effect_id, 'effects')
+        self.graze_effect_timer = 0.2  # seconds to show
 
     def handle_player_hit(self):
         """Process a player hit: decrement life (if multiple), or trigger game over animation."""
@@ -2445,12 +2280,14 @@ class bullet_hell_game:
             # Pick a random game over message once
             try:
                 if self.game_over_messages:
-                    self.selected_game_over_message = random.choice(self.game_over_messages)
+                    self.selected_game_over_message = self.fx_rng.choice(self.game_over_messages)
                 else:
                     self.selected_game_over_message = None
             except Exception:
                 self.selected_game_over_message = None
             self.game_over = True
+            self._finish_replay()
+            self._finish_telemetry('game_over')
             # Start game over animation if available
             try:
                 pygame.mixer.music.stop()
@@ -2474,10 +2311,12 @@ class bullet_hell_game:
         try:
             if getattr(self, 'selected_game_over_message', None) is None and getattr(self, 'game_over_messages', None):
                 if self.game_over_messages:
-                    self.selected_game_over_message = random.choice(self.game_over_messages)
+                    self.selected_game_over_message = self.fx_rng.choice(self.game_over_messages)
         except Exception:
             pass
         self.game_over = True
+        self._finish_replay()
+        self._finish_telemetry('game_over')
         try:
             pygame.mixer.music.stop()
             pygame.mixer.music.unload()
@@ -2508,72 +2347,238 @@ class bullet_hell_game:
             return
         # If static trap active, update trap sequence and skip rest of gameplay movement/spawn
         if self.static_trap_active:
-            self._update_static_trap()
-            self.root.after(50, self.update_game)
+            trapped = self.loop_clock.frame_time()
+            self._update_static_trap(trapped)
+            if self.telemetry is not None:
+                self.telemetry.add_state('static_trap', trapped)
+            # Gameplay time does not pass while trapped
+            self.loop_clock.hold()
+            self._last_frame_time_stamp = time.perf_counter()
+            self.root.after(self.loop_clock.frame_delay(), self.update_game)
             return
+        profiler = self.profiler
+        profiler.start()
         # Frame timing capture for Debug HUD
         try:
             now_perf = time.perf_counter()
             if hasattr(self, '_last_frame_time_stamp'):
                 dt_ms = (now_perf - self._last_frame_time_stamp) * 1000.0
                 self._frame_time_buffer.append(dt_ms)
+                if self.telemetry is not None:
+                    self.telemetry.add_frame(dt_ms)
+                if self.settings.get('auto_quality', True) and self.quality.sample(dt_ms):
+                    self._apply_quality_tier()
             self._last_frame_time_stamp = now_perf
         except Exception:
             pass
-        # Update focus pulse cooldown timer (wall time based)
+        # Fixed timestep: run every sim tick that real time since the last wake-up
+        # covers, so a slow frame does not slow the game down
+        clock = self.loop_clock
+        for _ in range(clock.advance()):
+            if self.replay is not None:
+                self._replay_step()
+            # Update input methods
+            self.update_mouse_movement()
+            self.update_controller_input()
+            profiler.lap('input')
+            tick_start = time.perf_counter()
+            self._simulation_tick(clock.sim_dt)
+            telemetry = self.telemetry
+            if telemetry is not None:
+                telemetry.add_tick((time.perf_counter() - tick_start) * 1000.0, clock.sim_dt, self.sim.count(),
+                                   (self.freeze_active, self.rewind_active, self.slowmo_active,
+                                    self.shield_active, self.focus_active))
+                if telemetry.wants_items():
+                    telemetry.sample_items(len(self.canvas.find_all()))
+            if self.game_over or self.paused or self.static_trap_active:
+                break
+        if self.game_over:
+            return
+        # Redraw at the render rate, independent of the tick rate
+        frame_dt = clock.render_due()
+        if frame_dt is not None:
+            self._render_frame(frame_dt)
+            # Update Debug HUD late so counts reflect this frame's state
+            if self.debug_hud_enabled:
+                self._update_debug_hud()
+                profiler.lap('debug')
+        profiler.end_frame(self.game_time)
+        if self.stress is not None:
+            self._sample_stress((time.perf_counter() - self._last_frame_time_stamp) * 1000.0)
+        self.root.after(clock.next_delay(), self.update_game)
+
+    # ---------------- Replays ----------------
+    def _take_input(self, kind, *args):
+        """Record a player input; while a replay plays, only its own inputs get through."""
+        replay = self.replay
+        if replay is None:
+            return True
+        if replay.playing:
+            return self._applying_replay
+        replay.record(self.sim_ticks, kind, args)
+        return True
+
+    def _replay_step(self):
+        """Check the run against the replay and apply its inputs due before the next tick."""
+        replay = self.replay
+        tick = self.sim_ticks
+        if tick % CHECK_EVERY == 0 and tick > self._replay_checked:
+            self._replay_checked = tick
+            if not replay.check(tick, self._state_digest()):
+                print(f"Replay diverged at tick {tick}")
+        if not replay.playing:
+            return
+        self._applying_replay = True
+        try:
+            for _, kind, args in replay.inputs_at(tick, self._replay_input_ready):
+                getattr(self, self.REPLAY_INPUTS[kind])(*args)
+        finally:
+            self._applying_replay = False
+        if replay.finished(tick):
+            # The recording stopped here; play goes on live
+            self._finish_replay()
+
+    def _replay_input_ready(self, event):
+        """Trap mashes wait until the trap has run as long as when they were recorded."""
+        _, kind, args = event
+        if kind != 'trap' or not self.static_trap_active or len(args) < 2:
+            return True
+        return args[1] <= self.static_trap_elapsed
+
+    def _state_digest(self):
+        try:
+            player = self.canvas.coords(self.player)
+        except Exception:
+            player = ()
+        return zlib.crc32(repr((self.score, self.lives, player)).encode(), self.sim.digest())
+
+    def _finish_replay(self):
+        """Save the run being recorded, or report how the played-back run went."""
+        replay, self.replay = self.replay, None
+        if replay is None:
+            return
+        matched = replay.check(self.sim_ticks, self._state_digest())
+        if replay.playing:
+            if replay.diverged is None:
+                print(f"Replay finished: {self.sim_ticks} ticks, state matched")
+            else:
+                print(f"Replay diverged from tick {replay.diverged}")
+            return
+        try:
+            replay.save(self.record_path)
+            print(f"Replay of seed {replay.seed} saved to {self.record_path}")
+        except Exception as e:
+            print("Could not save replay:", e)
+
+    # ---------------- Stress ramp ----------------
+    def toggle_stress_ramp(self, event=None):
+        """Start or stop ramping spawn rates; practice mode only, so the player cannot die."""
+        if not self.practice_mode or self.game_over:
+            return
+        if self.stress is None:
+            self.stress = StressRamp(self.loop_clock.sim_dt * 1000.0, start=self.game_time)
+        else:
+            self._finish_stress()
+
+    def _sample_stress(self, cost_ms):
+        stress = self.stress
+        stress.sample(self.game_time, self.sim.count(), cost_ms)
+        if stress.blown:
+            self._finish_stress()
+
+    def _finish_stress(self):
+        """Stop the stress ramp and write its table to the stress log."""
+        stress, self.stress = self.stress, None
+        if stress is None or not stress.rows:
+            return
+        path = self.settings['stress_log']
+        try:
+            stress.write_csv(path)
+            if stress.knee is not None:
+                print(f"Stress ramp blew the {stress.budget_ms:.0f}ms budget at {stress.knee[3]} bullets; table in {path}")
+            else:
+                print(f"Stress ramp stopped; table in {path}")
+        except Exception as e:
+            print("Could not write stress log:", e)
+
+    def _finish_telemetry(self, ended):
+        """Write the performance report of the run that just ended."""
+        telemetry, self.telemetry = self.telemetry, None
+        directory = self.settings.get('telemetry_dir')
+        if telemetry is None or not telemetry.ticks.total or not directory:
+            return
+        try:
+            path = telemetry.write(directory, ended, score=self.score,
+                                   quality=self.quality.current.name, practice=self.practice_mode)
+            print(f"Session telemetry saved to {path}")
+        except Exception as e:
+            print("Could not write session telemetry:", e)
+
+    def close_window(self):
+        """Window close: keep the run being recorded, then quit."""
+        self._finish_replay()
+        self._finish_telemetry('quit')
+        self._finish_stress()
+        self.profiler.close_csv()
+        self.root.destroy()
+
+    def _roll_chance(self, one_in, dt):
+        """Roll odds of 1 in `one_in` per CHANCE_PERIOD, scaled to a tick of dt seconds."""
+        return self.rng.randint(1, max(1, round(one_in * CHANCE_PERIOD / dt))) == 1
+
+    def _roll_count(self, one_in, dt, boost):
+        """How many to spawn this tick for odds of 1 in `one_in` per CHANCE_PERIOD made `boost` times likelier."""
+        expected = boost * dt / (one_in * CHANCE_PERIOD)
+        whole = int(expected)
+        return whole + (self.rng.random() < expected - whole)
+
+    def _update_falling_powerups(self, entries, fall, px1, py1, px2, py2, activate):
+        """Move power-ups down, collect the ones touching the player and drop off-screen ones.
+
+        An entry is a canvas item id or a tuple whose first item is the body and
+        whose other items (clock hands) move with it. Returns the entries still
+        falling.
+        """
+        kept = []
+        for entry in entries:
+            items = entry if isinstance(entry, tuple) else (entry,)
+            try:
+                for item in items:
+                    if item:
+                        self.canvas.move(item, 0, fall)
+                x1, y1, x2, y2 = self.canvas.coords(items[0])
+                collected = not (x2 < px1 or x1 > px2 or y2 < py1 or y1 > py2)
+                if collected or y1 > self.height:
+                    if collected:
+                        activate()
+                    for item in items:
+                        if item:
+                            try: self.canvas.delete(item)
+                            except Exception: pass
+                    continue
+                kept.append(entry)
+            except Exception:
+                pass
+        return kept
+
+    def _simulation_tick(self, dt):
+        """Advance gameplay by one fixed step of dt seconds."""
+        profiler = self.profiler
+        self.sim_ticks += 1
+        self.game_time += dt
+        # Update focus pulse cooldown timer
         if self.focus_pulse_cooldown > 0:
-            self.focus_pulse_cooldown -= 0.05  # approx frame duration
+            self.focus_pulse_cooldown -= dt
             if self.focus_pulse_cooldown < 0:
                 self.focus_pulse_cooldown = 0
-        # Update focus charge accumulation & visuals
-        self._update_focus_charge()
-        self._update_focus_visuals()
-        
-        # Update input methods
-        self.update_mouse_movement()
-        self.update_controller_input()
+        # Update focus charge accumulation
+        self._update_focus_charge(dt)
         
         # Update player shots and boss
-        self.update_player_shots()
-        self.update_boss()
+        self.update_player_shots(dt)
+        self.update_boss(dt)
         self.update_collectables()
         
-    # Background animation
-        self.update_background()
-    # Animate player decorative sprite
-        self.animate_player_sprite()
-        self.canvas.lift(self.dialog)
-        self.canvas.lift(self.scorecount)
-        self.canvas.lift(self.timecount)
-        if hasattr(self, 'next_unlock_text'):
-            self.canvas.lift(self.next_unlock_text)
-        # Update and lift boss damage counter
-        if hasattr(self, 'boss_damage_text'):
-            try:
-                self.canvas.itemconfig(self.boss_damage_text, text=f"Boss Hits: {self.boss_health_display}")
-                self.canvas.lift(self.boss_damage_text)
-            except Exception:
-                pass
-        # Update and lift collectable counter
-        if hasattr(self, 'collectable_display_text'):
-            try:
-                self.canvas.itemconfig(self.collectable_display_text, text=f"Items: {len(self.collected_items)}/{self.total_collectables}")
-                self.canvas.lift(self.collectable_display_text)
-            except Exception:
-                pass
-        # Lift boss to be visible
-        if hasattr(self, 'boss_entity') and self.boss_entity:
-            try:
-                self.canvas.lift(self.boss_entity)
-            except Exception:
-                pass
-        # Ensure hearts appear on top of bullets
-        if getattr(self, 'health_icon_items', None):
-            for hid in self.health_icon_items:
-                try:
-                    self.canvas.lift(hid)
-                except Exception:
-                    pass
         # Move graze effect to follow player if active
         if self.graze_effect_id:
             px1, py1, px2, py2 = self.canvas.coords(self.player)
@@ -2584,24 +2589,13 @@ class bullet_hell_game:
                 cx - self.grazing_radius, cy - self.grazing_radius,
                 cx + self.grazing_radius, cy + self.grazing_radius
             )
-            self.graze_effect_timer -= 1
+            self.graze_effect_timer -= dt
             if self.graze_effect_timer <= 0:
                 self.canvas.delete(self.graze_effect_id)
                 self.graze_effect_id = None
-        # Increase difficulty every 60 seconds
-        now = time.time()
-    # Difficulty scaling removed
-        if now - self.lastdial > 10:
-            self.get_dialog_string()
-            self.lastdial = now
-            self.canvas.itemconfig(self.dialog, text=self.dial)
-        # Lore rotation
-        if getattr(self, 'lore_text', None) is not None and now - getattr(self, 'lore_last_change', 0) >= getattr(self, 'lore_interval', 8):
-            self.update_lore_line()
-        # Calculate time survived, pausable
-        time_survived = int(now - self.timee - self.paused_time_total)
-        self.canvas.itemconfig(self.scorecount, text=f"Score: {self.score}")
-        self.canvas.itemconfig(self.timecount, text=f"Time: {time_survived}")
+        profiler.lap('player')
+        now = self.game_time
+        time_survived = int(now)
         # Handle freeze expiration
         if self.freeze_active and now >= self.freeze_end_time:
             self.freeze_active = False
@@ -2616,10 +2610,7 @@ class bullet_hell_game:
                 try: self.canvas.delete(self.freeze_overlay)
                 except Exception: pass
                 self.freeze_overlay = None
-            for pid, *_ in self.freeze_particles:
-                try: self.canvas.delete(pid)
-                except Exception: pass
-            self.freeze_particles.clear()
+            self.particles.clear('freeze')
             # Restore bullet colors
             self._tint_all_bullets(freeze=False)
             # Spawn shatter burst effect from each bullet to show reactivation
@@ -2635,71 +2626,6 @@ class bullet_hell_game:
             except Exception:
                 pass
         
-        # Update shield visual position and check text removal
-        if self.shield_active:
-            self.update_shield_visual()
-            # Remove shield text after delay
-            if hasattr(self, 'shield_text_remove_time') and now >= self.shield_text_remove_time:
-                if self.shield_text:
-                    try: self.canvas.delete(self.shield_text)
-                    except Exception: pass
-                    self.shield_text = None
-        
-        # Update shield particles (optimized batch processing)
-        if self.shield_particles:
-            new_sp = []
-            for pid, x, y, vx, vy, life in self.shield_particles:
-                life -= 1
-                if life > 0:
-                    try:
-                        x += vx
-                        y += vy
-                        self.canvas.coords(pid, x-2, y-2, x+2, y+2)
-                        # Fade effect
-                        if life < 8:
-                            alpha = int(life * 31.875)  # Fade from 255 to 0
-                            self.canvas.itemconfig(pid, fill=f"#{alpha:02x}66ff")
-                        new_sp.append((pid, x, y, vx, vy, life))
-                    except Exception:
-                        try: self.canvas.delete(pid)
-                        except Exception: pass
-                else:
-                    try: self.canvas.delete(pid)
-                    except Exception: pass
-            self.shield_particles = new_sp
-        
-        # Update slow-motion particles (optimized batch processing)
-        if self.slowmo_particles:
-            new_smp = []
-            for pid, x, y, vx, vy, life in self.slowmo_particles:
-                life -= 1
-                if life > 0:
-                    try:
-                        x += vx
-                        y += vy
-                        self.canvas.coords(pid, x-2, y-2, x+2, y+2)
-                        # Fade effect
-                        if life < 10:
-                            alpha = int(life * 25.5)
-                            self.canvas.itemconfig(pid, fill=f"#ff{alpha:02x}33")
-                        new_smp.append((pid, x, y, vx, vy, life))
-                    except Exception:
-                        try: self.canvas.delete(pid)
-                        except Exception: pass
-                else:
-                    try: self.canvas.delete(pid)
-                    except Exception: pass
-            self.slowmo_particles = new_smp
-        
-        # Update slow-motion text countdown
-        if self.slowmo_active and self.slowmo_text:
-            remaining = max(0.0, self.slowmo_end_time - now)
-            try:
-                self.canvas.itemconfig(self.slowmo_text, text=f"SLOW MOTION {remaining:.1f}s")
-                self.canvas.lift(self.slowmo_text)
-            except Exception:
-                pass
-        
         # Handle rewind expiration
         if self.rewind_active and now >= self.rewind_end_time:
             self.rewind_active = False
@@ -2742,992 +2668,217 @@ class bullet_hell_game:
         if (not self.freeze_active) and self.rewind_pending and not self.rewind_active:
             self.rewind_pending = False
             self.activate_rewind(self._pending_rewind_duration)
-        # Update rewind countdown label
-        if self.rewind_active and self.rewind_text:
-            remaining = max(0.0, self.rewind_end_time - now)
-            try:
-                self.canvas.itemconfig(self.rewind_text, text=f"REWIND {remaining:0.1f}s")
-                self.canvas.lift(self.rewind_text)
-            except Exception:
-                pass
-        # Show queued rewind label if pending
-        if self.rewind_pending and not self.rewind_active:
-            if not self.rewind_pending_text:
-                try:
-                    self.rewind_pending_text = self.canvas.create_text(self.width//2, self.height//2 - 140, text="REWIND QUEUED", fill="#66ff99", font=("Arial", 24, "bold"))
-                except Exception:
-                    self.rewind_pending_text = None
-            else:
-                try: self.canvas.lift(self.rewind_pending_text)
-                except Exception: pass
-        else:
-            if self.rewind_pending_text and not self.rewind_active:
-                # If no longer pending (activated), it is cleared inside activate_rewind
-                pass
-        # Update freeze countdown text if active
-        if self.freeze_active and self.freeze_text:
-            remaining = max(0.0, self.freeze_end_time - now)
-            try:
-                self.canvas.itemconfig(self.freeze_text, text=f"FREEZE {remaining:0.1f}s")
-                self.canvas.lift(self.freeze_text)
-            except Exception:
-                pass
-        # Spawn/update freeze particles (slow drifting flakes) while frozen
-        if self.freeze_active:
-            # spawn a few each frame
-            for _ in range(3):
-                import random as _r
-                x = _r.randint(0, self.width)
-                y = _r.randint(0, self.height)
-                size = _r.randint(3,6)
-                try:
-                    pid = self.canvas.create_oval(x-size/2, y-size/2, x+size/2, y+size/2, fill="#c9f6ff", outline="")
-                except Exception:
-                    continue
-                vx = _r.uniform(-0.5,0.5)
-                vy = _r.uniform(0.2,0.8)
-                life = _r.randint(18,35)
-                self.freeze_particles.append((pid, vx, vy, life))
-            new_fp = []
-            for pid, vx, vy, life in self.freeze_particles:
-                life -= 1
-                try:
-                    self.canvas.move(pid, vx, vy)
-                    if life < 10:
-                        # fade via stipple swap if possible
-                        if life % 2 == 0:
-                            self.canvas.itemconfig(pid, fill="#99ddee")
-                    if life > 0:
-                        new_fp.append((pid, vx, vy, life))
-                    else:
-                        self.canvas.delete(pid)
-                except Exception:
-                    pass
-            self.freeze_particles = new_fp
-        # Compute next unlock pattern
-        remaining_candidates = [(pat, t_req - time_survived) for pat, t_req in self.unlock_times.items() if t_req > time_survived]
-        if remaining_candidates:
-            # Pick soonest
-            pat, secs = min(remaining_candidates, key=lambda x: x[1])
-            display = self.pattern_display_names.get(pat, pat.title())
-            self.canvas.itemconfig(self.next_unlock_text, text=f"Next Pattern: {display} in {secs}s")
-        else:
-            self.canvas.itemconfig(self.next_unlock_text, text="All patterns unlocked")
-
-        # Fixed spawn chances (1 in N each frame after unlock)
-        bullet_chance = 18
-        bullet2_chance = 22
-        diag_chance = 28
-        boss_chance = 140
-        zigzag_chance = 40
-        fast_chance = 30
-        star_chance = 55
-        rect_chance = 48
-        laser_chance = 160
-        triangle_chance = 46
-        quad_chance = 52
-        egg_chance = 50
-        bouncing_chance = 70
-        exploding_chance = 90
-        homing_chance = 110
-        spiral_chance = 130
-        radial_chance = 150
-        wave_chance = 160
-        boomerang_chance = 170
-        split_chance = 180
-
         # --- Freeze power-up spawn (independent of bullet patterns) ---
         # Only spawn if not currently active and limited number on screen
         if not self.freeze_active and len(self.freeze_powerups) < 1:
             # Roughly ~ one every ~45s expected (1 in 900 per 50ms frame)
-            if random.randint(1, 900) == 1:
+            if self._roll_chance(900, dt):
                 self.spawn_freeze_powerup()
         # --- Rewind power-up spawn ---
         if not self.rewind_active and len(self.rewind_powerups) < 1:
             # Rarer than freeze (approx one every ~70s)
-            if random.randint(1, 1400) == 1 and len(self._bullet_history) > 40:
+            if self._roll_chance(1400, dt) and len(self._bullet_history) > 2.0 / dt:
                 self.spawn_rewind_powerup()
         
         # --- Shield power-up spawn (optimized) ---
         if not self.shield_active and len(self.shield_powerups) < 1:
             # Spawn roughly every ~55s (1 in 1100 per 50ms frame)
-            if random.randint(1, 1100) == 1:
+            if self._roll_chance(1100, dt):
                 self.spawn_shield_powerup()
         
         # --- Slow-motion power-up spawn (optimized) ---
         if not self.slowmo_active and len(self.slowmo_powerups) < 1:
             # Spawn roughly every ~65s (1 in 1300 per 50ms frame)
-            if random.randint(1, 1300) == 1:
+            if self._roll_chance(1300, dt):
                 self.spawn_slowmo_powerup()
 
-        # Move existing freeze power-ups downward & check collection
-        for p_id in self.freeze_powerups[:]:
-            try:
-                self.canvas.move(p_id, 0, 4)
-                px1, py1, px2, py2 = self.canvas.coords(self.player)
-                bx1, by1, bx2, by2 = self.canvas.coords(p_id)
-                if bx2 < px1 or bx1 > px2 or by2 < py1 or by1 > py2:
-                    # no overlap
-                    pass
-                else:
-                    self.activate_freeze()
-                    try:
-                        self.canvas.delete(p_id)
-                    except Exception:
-                        pass
-                    self.freeze_powerups.remove(p_id)
-                    continue
-                # Remove if off screen
-                if by1 > self.height:
-                    try:
-                        self.canvas.delete(p_id)
-                    except Exception:
-                        pass
-                    self.freeze_powerups.remove(p_id)
-            except Exception:
-                try:
-                    self.freeze_powerups.remove(p_id)
-                except Exception:
-                    pass
-        # Move existing rewind power-ups & check collection
-        for r_id in self.rewind_powerups[:]:
-            try:
-                self.canvas.move(r_id, 0, 4)
-                px1, py1, px2, py2 = self.canvas.coords(self.player)
-                rx1, ry1, rx2, ry2 = self.canvas.coords(r_id)
-                # collection overlap
-                if not (rx2 < px1 or rx1 > px2 or ry2 < py1 or ry1 > py2):
-                    self.activate_rewind()
-                    try: self.canvas.delete(r_id)
-                    except Exception: pass
-                    self.rewind_powerups.remove(r_id)
-                    continue
-                if ry1 > self.height:
-                    try: self.canvas.delete(r_id)
-                    except Exception: pass
-                    self.rewind_powerups.remove(r_id)
-            except Exception:
-                try: self.rewind_powerups.remove(r_id)
-                except Exception: pass
-        
-        # Move existing shield power-ups & check collection (optimized)
+        # Move existing power-ups & check collection. Each list is rebuilt with
+        # the survivors in one pass instead of list.remove() inside the loop.
+        fall = self.powerup_fall_speed * dt
         px1, py1, px2, py2 = self.canvas.coords(self.player)  # Cache player coords
-        for s_id in self.shield_powerups[:]:
-            try:
-                self.canvas.move(s_id, 0, 4)
-                sx1, sy1, sx2, sy2 = self.canvas.coords(s_id)
-                # Collection overlap check
-                if not (sx2 < px1 or sx1 > px2 or sy2 < py1 or sy1 > py2):
-                    self.activate_shield()
-                    try: self.canvas.delete(s_id)
-                    except Exception: pass
-                    self.shield_powerups.remove(s_id)
-                    continue
-                # Remove if off screen
-                if sy1 > self.height:
-                    try: self.canvas.delete(s_id)
-                    except Exception: pass
-                    self.shield_powerups.remove(s_id)
-            except Exception:
-                try: self.shield_powerups.remove(s_id)
-                except Exception: pass
-        
-        # Move existing slow-motion power-ups & check collection (optimized)
-        for sm_entry in self.slowmo_powerups[:]:
-            try:
-                # Handle both single ID and tuple (id, hand1, hand2)
-                if isinstance(sm_entry, tuple):
-                    sm_id, hand1, hand2 = sm_entry
-                    self.canvas.move(sm_id, 0, 4)
-                    if hand1: self.canvas.move(hand1, 0, 4)
-                    if hand2: self.canvas.move(hand2, 0, 4)
-                else:
-                    sm_id = sm_entry
-                    hand1, hand2 = None, None
-                    self.canvas.move(sm_id, 0, 4)
-                
-                smx1, smy1, smx2, smy2 = self.canvas.coords(sm_id)
-                # Collection overlap check
-                if not (smx2 < px1 or smx1 > px2 or smy2 < py1 or smy1 > py2):
-                    self.activate_slowmo()
-                    try: self.canvas.delete(sm_id)
-                    except Exception: pass
-                    if hand1:
-                        try: self.canvas.delete(hand1)
-                        except Exception: pass
-                    if hand2:
-                        try: self.canvas.delete(hand2)
-                        except Exception: pass
-                    self.slowmo_powerups.remove(sm_entry)
-                    continue
-                # Remove if off screen
-                if smy1 > self.height:
-                    try: self.canvas.delete(sm_id)
-                    except Exception: pass
-                    if hand1:
-                        try: self.canvas.delete(hand1)
-                        except Exception: pass
-                    if hand2:
-                        try: self.canvas.delete(hand2)
-                        except Exception: pass
-                    self.slowmo_powerups.remove(sm_entry)
-            except Exception:
-                try: self.slowmo_powerups.remove(sm_entry)
-                except Exception: pass
+        self.freeze_powerups = self._update_falling_powerups(
+            self.freeze_powerups, fall, px1, py1, px2, py2, self.activate_freeze)
+        self.rewind_powerups = self._update_falling_powerups(
+            self.rewind_powerups, fall, px1, py1, px2, py2, self.activate_rewind)
+        self.shield_powerups = self._update_falling_powerups(
+            self.shield_powerups, fall, px1, py1, px2, py2, self.activate_shield)
+        self.slowmo_powerups = self._update_falling_powerups(
+            self.slowmo_powerups, fall, px1, py1, px2, py2, self.activate_slowmo)
+        profiler.lap('powerups')
 
-        # Time-based unlock gating (progressive difficulty)
+        # Time-based unlock gating (progressive difficulty); chances come from the pattern registry
         t = time_survived
-        if not self.freeze_active:
-            # Skip new spawns while rewinding
-            if not self.rewind_active and t >= self.unlock_times['vertical'] and random.randint(1, bullet_chance) == 1:
-                self.shoot_bullet()
-            if not self.rewind_active and t >= self.unlock_times['horizontal'] and random.randint(1, bullet2_chance) == 1:
-                self.shoot_bullet2()
-            if not self.rewind_active and t >= self.unlock_times['diag'] and random.randint(1, diag_chance) == 1:
-                self.shoot_diag_bullet()
-            if not self.rewind_active and t >= self.unlock_times['boss'] and random.randint(1, boss_chance) == 1:
-                self.shoot_boss_bullet()
-            if not self.rewind_active and t >= self.unlock_times['zigzag'] and random.randint(1, zigzag_chance) == 1:
-                self.shoot_zigzag_bullet()
-            if not self.rewind_active and t >= self.unlock_times['fast'] and random.randint(1, fast_chance) == 1:
-                self.shoot_fast_bullet()
-            if not self.rewind_active and t >= self.unlock_times['star'] and random.randint(1, star_chance) == 1:
-                self.shoot_star_bullet()
-            if not self.rewind_active and t >= self.unlock_times['rect'] and random.randint(1, rect_chance) == 1:
-                self.shoot_rect_bullet()
-            if not self.rewind_active and t >= self.unlock_times['laser'] and random.randint(1, laser_chance) == 1:
-                self.shoot_horizontal_laser()
-            if not self.rewind_active and t >= self.unlock_times['triangle'] and random.randint(1, triangle_chance) == 1:
-                self.shoot_triangle_bullet()
-            if not self.rewind_active and t >= self.unlock_times['quad'] and random.randint(1, quad_chance) == 1:
-                self.shoot_quad_bullet()
-            if not self.rewind_active and t >= self.unlock_times['egg'] and random.randint(1, egg_chance) == 1:
-                self.shoot_egg_bullet()
-            if not self.rewind_active and t >= self.unlock_times['bouncing'] and random.randint(1, bouncing_chance) == 1:
-                self.shoot_bouncing_bullet()
-            if not self.rewind_active and t >= self.unlock_times['exploding'] and random.randint(1, exploding_chance) == 1:
-                self.shoot_exploding_bullet()
-            if not self.rewind_active and t >= self.unlock_times['homing'] and random.randint(1, homing_chance) == 1:
-                self.shoot_homing_bullet()
-            if not self.rewind_active and t >= self.unlock_times['spiral'] and random.randint(1, spiral_chance) == 1:
-                self.shoot_spiral_bullet()
-            if not self.rewind_active and t >= self.unlock_times['radial'] and random.randint(1, radial_chance) == 1:
-                self.shoot_radial_burst()
-            if not self.rewind_active and t >= self.unlock_times['wave'] and random.randint(1, wave_chance) == 1:
-                self.shoot_wave_bullet()
-            if not self.rewind_active and t >= self.unlock_times['boomerang'] and random.randint(1, boomerang_chance) == 1:
-                self.shoot_boomerang_bullet()
-            if not self.rewind_active and t >= self.unlock_times['split'] and random.randint(1, split_chance) == 1:
-                self.shoot_split_bullet()
+        # Skip new spawns while frozen or rewinding
+        if not self.freeze_active and not self.rewind_active:
+            if self.stress is not None:
+                # Stress ramp: every pattern unlocked, spawn rates boosted
+                boost = self.stress.boost(self.game_time)
+                for pattern in self._spawn_schedule:
+                    for _ in range(self._roll_count(pattern.chance, dt, boost)):
+                        getattr(self, pattern.spawner)()
+            else:
+                for pattern in self._spawn_schedule:
+                    if t >= self.unlock_times[pattern.unlock] and self._roll_chance(pattern.chance, dt):
+                        getattr(self, pattern.spawner)()
+        profiler.lap('spawning')
         # Capture bullet snapshot (post spawn) if not frozen or rewinding
         if not self.freeze_active and not self.rewind_active:
             try:
                 self._capture_bullet_snapshot()
             except Exception:
                 pass
+        profiler.lap('snapshot')
         
-        # Memory optimization: Periodically clean grazed_bullets set (every ~5 seconds)
-        # This prevents unbounded growth of the set which holds references to deleted bullets
-        if not hasattr(self, '_last_graze_cleanup'):
-            self._last_graze_cleanup = now
-        if now - self._last_graze_cleanup > 5.0 and len(self.grazed_bullets) > 100:
-            # Keep only bullets that still exist on canvas
-            valid_bullets = set()
-            for bid in self.grazed_bullets:
-                try:
-                    if self.canvas.coords(bid):  # Check if bullet still exists
-                        valid_bullets.add(bid)
-                except Exception:
-                    pass
-            self.grazed_bullets = valid_bullets
-            self._last_graze_cleanup = now
+        # Push player hitbox and damage rules into the simulation
+        try:
+            self.sim.set_player_rect(*self.canvas.coords(self.player))
+        except Exception:
+            pass
+        self.sim.difficulty = self.difficulty
+        self.sim.collisions_enabled = not (self.practice_mode or self.game_over or
+                                           self.game_time < self.static_trap_invuln_end)
 
-        # If freeze is active, skip movement updates for bullets (they remain frozen in place)
+        # Frozen bullets stay in place; rewind plays the history backwards
         if self.freeze_active:
-            self.root.after(50, self.update_game)
+            profiler.lap('bullets')
             return
         if self.rewind_active:
-            # Rewind bullet positions instead of advancing
-            self._perform_rewind_step()
-            self.root.after(50, self.update_game)
+            self._perform_rewind_step(dt)
+            profiler.lap('rewind')
             return
         
-        # Calculate speed multiplier once for all bullet types (optimization)
+        # Advance the bullet simulation, then apply its outcome to the player
         speed_multiplier = self.slowmo_factor if self.slowmo_active else 1.0
-        
-        # Cache player coordinates for all collision checks (major optimization)
-        try:
-            px1, py1, py2, py2 = self.canvas.coords(self.player)
-            player_coords_cached = (px1, py1, px2, py2)
-        except Exception:
-            player_coords_cached = None
-        
-        # Move triangle bullets (optimized)
-        triangle_speed = 7 * speed_multiplier
-        for bullet_tuple in self.triangle_bullets[:]:
-            bullet, direction = bullet_tuple
-            self.canvas.move(bullet, triangle_speed * direction, triangle_speed)
-            if self.check_collision(bullet, player_coords_cached):
-                self.canvas.delete(bullet)
-                self.paused = False
-                self.pause_text = None
-                self.triangle_bullets.remove(bullet_tuple)
-            else:
-                coords = self.canvas.coords(bullet)
-                if coords and (coords[1] > self.height or coords[0] < 0 or coords[2] > self.width):
-                    self.canvas.delete(bullet)
-                    self.triangle_bullets.remove(bullet_tuple)
-                    self.score += 2
-        
-        # Move bouncing bullets (optimized to reduce index lookups)
-        new_bouncing = []
-        for bullet_tuple in self.bouncing_bullets:
-            bullet, x_velocity, y_velocity, bounces_left = bullet_tuple
-            self.canvas.move(bullet, x_velocity * speed_multiplier, y_velocity * speed_multiplier)
-            coords = self.canvas.coords(bullet)
-            if not coords:
-                continue
-            bounced = False
-            # Bounce off left/right
-            if coords[0] <= 0 or coords[2] >= self.width:
-                x_velocity = -x_velocity
-                bounced = True
-            # Bounce off top/bottom
-            if coords[1] <= 0 or coords[3] >= self.height:
-                y_velocity = -y_velocity
-                bounced = True
-            if bounced:
-                bounces_left -= 1
-            # Remove bullet if out of bounces
-            if bounces_left < 0:
-                self.canvas.delete(bullet)
-                self.score += 2
-                continue
-            # Check collision (using centralized handler for shield support)
-            if self.check_collision(bullet, player_coords_cached):
-                self.canvas.delete(bullet)
-                continue
-            # Keep bullet with updated values
-            new_bouncing.append((bullet, x_velocity, y_velocity, bounces_left))
-        self.bouncing_bullets = new_bouncing
-        # Move exploding bullets
-        for bullet in self.exploding_bullets[:]:
-            self.canvas.move(bullet, 0, 5 + self.difficulty // 3)
-            coords = self.canvas.coords(bullet)
-            # Check if bullet reached middle of screen (y ~ self.height//2)
-            if coords and abs((coords[1] + coords[3]) / 2 - self.height // 2) < 20:
-                # Explode into 4 diagonal fragments
-                bx = (coords[0] + coords[2]) / 2
-                by = (coords[1] + coords[3]) / 2
-                size = 12
-                directions = [(6, 6), (-6, 6), (6, -6), (-6, -6)]
-                for dx, dy in directions:
-                    frag = self.canvas.create_oval(bx-size//2, by-size//2, bx+size//2, by+size//2, fill="white")
-                    self.exploded_fragments.append((frag, dx, dy))
-                self.canvas.delete(bullet)
-                self.exploding_bullets.remove(bullet)
-                self.score += 2
-                continue
-            if self.check_collision(bullet):
-                self.lives -= 1
-                self.canvas.delete(bullet)
-                self.exploding_bullets.remove(bullet)
-                if self.lives <= 0:
-                    self.end_game()
-            else:
-                if coords and coords[1] > self.height:
-                    self.canvas.delete(bullet)
-                    self.exploding_bullets.remove(bullet)
-                    self.score += 2
-        # Move exploded fragments (diagonal bullets)
-        for frag_tuple in self.exploded_fragments[:]:
-            frag, dx, dy = frag_tuple
-            self.canvas.move(frag, dx, dy)
-            coords = self.canvas.coords(frag)
-            if self.check_collision(frag):
-                self.lives -= 1
-                self.canvas.delete(frag)
-                self.exploded_fragments.remove(frag_tuple)
-                if self.lives <= 0:
-                    self.end_game()
-            elif coords and (coords[1] > self.height or coords[0] < 0 or coords[2] > self.width or coords[3] < 0):
-                self.canvas.delete(frag)
-                self.exploded_fragments.remove(frag_tuple)
-                self.score += 1
-            # Grazing check
-            if self.check_graze(frag) and frag not in self.grazed_bullets:
-                self.score += 1
-                self.grazed_bullets.add(frag)
-                self.show_graze_effect()
-        # Handle laser indicators
-        for indicator_tuple in self.laser_indicators[:]:
-            indicator_id, y, timer = indicator_tuple
-            timer -= 1
-            if timer <= 0:
-                self.canvas.delete(indicator_id)
-                # Spawn actual laser
-                laser_id = self.canvas.create_line(0, y, self.width, y, fill="red", width=8)
-                self.lasers.append((laser_id, y, 20))  # Laser lasts 20 frames
-                self.laser_indicators.remove(indicator_tuple)
+        result = self.sim.step(dt, speed_multiplier)
+        profiler.lap('bullets')
+        self.score += result.points
+        for kind in result.hits:
+            if kind == 'static' and self._static_can_trigger_trap():
+                self.start_static_trap()
             else:
-                idx = self.laser_indicators.index(indicator_tuple)
-                self.laser_indicators[idx] = (indicator_id, y, timer)
-
-        # Handle lasers
-        for laser_tuple in self.lasers[:]:
-            laser_id, y, timer = laser_tuple
-            timer -= 1
-            # Check collision with player
-            player_coords = self.canvas.coords(self.player)
-            if player_coords[1] <= y <= player_coords[3]:
-                self.lives -= 1
-                self.canvas.delete(laser_id)
-                self.lasers.remove(laser_tuple)
-                if self.lives <= 0:
-                    self.end_game()
-                continue
-            if timer <= 0:
-                self.canvas.delete(laser_id)
-                self.lasers.remove(laser_tuple)
-            else:
-                idx = self.lasers.index(laser_tuple)
-                self.lasers[idx] = (laser_id, y, timer)
-
-        # Bullet speeds scale with difficulty
-        # (speed_multiplier and player_coords_cached already calculated earlier in update_game)
-        bullet_speed = 7 * speed_multiplier
-        bullet2_speed = 7 * speed_multiplier
-        diag_speed = 5 * speed_multiplier
-        boss_speed = 10 * speed_multiplier
-        zigzag_speed = 5 * speed_multiplier
-        fast_speed = 14 * speed_multiplier
-        star_speed = 8 * speed_multiplier
-        rect_speed = 8 * speed_multiplier
-        quad_speed = 7 * speed_multiplier
-        egg_speed = 6 * speed_multiplier
-        homing_speed = 6 * speed_multiplier
-
-        # Move vertical bullets (optimized with cached player coords)
-        for bullet in self.bullets[:]:
-            self.canvas.move(bullet, 0, bullet_speed)
-            if self.check_collision(bullet, player_coords_cached):
-                if not self.practice_mode:
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self.end_game()
-                self.canvas.delete(bullet)
-                self.bullets.remove(bullet)
-            elif self.canvas.coords(bullet)[1] > self.height:
-                self.canvas.delete(bullet)
-                self.bullets.remove(bullet)
-                self.score += 1
-            # Grazing check
-            elif self.check_graze(bullet, player_coords_cached) and bullet not in self.grazed_bullets:
-                self.score += 1
-                self.grazed_bullets.add(bullet)
-                self.show_graze_effect()
-                if self.focus_active:
-                    self.focus_charge = min(1.0, self.focus_charge + self.focus_charge_graze_bonus)
-                    if self.focus_charge >= self.focus_charge_threshold:
-                        self.focus_charge_ready = True
-
-        # Move horizontal bullets (optimized with cached player coords)
-        for bullet2 in self.bullets2[:]:
-            self.canvas.move(bullet2, bullet2_speed, 0)
-            if self.check_collision(bullet2, player_coords_cached):
-                if not self.practice_mode:
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self.end_game()
-                self.canvas.delete(bullet2)
-                self.bullets2.remove(bullet2)
-            elif self.canvas.coords(bullet2)[0] > self.width:
-                self.canvas.delete(bullet2)
-                self.bullets2.remove(bullet2)
-                self.score += 1
-            # Grazing check
-            elif self.check_graze(bullet2, player_coords_cached) and bullet2 not in self.grazed_bullets:
-                self.score += 1
-                self.grazed_bullets.add(bullet2)
-                self.show_graze_effect()
-                if self.focus_active:
-                    self.focus_charge = min(1.0, self.focus_charge + self.focus_charge_graze_bonus)
-                    if self.focus_charge >= self.focus_charge_threshold:
-                        self.focus_charge_ready = True
-
-        # Move egg bullets (optimized with cached player coords)
-        for egg_bullet in self.egg_bullets[:]:
-            self.canvas.move(egg_bullet, 0, egg_speed)
-            if self.check_collision(egg_bullet, player_coords_cached):
-                if not self.practice_mode:
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self.end_game()
-                self.canvas.delete(egg_bullet)
-                self.egg_bullets.remove(egg_bullet)
-            elif self.canvas.coords(egg_bullet)[1] > self.height:
-                self.canvas.delete(egg_bullet)
-                self.egg_bullets.remove(egg_bullet)
-                self.score += 2
-            # Grazing check
-            elif self.check_graze(egg_bullet, player_coords_cached) and egg_bullet not in self.grazed_bullets:
-                self.score += 1
-                self.grazed_bullets.add(egg_bullet)
-                self.show_graze_effect()
-                if self.focus_active:
-                    self.focus_charge = min(1.0, self.focus_charge + self.focus_charge_graze_bonus)
-                    if self.focus_charge >= self.focus_charge_threshold:
-                        self.focus_charge_ready = True
-
-        # Move diagonal bullets (optimized)
-        for bullet_tuple in self.diag_bullets[:]:
-            dbullet, direction = bullet_tuple
-            self.canvas.move(dbullet, diag_speed * direction, diag_speed)
-            if self.check_collision(dbullet, player_coords_cached):
-                if not self.practice_mode:
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self.end_game()
-                self.canvas.delete(dbullet)
-                self.diag_bullets.remove(bullet_tuple)
-            elif self.canvas.coords(dbullet)[1] > self.height:
-                self.canvas.delete(dbullet)
-                self.diag_bullets.remove(bullet_tuple)
-                self.score += 2
-            # Grazing check
-            elif self.check_graze(dbullet, player_coords_cached) and dbullet not in self.grazed_bullets:
-                self.score += 1
-                self.grazed_bullets.add(dbullet)
-                self.show_graze_effect()
-                if self.focus_active:
-                    self.focus_charge = min(1.0, self.focus_charge + self.focus_charge_graze_bonus)
-                    if self.focus_charge >= self.focus_charge_threshold:
-                        self.focus_charge_ready = True
-
-        # Move boss bullets (optimized)
-        for boss_bullet in self.boss_bullets[:]:
-            self.canvas.move(boss_bullet, 0, boss_speed)
-            if self.check_collision(boss_bullet, player_coords_cached):
-                if not self.practice_mode:
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self.end_game()
-                self.canvas.delete(boss_bullet)
-                self.boss_bullets.remove(boss_bullet)
-            elif self.canvas.coords(boss_bullet)[1] > self.height:
-                self.canvas.delete(boss_bullet)
-                self.boss_bullets.remove(boss_bullet)
-                self.score += 5  # Boss bullets give more score
-            # Grazing check
-            elif self.check_graze(boss_bullet, player_coords_cached) and boss_bullet not in self.grazed_bullets:
-                self.score += 2
-                self.grazed_bullets.add(boss_bullet)
-                self.show_graze_effect()
-                if self.focus_active:
-                    self.focus_charge = min(1.0, self.focus_charge + self.focus_charge_graze_bonus)
-                    if self.focus_charge >= self.focus_charge_threshold:
-                        self.focus_charge_ready = True
-
-        # Move quad bullets (optimized)
-        for bullet in self.quad_bullets[:]:
-            self.canvas.move(bullet, 0, quad_speed)
-            if self.check_collision(bullet, player_coords_cached):
-                if not self.practice_mode:
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self.end_game()
-                self.canvas.delete(bullet)
-                self.quad_bullets.remove(bullet)
-            elif self.canvas.coords(bullet)[1] > self.height:
-                self.canvas.delete(bullet)
-                self.quad_bullets.remove(bullet)
-                self.score += 2
-            # Grazing check
-            elif self.check_graze(bullet, player_coords_cached) and bullet not in self.grazed_bullets:
-                self.score += 1
-                self.grazed_bullets.add(bullet)
-                self.show_graze_effect()
-                if self.focus_active:
-                    self.focus_charge = min(1.0, self.focus_charge + self.focus_charge_graze_bonus)
-                    if self.focus_charge >= self.focus_charge_threshold:
-                        self.focus_charge_ready = True
-
-        # Move zigzag bullets
-        for bullet_tuple in self.zigzag_bullets[:]:
-            bullet, direction, step_count = bullet_tuple
-            # Change direction every 10 steps
-            if step_count % 10 == 0:
-                direction *= -1
-            self.canvas.move(bullet, 5 * direction, zigzag_speed)
-            if self.check_collision(bullet):
-                if not self.practice_mode:
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self.end_game()
-                self.canvas.delete(bullet)
-                self.zigzag_bullets.remove(bullet_tuple)
-            else:
-                coords = self.canvas.coords(bullet)
-                if coords[1] > self.height or coords[0] < 0 or coords[2] > self.width:
-                    self.canvas.delete(bullet)
-                    self.zigzag_bullets.remove(bullet_tuple)
-                    self.score += 2
-                else:
-                    # Update tuple with incremented step_count and possibly new direction
-                    idx = self.zigzag_bullets.index(bullet_tuple)
-                    self.zigzag_bullets[idx] = (bullet, direction, step_count + 1)
-            # Grazing check
-            if self.check_graze(bullet) and bullet not in self.grazed_bullets:
-                self.score += 1
-                self.grazed_bullets.add(bullet)
-                self.show_graze_effect()
-                if self.focus_active:
-                    self.focus_charge = min(1.0, self.focus_charge + self.focus_charge_graze_bonus)
-                    if self.focus_charge >= self.focus_charge_threshold:
-                        self.focus_charge_ready = True
-
-        # Move fast bullets
-        for fast_bullet in self.fast_bullets[:]:
-            self.canvas.move(fast_bullet, 0, fast_speed)
-            if self.check_collision(fast_bullet):
-                if not self.practice_mode:
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self.end_game()
-                self.canvas.delete(fast_bullet)
-                self.fast_bullets.remove(fast_bullet)
-            elif self.canvas.coords(fast_bullet)[1] > self.height:
-                self.canvas.delete(fast_bullet)
-                self.fast_bullets.remove(fast_bullet)
-                self.score += 2
-            # Grazing check
-            if self.check_graze(fast_bullet) and fast_bullet not in self.grazed_bullets:
-                self.score += 1
-                self.grazed_bullets.add(fast_bullet)
-                self.show_graze_effect()
-                if self.focus_active:
-                    self.focus_charge = min(1.0, self.focus_charge + self.focus_charge_graze_bonus)
-                    if self.focus_charge >= self.focus_charge_threshold:
-                        self.focus_charge_ready = True
-
-        # Move & spin star bullets
-        for star_bullet in self.star_bullets[:]:
-            # Fall movement
-            self.canvas.move(star_bullet, 0, star_speed)
-            # Spin: fetch current coords, rotate around center by small angle
-            coords = self.canvas.coords(star_bullet)
-            if len(coords) >= 6:  # polygon
-                # Compute center
-                xs = coords[0::2]
-                ys = coords[1::2]
-                cx = sum(xs)/len(xs)
-                cy = sum(ys)/len(ys)
-                angle = 0.18  # radians per frame
-                sin_a = _sin(angle)
-                cos_a = _cos(angle)
-                new_pts = []
-                for x, y in zip(xs, ys):
-                    dx = x - cx
-                    dy = y - cy
-                    rx = dx * cos_a - dy * sin_a + cx
-                    ry = dx * sin_a + dy * cos_a + cy
-                    new_pts.extend([rx, ry])
-                self.canvas.coords(star_bullet, *new_pts)
-            # Collision / bounds / graze
-            if self.check_collision(star_bullet):
-                if not self.practice_mode:
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self.end_game()
-                self.canvas.delete(star_bullet)
-                self.star_bullets.remove(star_bullet)
-                continue
-            # Off screen
-            bbox = self.canvas.bbox(star_bullet)
-            if bbox and bbox[1] > self.height:
-                self.canvas.delete(star_bullet)
-                self.star_bullets.remove(star_bullet)
-                self.score += 3
-                continue
-            # Grazing
-            if self.check_graze(star_bullet) and star_bullet not in self.grazed_bullets:
-                self.score += 1
-                self.grazed_bullets.add(star_bullet)
-                self.show_graze_effect()
-                if self.focus_active:
-                    self.focus_charge = min(1.0, self.focus_charge + self.focus_charge_graze_bonus)
-                    if self.focus_charge >= self.focus_charge_threshold:
-                        self.focus_charge_ready = True
-
-        # Move rectangle bullets
-        for rect_bullet in self.rect_bullets[:]:
-            self.canvas.move(rect_bullet, 0, rect_speed)
-            if self.check_collision(rect_bullet):
-                if not self.practice_mode:
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self.end_game()
-                self.canvas.delete(rect_bullet)
-                self.rect_bullets.remove(rect_bullet)
-            elif self.canvas.coords(rect_bullet)[1] > self.height:
-                self.canvas.delete(rect_bullet)
-                self.rect_bullets.remove(rect_bullet)
-                self.score += 2
-            # Grazing check
-            if self.check_graze(rect_bullet) and rect_bullet not in self.grazed_bullets:
-                self.score += 1
-                self.grazed_bullets.add(rect_bullet)
-                self.show_graze_effect()
-                if self.focus_active:
-                    self.focus_charge = min(1.0, self.focus_charge + self.focus_charge_graze_bonus)
-                    if self.focus_charge >= self.focus_charge_threshold:
-                        self.focus_charge_ready = True
+                self.handle_player_hit()
+        if result.grazes:
+            self.show_graze_effect()
+            if self.focus_active:
+                self.focus_charge = min(1.0, self.focus_charge + self.focus_charge_graze_bonus * result.grazes)
+                if self.focus_charge >= self.focus_charge_threshold:
+                    self.focus_charge_ready = True
+        profiler.lap('player')
 
-        # ---------------- Move homing bullets ----------------
-        for hb_tuple in self.homing_bullets[:]:
-            # Backward compatibility: allow old 3-tuple
-            if len(hb_tuple) == 3:
-                bullet, vx, vy = hb_tuple
-                life = self.homing_bullet_max_life
-            else:
-                bullet, vx, vy, life = hb_tuple
-            # Compute vector toward player center
-            px1, py1, px2, py2 = self.canvas.coords(self.player)
-            pcx = (px1 + px2)/2
-            pcy = (py1 + py2)/2
-            bx1, by1, bx2, by2 = self.canvas.coords(bullet)
-            bcx = (bx1 + bx2)/2
-            bcy = (by1 + by2)/2
-            dx = pcx - bcx
-            dy = pcy - bcy
-           
-            dist = _hypot(dx, dy) or 1
-            # Normalize and apply steering (lerp velocities)
-            target_vx = dx / dist * homing_speed
-            target_vy = dy / dist * homing_speed
-            steer_factor = 0.15  # how quickly it turns
-            vx = vx * (1 - steer_factor) + target_vx * steer_factor
-            vy = vy * (1 - steer_factor) + target_vy * steer_factor
-            self.canvas.move(bullet, vx, vy)
-            life -= 1
-            # Update tuple (store life)
-            idx = self.homing_bullets.index(hb_tuple)
-            self.homing_bullets[idx] = (bullet, vx, vy, life)
-            # Collision / out of bounds
-            if self.check_collision(bullet):
-                if not self.practice_mode:
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self.end_game()
-                self.canvas.delete(bullet)
-                self.homing_bullets.remove(self.homing_bullets[idx])
+    def _render_frame(self, dt):
+        """Redraw HUD, effects and the bullet view; dt is the game time the frame covers."""
+        profiler = self.profiler
+    # Background animation
+        self.update_background(dt)
+        profiler.lap('background')
+    # Animate player decorative sprite
+        self.animate_player_sprite(dt)
+        profiler.lap('player')
+        # HUD texts are only rewritten when the value shown changes
+        hud = self.hud
+        hud.set_text('boss_hits', f"Boss Hits: {self.boss_health_display}")
+        hud.set_text('items', f"Items: {len(self.collected_items)}/{self.total_collectables}")
+        # Increase difficulty every 60 seconds
+        now = time.time()
+    # Difficulty scaling removed
+        if now - self.lastdial > 10:
+            self.get_dialog_string()
+            self.lastdial = now
+            hud.set_text('dialog', self.dial)
+        profiler.lap('hud')
+        # Lore rotation
+        if getattr(self, 'lore_text', None) is not None and now - getattr(self, 'lore_last_change', 0) >= getattr(self, 'lore_interval', 8):
+            self.update_lore_line()
+        profiler.lap('lore')
+        # Time survived is simulated time, so pauses and traps do not count
+        time_survived = int(self.game_time)
+        hud.set_text('score', f"Score: {self.score}")
+        hud.set_text('time', f"Time: {time_survived}")
+        profiler.lap('hud')
+        # Update shield visual position and check text removal
+        if self.shield_active:
+            self.update_shield_visual()
+            # Remove shield text after delay
+            if hasattr(self, 'shield_text_remove_time') and self.game_time >= self.shield_text_remove_time:
+                if self.shield_text:
+                    try: self.canvas.delete(self.shield_text)
+                    except Exception: pass
+                    self.shield_text = None
+        
+        profiler.lap('effects')
+        # Particle updates are queued and sent with the bullet view's sync below
+        self.particles.update(dt)
+        profiler.lap('particles')
+        
+        # Update slow-motion text countdown
+        if self.slowmo_active and self.slowmo_text:
+            remaining = max(0.0, self.slowmo_end_time - self.game_time)
+            try:
+                self.canvas.itemconfig(self.slowmo_text, text=f"SLOW MOTION {remaining:.1f}s")
+            except Exception:
+                pass
+        
+        # Update rewind countdown label
+        if self.rewind_active and self.rewind_text:
+            remaining = max(0.0, self.rewind_end_time - self.game_time)
+            try:
+                self.canvas.itemconfig(self.rewind_text, text=f"REWIND {remaining:0.1f}s")
+            except Exception:
+                pass
+        # Show queued rewind label if pending
+        if self.rewind_pending and not self.rewind_active:
+            if not self.rewind_pending_text:
+                try:
+                    self.rewind_pending_text = self.layers.place(self.canvas.create_text(self.width//2, self.height//2 - 140, text="REWIND QUEUED", fill="#66ff99", font=("Arial", 24, "bold")), 'overlay')
+                except Exception:
+                    self.rewind_pending_text = None
+        else:
+            if self.rewind_pending_text and not self.rewind_active:
+                # If no longer pending (activated), it is cleared inside activate_rewind
+                pass
+        # Update freeze countdown text if active
+        if self.freeze_active and self.freeze_text:
+            remaining = max(0.0, self.freeze_end_time - self.game_time)
+            try:
+                self.canvas.itemconfig(self.freeze_text, text=f"FREEZE {remaining:0.1f}s")
+            except Exception:
+                pass
+        # Bullet tint fades in during a freeze and back out after it
+        self._update_freeze_tint(dt)
+        # Spawn freeze particles (slow drifting flakes) while frozen, at the quality tier's rate
+        if self.freeze_active:
+            self.freeze_particle_spawn_accum += self.freeze_flake_rate * dt
+            count = int(self.freeze_particle_spawn_accum)
+            if count:
+                self.freeze_particle_spawn_accum -= count
+                try:
+                    self.particles.spawn('freeze',
+                                         [self.fx_rng.randint(0, self.width) for _ in range(count)],
+                                         [self.fx_rng.randint(0, self.height) for _ in range(count)],
+                                         [self.fx_rng.uniform(-10, 10) for _ in range(count)],
+                                         [self.fx_rng.uniform(4, 16) for _ in range(count)],
+                                         [self.fx_rng.uniform(0.9, 1.75) for _ in range(count)],
+                                         [self.fx_rng.randint(3, 6) for _ in range(count)])
+                except Exception:
+                    pass
+        profiler.lap('effects')
+        # Next unlock pattern; time_survived is whole seconds, so only recompute when it ticks
+        if time_survived != self._next_unlock_time:
+            self._next_unlock_time = time_survived
+            remaining_candidates = [(pat, t_req - time_survived) for pat, t_req in self.unlock_times.items() if t_req > time_survived]
+            if remaining_candidates:
+                # Pick soonest
+                pat, secs = min(remaining_candidates, key=lambda x: x[1])
+                display = self.pattern_display_names.get(pat, pat.title())
+                hud.set_text('next_unlock', f"Next Pattern: {display} in {secs}s")
             else:
-                coords = self.canvas.coords(bullet)
-                if (not coords or coords[1] > self.height or coords[0] < -60 or coords[2] > self.width + 60 or life <= 0):
-                    try:
-                        self.canvas.delete(bullet)
-                    except Exception:
-                        pass
-                    # Remove using safe search if idx stale
-                    try:
-                        self.homing_bullets.remove(self.homing_bullets[idx])
-                    except Exception:
-                        # fallback linear remove by id match
-                        for _t in self.homing_bullets:
-                            if _t[0] == bullet:
-                                self.homing_bullets.remove(_t)
-                                break
-                    self.score += 3
-            if bullet not in self.grazed_bullets and self.check_graze(bullet):
-                self.score += 1
-                self.grazed_bullets.add(bullet)
-                self.show_graze_effect()
-                if self.focus_active:
-                    self.focus_charge = min(1.0, self.focus_charge + self.focus_charge_graze_bonus)
-                    if self.focus_charge >= self.focus_charge_threshold:
-                        self.focus_charge_ready = True
-
-        # ---------------- Move spiral bullets ----------------
-        for sp_tuple in self.spiral_bullets[:]:
-            bullet, angle, radius, ang_speed, rad_speed, cx, cy = sp_tuple
-            angle += ang_speed
-            radius += rad_speed
-            x = cx + _cos(angle) * radius
-            y = cy + _sin(angle) * radius
-            size = 20
-            self.canvas.coords(bullet, x-size/2, y-size/2, x+size/2, y+size/2)
-            # Collision & removal
-            if self.check_collision(bullet):
-                if not self.practice_mode:
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self.end_game()
-                self.canvas.delete(bullet)
-                self.spiral_bullets.remove(sp_tuple)
-                continue
-            if (x < -40 or x > self.width + 40 or y < -40 or y > self.height + 40 or radius > max(self.width, self.height)):
-                self.canvas.delete(bullet)
-                self.spiral_bullets.remove(sp_tuple)
-                self.score += 2
-                continue
-            # Update tuple
-            idx = self.spiral_bullets.index(sp_tuple)
-            self.spiral_bullets[idx] = (bullet, angle, radius, ang_speed, rad_speed, cx, cy)
-            if bullet not in self.grazed_bullets and self.check_graze(bullet):
-                self.score += 1
-                self.grazed_bullets.add(bullet)
-                self.show_graze_effect()
-                if self.focus_active:
-                    self.focus_charge = min(1.0, self.focus_charge + self.focus_charge_graze_bonus)
-                    if self.focus_charge >= self.focus_charge_threshold:
-                        self.focus_charge_ready = True
-
-        # ---------------- Move radial burst bullets ----------------
-        for rb_tuple in self.radial_bullets[:]:
-            bullet, vx, vy = rb_tuple
-            self.canvas.move(bullet, vx, vy)
-            if self.check_collision(bullet):
-                if not self.practice_mode:
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self.end_game()
-                self.canvas.delete(bullet)
-                self.radial_bullets.remove(rb_tuple)
-                continue
-            coords = self.canvas.coords(bullet)
-            if (not coords or coords[2] < -20 or coords[0] > self.width + 20 or coords[3] < -20 or coords[1] > self.height + 20):
-                self.canvas.delete(bullet)
-                self.radial_bullets.remove(rb_tuple)
-                self.score += 1
-                continue
-            if bullet not in self.grazed_bullets and self.check_graze(bullet):
-                self.score += 1
-                self.grazed_bullets.add(bullet)
-                self.show_graze_effect()
-                if self.focus_active:
-                    self.focus_charge = min(1.0, self.focus_charge + self.focus_charge_graze_bonus)
-                    if self.focus_charge >= self.focus_charge_threshold:
-                        self.focus_charge_ready = True
+                hud.set_text('next_unlock', "All patterns unlocked")
 
-        # ---------------- Move wave bullets ----------------
-        for wtuple in self.wave_bullets[:]:
-            bullet, base_x, phase, amp, vy, phase_speed = wtuple
-            phase += phase_speed
-            # Get current bullet coords to compute center y
-            bx1, by1, bx2, by2 = self.canvas.coords(bullet)
-            height = by2 - by1
-            # Vertical move
-            self.canvas.move(bullet, 0, vy)
-            # Recompute center after vertical move
-            bx1, by1, bx2, by2 = self.canvas.coords(bullet)
-            cy = (by1 + by2)/2
-            cx = base_x + _sin(phase) * amp
-            size = bx2 - bx1
-            self.canvas.coords(bullet, cx-size/2, cy-height/2, cx+size/2, cy+height/2)
-            if self.check_collision(bullet):
-                if not self.practice_mode:
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self.end_game()
-                self.canvas.delete(bullet)
-                self.wave_bullets.remove(wtuple)
-                continue
-            if cy > self.height + 30:
-                self.canvas.delete(bullet)
-                self.wave_bullets.remove(wtuple)
-                self.score += 2
-                continue
-            idx = self.wave_bullets.index(wtuple)
-            self.wave_bullets[idx] = (bullet, base_x, phase, amp, vy, phase_speed)
-            if bullet not in self.grazed_bullets and self.check_graze(bullet):
-                self.score += 1
-                self.grazed_bullets.add(bullet)
-                self.show_graze_effect()
-                if self.focus_active:
-                    self.focus_charge = min(1.0, self.focus_charge + self.focus_charge_graze_bonus)
-                    if self.focus_charge >= self.focus_charge_threshold:
-                        self.focus_charge_ready = True
+        profiler.lap('hud')
 
-        # ---------------- Move boomerang bullets ----------------
-        for btuple in self.boomerang_bullets[:]:
-            bullet, vy, timer, state = btuple
-            if state == 'down':
-                self.canvas.move(bullet, 0, vy)
-                timer -= 1
-                if timer <= 0:
-                    state = 'up'
-            else:  # up
-                self.canvas.move(bullet, 0, -vy*0.8)
-            coords = self.canvas.coords(bullet)
-            if self.check_collision(bullet):
-                if not self.practice_mode:
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self.end_game()
-                self.canvas.delete(bullet)
-                self.boomerang_bullets.remove(btuple)
-                continue
-            if not coords or coords[3] < -30 or coords[1] > self.height + 40:
-                self.canvas.delete(bullet)
-                self.boomerang_bullets.remove(btuple)
-                self.score += 3
-                continue
-            idx = self.boomerang_bullets.index(btuple)
-            self.boomerang_bullets[idx] = (bullet, vy, timer, state)
-            if bullet not in self.grazed_bullets and self.check_graze(bullet):
-                self.score += 1
-                self.grazed_bullets.add(bullet)
-                self.show_graze_effect()
-                if self.focus_active:
-                    self.focus_charge = min(1.0, self.focus_charge + self.focus_charge_graze_bonus)
-                    if self.focus_charge >= self.focus_charge_threshold:
-                        self.focus_charge_ready = True
-
-        # ---------------- Move split bullets ----------------
-        for stuple in self.split_bullets[:]:
-            bullet, timer = stuple
-            self.canvas.move(bullet, 0, 5 + self.difficulty/4)
-            timer -= 1
-            coords = self.canvas.coords(bullet)
-            if timer <= 0 and coords:
-                # Split into fragments (6) moving outward in a circle
-                bx = (coords[0] + coords[2]) / 2
-                by = (coords[1] + coords[3]) / 2
-                frag_count = 6
-                frag_speed = 4 + self.difficulty/5
-                for i in range(frag_count):
-                    ang = (2*math.pi/frag_count)*i
-                    vx = _cos(ang) * frag_speed
-                    vy2 = _sin(ang) * frag_speed
-                    frag = self.canvas.create_oval(bx-10, by-10, bx+10, by+10, fill="#ff55ff")
-                    self.radial_bullets.append((frag, vx, vy2))
-                self.canvas.delete(bullet)
-                self.split_bullets.remove(stuple)
-                self.score += 3
-                continue
-            if self.check_collision(bullet):
-                if not self.practice_mode:
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self.end_game()
-                self.canvas.delete(bullet)
-                self.split_bullets.remove(stuple)
-                continue
-            if coords and coords[1] > self.height:
-                self.canvas.delete(bullet)
-                self.split_bullets.remove(stuple)
-                self.score += 2
-                continue
-            idx = self.split_bullets.index(stuple)
-            self.split_bullets[idx] = (bullet, timer)
-            if bullet not in self.grazed_bullets and self.check_graze(bullet):
-                self.score += 1
-                self.grazed_bullets.add(bullet)
-                self.show_graze_effect()
-                if self.focus_active:
-                    self.focus_charge = min(1.0, self.focus_charge + self.focus_charge_graze_bonus)
-                    if self.focus_charge >= self.focus_charge_threshold:
-                        self.focus_charge_ready = True
+        # Sync the canvas view once per frame
+        self.bullet_view.sync()
+        profiler.lap('sync')
 
         # Mid-screen lore fragment display (spawn + blink + expire)
         try:
@@ -3736,12 +2887,12 @@ class bullet_hell_game:
             if getattr(self, '_mid_lore_items', None) is not None:
                 for item in self._mid_lore_items[:]:
                     ids = item.get('ids', [])
-                    life = item.get('life', 0)
-                    life -= 1
+                    life = item.get('life', 0)  # seconds left
+                    life -= dt
                     item['life'] = life
-                    # Blink during final 15 frames
-                    if life < 15:
-                        blink_hidden = (life % 4) in (0,1)
+                    # Blink during the final 0.75 s, hidden for the first half of every 0.2 s
+                    if life < 0.75:
+                        blink_hidden = (life % 0.2) < 0.1
                         state = 'hidden' if blink_hidden else 'normal'
                         for oid in ids:
                             try: self.canvas.itemconfig(oid, state=state)
@@ -3753,11 +2904,7 @@ class bullet_hell_game:
                         self._mid_lore_items.remove(item)
         except Exception:
             pass
-
-        self.root.after(50, self.update_game)
-        # Update Debug HUD late so counts reflect this frame's state
-        if self.debug_hud_enabled:
-            self._update_debug_hud()
+        profiler.lap('lore')
 
     # ---------------- Static Trap (voidy static escape) ----------------
     def _static_can_trigger_trap(self):
@@ -3781,7 +2928,9 @@ class bullet_hell_game:
             return
         self.static_trap_active = True
         self.static_trap_progress = 0.0
-        self.static_trap_end_time = time.time() + self.static_trap_time_limit
+        # Trap time is counted from the loop's frame times, since game time stands still
+        self.static_trap_elapsed = 0.0
+        self.loop_clock.restart_frame_time()
         # Overlay dark + noise rectangles
         try:
             self.static_trap_overlay = self.canvas.create_rectangle(0,0,self.width,self.height, fill="#000000", outline="")
@@ -3789,16 +2938,15 @@ class bullet_hell_game:
         except Exception:
             self.static_trap_overlay = None
         # spawn noise blocks
-        import random as _r
         for _ in range(120):
-            w = _r.randint(8,40); h=_r.randint(4,20)
-            x = _r.randint(0, self.width-w)
-            y = _r.randint(0, self.height-h)
-            col = _r.choice(["#111111","#222222","#444444","#666666","#999999","#bbbbbb"])
+            w = self.fx_rng.randint(8,40); h=self.fx_rng.randint(4,20)
+            x = self.fx_rng.randint(0, self.width-w)
+            y = self.fx_rng.randint(0, self.height-h)
+            col = self.fx_rng.choice(["#111111","#222222","#444444","#666666","#999999","#bbbbbb"])
             try:
                 rid = self.canvas.create_rectangle(x,y,x+w,y+h, fill=col, outline="")
                 self.static_trap_noise_items.append(rid)
-                self.canvas.tag_lower(rid)
+                self.layers.place(rid, 'tint')
             except Exception:
                 pass
         # Text prompt
@@ -3806,18 +2954,24 @@ class bullet_hell_game:
             self.static_trap_text = self.canvas.create_text(self.width//2, self.height//2, text="STATIC INTERFERENCE\nMash A / D or Left / Right to ESCAPE", fill="#cccccc", font=("Arial", 32, "bold"), justify='center')
         except Exception:
             self.static_trap_text = None
-        # Ensure overlay behind text
+        # Overlay behind the noise, text over everything
         if self.static_trap_overlay:
-            try: self.canvas.tag_lower(self.static_trap_overlay)
-            except Exception: pass
+            self.layers.place(self.static_trap_overlay, 'background')
+        if self.static_trap_text:
+            self.layers.place(self.static_trap_text, 'overlay')
         # capture last key None
         self._static_trap_last_key = None
 
     def _handle_static_trap_key(self, event):
+        self._static_trap_key(event.keysym.lower())
+
+    def _static_trap_key(self, key, at=None):
+        """Mash input during the trap; `at` is the trap time it was made at, kept so replays can pace it."""
         if not self.static_trap_active:
             return
-        key = event.keysym.lower()
         if key in ('left','a','right','d'):
+            if not self._take_input('trap', key, round(self.static_trap_elapsed, 3)):
+                return
             if self._static_trap_last_key is None or (key in ('left','a') and self._static_trap_last_key in ('right','d')) or (key in ('right','d') and self._static_trap_last_key in ('left','a')):
                 # alternate increases progress more
                 self.static_trap_progress += 0.065
@@ -3830,30 +2984,36 @@ class bullet_hell_game:
                 # update text with progress
                 if self.static_trap_text:
                     try:
-                        remain = max(0.0, self.static_trap_end_time - time.time())
+                        remain = max(0.0, self.static_trap_time_limit - self.static_trap_elapsed)
                         self.canvas.itemconfig(self.static_trap_text, text=f"STATIC INTERFERENCE\nESCAPE {int(self.static_trap_progress*100)}% | {remain:0.1f}s")
                     except Exception:
                         pass
 
-    def _update_static_trap(self):
+    def _update_static_trap(self, dt):
         # countdown & animate noise flicker
-        now = time.time()
-        if now >= self.static_trap_end_time:
+        self.static_trap_elapsed += dt
+        if self.replay is not None:
+            # Recorded mashes are applied once the trap reaches the time they were made at
+            self._replay_step()
+            if not self.static_trap_active:
+                return
+        if self.static_trap_elapsed >= self.static_trap_time_limit:
             self.end_static_trap(escaped=False)
             return
-        # flicker: randomly hide/show subset
-        import random as _r
+        # flicker: randomly hide/show subset (each block about twice a second)
+        flicker = min(1.0, 2.0 * dt)
         for rid in self.static_trap_noise_items:
             try:
-                if _r.random() < 0.1:
-                    state = 'hidden' if _r.random() < 0.5 else 'normal'
+                if self.fx_rng.random() < flicker:
+                    state = 'hidden' if self.fx_rng.random() < 0.5 else 'normal'
                     self.canvas.itemconfig(rid, state=state)
             except Exception:
                 pass
-        # slow auto drift to make it feel alive
+        # slow auto drift to make it feel alive (about 20 px/s of jitter)
+        jitter = 20 * dt
         for rid in self.static_trap_noise_items:
             try:
-                dx = _r.randint(-1,1); dy=_r.randint(-1,1)
+                dx = self.fx_rng.uniform(-jitter, jitter); dy = self.fx_rng.uniform(-jitter, jitter)
                 self.canvas.move(rid, dx, dy)
             except Exception:
                 pass
@@ -3868,7 +3028,7 @@ class bullet_hell_game:
         # Update timing text if exists
         if self.static_trap_text:
             try:
-                remain = max(0.0, self.static_trap_end_time - now)
+                remain = max(0.0, self.static_trap_time_limit - self.static_trap_elapsed)
                 self.canvas.itemconfig(self.static_trap_text, text=f"STATIC INTERFERENCE\nESCAPE {int(self.static_trap_progress*100)}% | {remain:0.1f}s")
             except Exception:
                 pass
@@ -3893,7 +3053,7 @@ class bullet_hell_game:
         if escaped:
             # reward & brief invulnerability
             self.score += 15
-            self.static_trap_invuln_end = time.time() + 2.0
+            self.static_trap_invuln_end = self.game_time + 2.0
             try:
                 txt = self.canvas.create_text(self.width//2, self.height//2 - 100, text="ESCAPED +15", fill="#cccccc", font=("Arial", 28, "bold"))
                 self.canvas.after(1400, lambda tid=txt: (self.canvas.delete(tid) if self.canvas.type(tid) else None))
@@ -3910,22 +3070,26 @@ class bullet_hell_game:
             return
         if self.focus_pulse_cooldown > 0:
             return
+        if not self._take_input('focus'):
+            return
         self.focus_active = True
 
     def _focus_key_released(self, event=None):
         if not self.focus_active:
             return
+        if not self._take_input('unfocus'):
+            return
         # Trigger pulse if charged
         if self.focus_charge_ready and self.focus_charge >= self.focus_charge_threshold:
             self._trigger_focus_pulse()
         self.focus_active = False
 
-    def _update_focus_charge(self):
+    def _update_focus_charge(self, dt):
         if self.game_over or self.paused:
             return
         if self.focus_active and not self.focus_charge_ready:
             if self.focus_pulse_cooldown <= 0:
-                self.focus_charge = min(1.0, self.focus_charge + self.focus_charge_rate)
+                self.focus_charge = min(1.0, self.focus_charge + self.focus_charge_rate * dt)
                 if self.focus_charge >= self.focus_charge_threshold:
                     self.focus_charge_ready = True
 
@@ -3939,89 +3103,14 @@ class bullet_hell_game:
             return
 
         radius = self.focus_pulse_radius
-        radius_sq = radius * radius
-        removed = 0
-
-        def within_radius(bullet_id):
-            """Return True if the bullet center is within the pulse radius."""
-            try:
-                c = self.canvas.coords(bullet_id)
-                if not c:
-                    return False
-                if len(c) == 4:
-                    bx = (c[0] + c[2]) / 2
-                    by = (c[1] + c[3]) / 2
-                else:
-                    xs = c[0::2]
-                    ys = c[1::2]
-                    bx = sum(xs) / len(xs)
-                    by = sum(ys) / len(ys)
-                dx = bx - pcx
-                dy = by - pcy
-                return dx*dx + dy*dy <= radius_sq
-            except Exception:
-                return False
-
-        def clean_simple_list(container):
-            nonlocal removed
-            for b in container[:]:
-                if within_radius(b):
-                    try:
-                        self.canvas.delete(b)
-                    except Exception:
-                        pass
-                    try:
-                        container.remove(b)
-                    except ValueError:
-                        pass
-                    removed += 1
-    
-        def clean_tuple_list(container, idx=0):
-            """For containers like [(bullet_id, ...)], delete based on container[idx]."""
-            nonlocal removed
-            for entry in container[:]:
-                b = entry[idx]
-                if within_radius(b):
-                    try:
-                        self.canvas.delete(b)
-                    except Exception:
-                        pass
-                    try:
-                        container.remove(entry)
-                    except ValueError:
-                        pass
-                    removed += 1
-    
-        # Clean each bullet family properly
-        clean_simple_list(self.bullets)
-        clean_simple_list(self.bullets2)
-        clean_tuple_list(self.triangle_bullets, 0)
-        clean_tuple_list(self.diag_bullets, 0)
-        clean_simple_list(self.boss_bullets)
-        clean_tuple_list(self.zigzag_bullets, 0)
-        clean_simple_list(self.fast_bullets)
-        clean_simple_list(self.star_bullets)
-        clean_simple_list(self.rect_bullets)
-        clean_simple_list(self.egg_bullets)
-        clean_simple_list(self.quad_bullets)
-        clean_tuple_list(self.exploding_bullets if isinstance(self.exploding_bullets, list) else [], 0)
-        clean_tuple_list(self.exploded_fragments, 0)
-        clean_tuple_list(self.bouncing_bullets, 0)
-        clean_tuple_list(self.homing_bullets, 0)
-        clean_tuple_list(self.spiral_bullets, 0)
-        clean_tuple_list(self.radial_bullets, 0)
-        clean_tuple_list(self.wave_bullets, 0)
-        clean_tuple_list(self.boomerang_bullets, 0)
-        clean_tuple_list(self.split_bullets, 0)
+        removed = self.sim.clear_radius(pcx, pcy, radius)
 
         # Score reward
         self.score += removed * 2
 
-        # Visual expanding ring
+        # Visual expanding ring, reaching the pulse radius as it fades out
         try:
-            ring = self.canvas.create_oval(pcx-10, pcy-10, pcx+10, pcy+10,
-                                       outline="#66ffdd", width=3)
-            self.focus_pulse_visuals.append((ring, 18, radius/18))  # life frames, grow per frame
+            self.particles.spawn('pulse', pcx, pcy, life=0.9, w=20, grow=radius/0.9)
         except Exception:
             pass
 
@@ -4030,33 +3119,6 @@ class bullet_hell_game:
         self.focus_charge_ready = False
         self.focus_pulse_cooldown = self.focus_pulse_cooldown_time
     
-    def _update_focus_visuals(self):
-        if not self.focus_pulse_visuals:
-            return
-        new = []
-        for oid, life, grow in self.focus_pulse_visuals:
-            life -= 1
-            try:
-                x1,y1,x2,y2 = self.canvas.coords(oid)
-                cx = (x1+x2)/2; cy=(y1+y2)/2
-                nx1 = cx - ( (x2-x1)/2 + grow)
-                nx2 = cx + ( (x2-x1)/2 + grow)
-                ny1 = cy - ( (y2-y1)/2 + grow)
-                ny2 = cy + ( (y2-y1)/2 + grow)
-                self.canvas.coords(oid, nx1, ny1, nx2, ny2)
-                # Fade color
-                frac = max(0.0, life/18)
-                col = int(0x66*frac), int(0xff*frac), int(0xdd*frac)
-                self.canvas.itemconfig(oid, outline=f"#{col[0]:02x}{col[1]:02x}{col[2]:02x}")
-            except Exception:
-                life = 0
-            if life > 0:
-                new.append((oid, life, grow))
-            else:
-                try: self.canvas.delete(oid)
-                except Exception: pass
-        self.focus_pulse_visuals = new
-
     # ---------------- Debug HUD ----------------
     def toggle_debug_hud(self, event=None):
         self.debug_hud_enabled = not self.debug_hud_enabled
@@ -4067,14 +3129,15 @@ class bullet_hell_game:
 
     def _update_debug_hud(self):
         try:
+            c = self.sim.counts()
             counts = {
-                'vert': len(self.bullets), 'horiz': len(self.bullets2), 'tri': len(self.triangle_bullets),
-                'diag': len(self.diag_bullets), 'boss': len(self.boss_bullets), 'zig': len(self.zigzag_bullets),
-                'fast': len(self.fast_bullets), 'star': len(self.star_bullets), 'rect': len(self.rect_bullets),
-                'egg': len(self.egg_bullets), 'quad': len(self.quad_bullets), 'bounc': len(self.bouncing_bullets),
-                'expl': len(self.exploding_bullets) + len(self.exploded_fragments), 'hom': len(self.homing_bullets),
-                'spir': len(self.spiral_bullets), 'rad': len(self.radial_bullets), 'wave': len(self.wave_bullets),
-                'boom': len(self.boomerang_bullets), 'split': len(self.split_bullets), 'las': len(self.lasers)
+                'vert': c['vertical'], 'horiz': c['horizontal'], 'tri': c['triangle'],
+                'diag': c['diag'], 'boss': c['boss'], 'zig': c['zigzag'],
+                'fast': c['fast'], 'star': c['star'], 'rect': c['rect'],
+                'egg': c['egg'], 'quad': c['quad'], 'bounc': c['bouncing'],
+                'expl': c['exploding'] + c['fragment'], 'hom': c['homing'],
+                'spir': c['spiral'], 'rad': c['radial'] + c['split_shard'], 'wave': c['wave'],
+                'boom': c['boomerang'], 'split': c['split'], 'las': c['laser']
             }
         except Exception:
             counts = {}
@@ -4091,26 +3154,31 @@ class bullet_hell_game:
         if self.rewind_pending and not self.rewind_active: eff.append('REWIND-Q')
         if self.focus_active: eff.append('FOCUS')
         if self.focus_charge_ready: eff.append('PULSE READY')
+        if self.stress is not None: eff.append(f'STRESS x{self.stress.boost(self.game_time):.1f}')
         eff_str = ','.join(eff) if eff else 'None'
         focus_pct = int(self.focus_charge*100)
         lines = [
             '== DEBUG HUD (F3)==',
             f'Bullets Total:{total}  '+ ' '.join(f"{k}:{v}" for k,v in counts.items()),
             f'Frame ms avg:{avg:.1f} best:{best:.1f} worst:{worst:.1f}',
+            f'Loop: tick {rate_label(self.loop_clock.sim_rate)} frame {rate_label(self.loop_clock.render_rate)}'
+            f'  cost {self.loop_clock.wake_cost*1000:.1f}ms draw {self.loop_clock.render_cost*1000:.1f}ms'
+            f'  canvas errors {self.render_batch.failed}',
             f'Effects: {eff_str}',
+            f'Quality: {self.quality.current.name}  particles {self.particles.count()}/{self.particles.cap}',
             f'Focus: {focus_pct}%'+(' READY' if self.focus_charge_ready else ''),
+            *self.profiler.summary(),
         ]
         txt = '\n'.join(lines)
         if self._debug_hud_text_id is None:
             try:
                 self._debug_hud_text_id = self.canvas.create_text(8, 80, text=txt, anchor='nw', fill='#7cffd9', font=('Consolas', 11))
+                self.layers.place(self._debug_hud_text_id, 'overlay')
             except Exception:
                 return
         else:
             try: self.canvas.itemconfig(self._debug_hud_text_id, text=txt)
             except Exception: pass
-        try: self.canvas.lift(self._debug_hud_text_id)
-        except Exception: pass
 
     def init_lore(self):
         """Initialize lore fragments from external lore.txt file.
@@ -4193,7 +3261,6 @@ class bullet_hell_game:
         now = time.time()
         if not force and now - getattr(self, 'lore_last_change', 0) < getattr(self, 'lore_interval', 8):
             return
-        import random
         pool = []
         prev = getattr(self, 'current_lore_line', None)
         # Support both old dict-of-lists structure and new single 'all' list
@@ -4211,7 +3278,7 @@ class bullet_hell_game:
             return
         if not pool:
             return
-        line = random.choice(pool)
+        line = self.fx_rng.choice(pool)
         self.current_lore_line = line
         try:
             if getattr(self, 'lore_text', None) is not None:
@@ -4252,10 +3319,10 @@ class bullet_hell_game:
         
         # Decorative stars/particles
         for _ in range(30):
-            x = random.randint(0, self.width)
-            y = random.randint(0, self.height)
-            size = random.randint(2, 6)
-            brightness = random.randint(150, 255)
+            x = self.fx_rng.randint(0, self.width)
+            y = self.fx_rng.randint(0, self.height)
+            size = self.fx_rng.randint(2, 6)
+            brightness = self.fx_rng.randint(150, 255)
             color = f"#{brightness:02x}{brightness:02x}{brightness:02x}"
             self.canvas.create_oval(x-size//2, y-size//2, x+size//2, y+size//2, fill=color, outline="", tags="menu")
         
@@ -4540,6 +3607,54 @@ class bullet_hell_game:
             fill="#ffff66", font=("Arial", 20, "bold"),
             anchor="e", tags="settings"
         )
+        
+        # Simulation rate
+        y_pos += y_spacing
+        self.canvas.create_text(
+            label_x, y_pos,
+            text="⏱ Tick Rate:", fill="#66ffcc", font=("Arial", 20, "bold"),
+            anchor="w", tags="settings"
+        )
+        self.settings_sim_rate_text = self.canvas.create_text(
+            value_x, y_pos,
+            text=rate_label(self.settings['sim_rate']),
+            fill="#ffff66", font=("Arial", 20, "bold"),
+            anchor="e", tags="settings"
+        )
+        
+        # Render rate
+        y_pos += y_spacing
+        self.canvas.create_text(
+            label_x, y_pos,
+            text="▣ Frame Rate:", fill="#66ffcc", font=("Arial", 20, "bold"),
+            anchor="w", tags="settings"
+        )
+        self.settings_render_rate_text = self.canvas.create_text(
+            value_x, y_pos,
+            text=rate_label(self.settings['render_rate']),
+            fill="#ffff66", font=("Arial", 20, "bold"),
+            anchor="e", tags="settings"
+        )
+        self.canvas.create_text(
+            value_x, y_pos + 24,
+            text="frames only follow ticks, so capped at the tick rate",
+            fill="#888888", font=("Arial", 11),
+            anchor="e", tags="settings"
+        )
+        
+        # Background mode
+        y_pos += y_spacing
+        self.canvas.create_text(
+            label_x, y_pos,
+            text="▦ Background:", fill="#66ffcc", font=("Arial", 20, "bold"),
+            anchor="w", tags="settings"
+        )
+        self.settings_background_text = self.canvas.create_text(
+            value_x, y_pos,
+            text=self.settings['background_mode'].capitalize(),
+            fill="#ffff66", font=("Arial", 20, "bold"),
+            anchor="e", tags="settings"
+        )
 
         
         # Player Speed
@@ -4565,13 +3680,13 @@ class bullet_hell_game:
         )
         self.canvas.create_text(
             self.width // 2, inst_box_y + 20,
-            text="Press 1-5 to select  •  Use [ ] to adjust",
+            text="Press 1-8 to select  •  Use [ ] to adjust",
             fill="#aaaaaa", font=("Arial", 16),
             justify="center", tags="settings"
         )
         self.canvas.create_text(
             self.width // 2, inst_box_y + 50,
-            text="1: Master  |  2: Music  |  3: SFX  |  4: Difficulty  |  5: Speed",
+            text="1: Master  |  2: Music  |  3: SFX  |  4: Difficulty  |  5: Speed  |  6: Tick Rate  |  7: Frame Rate  |  8: Background",
             fill="#888888", font=("Arial", 12),
             tags="settings"
         )
@@ -4641,6 +3756,9 @@ class bullet_hell_game:
         self.root.bind('3', lambda e: self.select_setting('sfx_volume'))
         self.root.bind('4', lambda e: self.select_setting('difficulty'))
         self.root.bind('5', lambda e: self.select_setting('player_speed'))
+        self.root.bind('6', lambda e: self.select_setting('sim_rate'))
+        self.root.bind('7', lambda e: self.select_setting('render_rate'))
+        self.root.bind('8', lambda e: self.select_setting('background_mode'))
         self.root.bind('[', lambda e: self.adjust_setting(-1))
         self.root.bind(']', lambda e: self.adjust_setting(1))
     
@@ -4678,6 +3796,21 @@ class bullet_hell_game:
             self.settings['player_speed'] = max(5, min(30, self.settings['player_speed'] + direction * 2))
             self.canvas.itemconfig(self.settings_speed_text, text=str(self.settings['player_speed']))
             self.player_speed = self.settings['player_speed']
+        elif self.settings_selected in ('sim_rate', 'render_rate'):
+            # Step through the preset rates; applied when the next game starts.
+            # Frames only follow ticks, so only frame caps below the tick rate are offered.
+            choices = SIM_RATES if self.settings_selected == 'sim_rate' else render_choices(self.settings['sim_rate'])
+            current = self.settings[self.settings_selected]
+            idx = choices.index(current) if current in choices else 0
+            self.settings[self.settings_selected] = choices[max(0, min(len(choices) - 1, idx + direction))]
+            if self.settings['render_rate'] not in render_choices(self.settings['sim_rate']):
+                self.settings['render_rate'] = 0
+            self.canvas.itemconfig(self.settings_sim_rate_text, text=rate_label(self.settings['sim_rate']))
+            self.canvas.itemconfig(self.settings_render_rate_text, text=rate_label(self.settings['render_rate']))
+        elif self.settings_selected == 'background_mode':
+            # Applied when the next game starts
+            self.settings['background_mode'] = 'live' if self.settings['background_mode'] == 'baked' else 'baked'
+            self.canvas.itemconfig(self.settings_background_text, text=self.settings['background_mode'].capitalize())
     
     def show_keybinds_menu(self):
         """Display the keybinds configuration menu."""
@@ -4943,8 +4076,33 @@ class bullet_hell_game:
     
     def _initialize_game(self):
         """Initialize all game state including player, bullets, boss, collectables, powerups, and UI elements for a new game session."""
+        # Seed this run. A replay brings its seed and gameplay settings; later
+        # runs are played live
+        self._finish_replay()
+        self._finish_telemetry('restart')
+        self._finish_stress()
+        source, self.replay_source = self.replay_source, None
+        if source is not None:
+            self.settings.update(source.settings)
+            self.unlock_times = self.settings['unlock_times']
+            source.start_playback()
+            self.replay = source
+            seed = source.seed
+        else:
+            seed = self.session_rng.getrandbits(32)
+            if self.record_path:
+                self.replay = Replay.record_new(seed, self.settings)
+        self.seed = seed
+        self.rng.seed(seed)
+        self.sim_ticks = 0
+        self.game_time = 0.0
+        self._replay_checked = -1
+        # Per-frame item updates are queued here and sent to Tcl in one script
+        self.render_batch = CanvasBatch(self.canvas)
         # Initialize animated vaporwave grid background
         self.init_background()
+        # Stacking layers; everything created so far (the grid) is background
+        self.layers = CanvasLayers(self.canvas)
         # Create player (base hitbox rectangle + decorative layers)
         self.player = None
         self.player_deco_items = []
@@ -4952,34 +4110,29 @@ class bullet_hell_game:
         self.player_rgb_phase = 0.0
         self.create_player_sprite()
         
-        # Initialize all bullet containers
-        self.bullets = []
-        self.bullets2 = []
-        self.triangle_bullets = []
-        self.diag_bullets = []
-        self.boss_bullets = []
-        self.zigzag_bullets = []
-        self.fast_bullets = []
-        self.star_bullets = []
-        self.rect_bullets = []
-        self.egg_bullets = []
-        self.quad_bullets = []
-        self.exploding_bullets = []
-        self.exploded_fragments = []
-        self.bouncing_bullets = []
-        self.laser_indicators = []
-        self.lasers = []
-        self.homing_bullets = []
-        self.spiral_bullets = []
-        self.radial_bullets = []
-        self.wave_bullets = []
-        self.boomerang_bullets = []
-        self.split_bullets = []
-        self.static_bullets = []
+        # Bullet state lives in the headless simulation; the canvas view mirrors it
+        self.sim = BulletSimulation(self.width, self.height)
+        self.sim.profile = self.profiler
+        # Pooled canvas items for bullets and short-lived effects, pre-warmed so
+        # the first bursts do not allocate
+        self.item_pool = ItemPool(self.canvas, self.layers)
+        for item_type, count in (('oval', 200), ('rectangle', 120), ('polygon', 40), ('line', 4)):
+            self.item_pool.prewarm(item_type, count)
+        self.bullet_view = BulletCanvasView(self.canvas, self.sim, self.item_pool, self.render_batch)
+        # Every drifting/fading effect, capped and drawn from the same pool
+        self.particles = ParticleSystem(self.item_pool, self.render_batch)
+        self._spawn_schedule = spawn_schedule()
+        self.loop_clock.configure(self.settings['sim_rate'], self.settings['render_rate'])
+        self.loop_clock.reset()
+        # Effect quality steps down when wake-ups run long, see quality.py
+        self.quality = QualityGovernor(self.loop_clock.sim_dt * 1000)
+        self.telemetry = SessionTelemetry(self.quality.budget_ms, seed, {
+            'sim_rate': self.settings['sim_rate'], 'render_rate': self.settings['render_rate'],
+            'difficulty_multiplier': self.settings['difficulty_multiplier'], 'headless': self.headless})
         
         # Initialize player shooting system
         self.player_shots = []  # [(shot_id, x, y)]
-        self.shot_speed = 12
+        self.shot_speed = 240  # px/s
         self.shot_cooldown = 0
         self.shot_cooldown_time = 0.15  # seconds between shots
         
@@ -5011,7 +4164,7 @@ class bullet_hell_game:
             "#88cc88", "#88ccaa", "#88cccc", "#88aacc", "#8888cc",
             "#aa88cc", "#cc88cc", "#cc88aa", "#dddddd", "#bbbbbb"
         ]
-        self.next_collectable_spawn = time.time() + 3  # First spawn after 3 seconds
+        self.next_collectable_spawn = 3.0  # First spawn after 3 seconds of play
         self.collectable_spawn_interval = 5  # Spawn every 5 seconds
         self.collectable_display_text = None
         
@@ -5021,8 +4174,8 @@ class bullet_hell_game:
         self.boss_y = 100
         self.boss_width = 80
         self.boss_height = 80
-        self.boss_vx = 3
-        self.boss_vy = 2
+        self.boss_vx = 60  # px/s
+        self.boss_vy = 40
         self.boss_health_display = 0  # Visual "damage" counter
         self.boss_flash_timer = 0
         self.spawn_boss()
@@ -5030,7 +4183,7 @@ class bullet_hell_game:
         # Initialize static trap state
         self.static_trap_active = False
         self.static_trap_progress = 0.0
-        self.static_trap_end_time = 0.0
+        self.static_trap_elapsed = 0.0  # seconds since the trap began
         self.static_trap_time_limit = 4.0
         self.static_trap_noise_items = []
         self.static_trap_overlay = None
@@ -5039,12 +4192,12 @@ class bullet_hell_game:
         self._static_trap_last_key = None
         
         # Initialize freeze state
+        self.powerup_fall_speed = 80  # px/s, shared by every power-up
         self.freeze_powerups = []
         self.freeze_active = False
         self.freeze_end_time = 0.0
         self.freeze_text = None
         self.freeze_overlay = None
-        self.freeze_particles = []
         self.freeze_particle_spawn_accum = 0
         self.freeze_mode = 'full'
         self.freeze_motion_factor = 0.25
@@ -5052,26 +4205,24 @@ class bullet_hell_game:
         self.freeze_tint_progress = 0.0
         self.freeze_tint_target = 0.0
         self.freeze_tint_fade_speed = 0.08
-        self._last_freeze_tint_progress = -1.0
-        self._bullet_original_fills = {}
+        self._freeze_tint_step = 0
         
         # Initialize rewind state
         self.rewind_powerups = []
         self.rewind_active = False
         self.rewind_end_time = 0.0
         self.rewind_text = None
-        self._bullet_history = []
-        self._bullet_history_max = 180
+        self._bullet_history_max = int(round(9.0 / self.loop_clock.sim_dt))  # 9 seconds of ticks
+        self._bullet_history = RewindHistory(self._bullet_history_max)
         self._rewind_pointer = None
         self._rewind_capture_skip = 0
         self._rewind_speed = 2
         self._rewind_overlay = None
         self.rewind_pending = False
         self._pending_rewind_duration = 3.0
-        self._rewind_ghosts = []
-        self._rewind_ghost_life = 10
+        self._rewind_ghost_life = 0.5  # seconds
         self._rewind_ghost_spawn_skip = 0
-        self._rewind_ghost_cap = 300
+        self._apply_quality_tier()  # sets the ghost cap and flake rate
         self._rewind_start_sound = None
         self._rewind_end_sound = None
         self._rewind_start_bullet_count = 0
@@ -5087,7 +4238,6 @@ class bullet_hell_game:
         self.shield_hits_remaining = 0
         self.shield_visual = None
         self.shield_text = None
-        self.shield_particles = []
         self._shield_sound = None
         
         # Initialize slow-motion state (optimized)
@@ -5097,20 +4247,21 @@ class bullet_hell_game:
         self.slowmo_factor = 0.35
         self.slowmo_overlay = None
         self.slowmo_text = None
-        self.slowmo_particles = []
         self._slowmo_sound = None
         self._slowmo_prev_volume = None
         
         # Initialize game state
         self.score = 0
-        self.timee = int(time.time())
         self.dial = "Hi-hi-hi! Wanna play with me? I promise it'll be fun!"
-        self.scorecount = self.canvas.create_text(70, 20, text=f"Score: {self.score}", fill="white", font=("Arial", 16))
-        self.timecount = self.canvas.create_text(self.width-70, 20, text=f"Time: {self.timee}", fill="white", font=("Arial", 16))
-        self.dialog = self.canvas.create_text(self.width//2, 20, text=self.dial, fill="white", font=("Arial", 20), justify="center")
-        self.next_unlock_text = self.canvas.create_text(self.width//2, self.height-8, text="", fill="#88ddff", font=("Arial", 16), anchor='s')
-        self.boss_damage_text = self.canvas.create_text(self.width-70, 50, text=f"Boss Hits: {self.boss_health_display}", fill="#ff00ff", font=("Arial", 16))
-        self.collectable_display_text = self.canvas.create_text(70, 50, text=f"Items: {len(self.collected_items)}/{self.total_collectables}", fill="#ffff00", font=("Arial", 16))
+        # HUD items live for the whole game and are only rewritten on change
+        self.hud = Hud(self.canvas, self.layers)
+        self.scorecount = self.hud.add_text('score', 70, 20, text=f"Score: {self.score}", fill="white", font=("Arial", 16))
+        self.timecount = self.hud.add_text('time', self.width-70, 20, text="Time: 0", fill="white", font=("Arial", 16))
+        self.dialog = self.hud.add_text('dialog', self.width//2, 20, text=self.dial, fill="white", font=("Arial", 20), justify="center")
+        self.next_unlock_text = self.hud.add_text('next_unlock', self.width//2, self.height-8, text="", fill="#88ddff", font=("Arial", 16), anchor='s')
+        self._next_unlock_time = None
+        self.boss_damage_text = self.hud.add_text('boss_hits', self.width-70, 50, text=f"Boss Hits: {self.boss_health_display}", fill="#ff00ff", font=("Arial", 16))
+        self.collectable_display_text = self.hud.add_text('items', 70, 50, text=f"Items: {len(self.collected_items)}/{self.total_collectables}", fill="#ffff00", font=("Arial", 16))
         
         self.lives = 3
         self.health_icon_items = []
@@ -5129,22 +4280,19 @@ class bullet_hell_game:
         self.focus_charge = 0.0
         self.focus_charge_ready = False
         self.focus_charge_threshold = 1.0
-        self.focus_charge_rate = 0.004
+        self.focus_charge_rate = 0.08  # per second
         self.focus_charge_graze_bonus = 0.05
         self.focus_pulse_cooldown = 0.0
         self.focus_pulse_cooldown_time = 2.0
         self.focus_pulse_radius = 140
-        self.focus_pulse_visuals = []
         
         self.grazing_radius = 40
-        self.grazed_bullets = set()
+        self.sim.grazing_radius = self.grazing_radius
         self.graze_effect_id = None
-        self.paused_time_total = 0
-        self.pause_start_time = None
         
         self.practice_mode = False
         self.practice_text = None
-        self.homing_bullet_max_life = 180
+        self.homing_bullet_max_life = 9.0  # seconds
         self.player_speed = self.settings['player_speed']
         
         # Initialize lore
@@ -5154,6 +4302,7 @@ class bullet_hell_game:
             self.lore_last_change = time.time()
             self.current_lore_line = None
             self.lore_text = self.canvas.create_text(self.width//2, 50, text="", fill="#b0a8ff", font=("Courier New", 14), justify="center")
+            self.layers.place(self.lore_text, 'hud')
             self.update_lore_line(force=True)
         except Exception:
             pass
@@ -5195,8 +4344,10 @@ class bullet_hell_game:
         if getattr(self, 'go_anim_active', False):
             return
         self.go_anim_active = True
-        self.go_anim_particles = []
-        self.go_anim_frame = 0
+        self.go_anim_time = 0.0
+        self.go_glitch_spawn_accum = 0.0
+        self.go_next_sweep = 0.0
+        self.go_prompt_time = None
         # Glitch blackout sequence state (fix indentation)
         self.go_glitch_phase = 0  # 0 = glitching, 1 = fading to black, 2 = black hold
         self.go_glitch_rects = []
@@ -5221,53 +4372,56 @@ class bullet_hell_game:
         # Spawn radial particles from center
         cx = self.width//2
         cy = self.height//2
-        for i in range(60):
-            ang = random.uniform(0, 2*math.pi)
-            spd = random.uniform(2.5, 7.0)
-            vx = _cos(ang)*spd
-            vy = _sin(ang)*spd
-            size = random.randint(4,10)
-            pid = self.canvas.create_oval(cx-size//2, cy-size//2, cx+size//2, cy+size//2, fill="#ff55ff", outline="")
-            # life frames ~ fade duration
-            life = random.randint(35,70)
-            self.go_anim_particles.append((pid, vx, vy, life))
+        angles = [self.fx_rng.uniform(0, 2*math.pi) for _ in range(60)]
+        speeds = [self.fx_rng.uniform(50, 140) for _ in angles]
+        try:
+            self.particles.spawn('game_over', cx, cy,
+                                 [_cos(a)*v for a, v in zip(angles, speeds)],
+                                 [_sin(a)*v for a, v in zip(angles, speeds)],
+                                 [self.fx_rng.uniform(1.75, 3.5) for _ in angles],  # life ~ fade duration
+                                 [self.fx_rng.randint(4, 10) for _ in angles])
+        except Exception:
+            pass
+        # The game loop has stopped; the clock now paces this animation
+        self.loop_clock.reset()
         self.update_game_over_animation()
 
     def update_game_over_animation(self):
         if not getattr(self, 'go_anim_active', False):
             return
-        self.go_anim_frame += 1
+        dt = self.loop_clock.frame_time()
+        self.go_anim_time += dt
         # --- Phase 0: Spawn transient glitch rectangles ---
         if self.go_glitch_phase == 0:
-            # spawn a few per frame early on
-            spawn_ct = 6
-            import random
+            # spawn about 120 a second early on
+            self.go_glitch_spawn_accum += 120 * dt
+            spawn_ct = int(self.go_glitch_spawn_accum)
+            self.go_glitch_spawn_accum -= spawn_ct
             for _ in range(spawn_ct):
-                w = random.randint(40, max(60, self.width//6))
-                h = random.randint(8, 40)
-                x = random.randint(0, self.width - w)
-                y = random.randint(0, self.height - h)
-                col = random.choice(["#ff00ff", "#ffffff", "#ff55ff", "#aa33ff"])  # neon glitch colors
-                rid = self.canvas.create_rectangle(x, y, x+w, y+h, fill=col, outline="")
-                life = random.randint(3, 10)
+                w = self.fx_rng.randint(40, max(60, self.width//6))
+                h = self.fx_rng.randint(8, 40)
+                x = self.fx_rng.randint(0, self.width - w)
+                y = self.fx_rng.randint(0, self.height - h)
+                col = self.fx_rng.choice(["#ff00ff", "#ffffff", "#ff55ff", "#aa33ff"])  # neon glitch colors
+                rid = self.item_pool.acquire('rectangle', (x, y, x+w, y+h), fill=col, outline="")
+                life = self.fx_rng.uniform(0.15, 0.5)
                 self.go_glitch_rects.append((rid, life))
             # decay existing glitch rects
             new_rects = []
             for rid, life in self.go_glitch_rects:
-                life -= 1
+                life -= dt
                 if life <= 0:
-                    try: self.canvas.delete(rid)
-                    except Exception: pass
+                    self.item_pool.release('rectangle', rid)
                 else:
                     # occasional horizontal shift for jitter
                     try:
-                        dx = random.randint(-8,8)
+                        dx = self.fx_rng.randint(-8,8)
                         self.canvas.move(rid, dx, 0)
                     except Exception: pass
                     new_rects.append((rid, life))
             self.go_glitch_rects = new_rects
-            # After some frames, advance to fade phase
-            if self.go_anim_frame > 55:
+            # After a few seconds, advance to fade phase
+            if self.go_anim_time > 2.75:
                 self.go_glitch_phase = 1
         # --- Phase 1: Fade a black overlay in and delete scene ---
         elif self.go_glitch_phase == 1:
@@ -5279,7 +4433,7 @@ class bullet_hell_game:
                 except Exception:
                     pass
             # Increase pseudo alpha
-            self.go_black_alpha += 0.06
+            self.go_black_alpha += 1.2 * dt
             # Adjust stipple pattern to simulate increasing opacity
             if self.go_black_cover is not None:
                 # choose denser patterns as alpha rises
@@ -5295,13 +4449,16 @@ class bullet_hell_game:
                 except Exception:
                     pass
             # Occasionally delete lingering items beneath
-            if self.go_anim_frame % 9 == 0:
+            if self.go_anim_time >= self.go_next_sweep:
+                self.go_next_sweep = self.go_anim_time + 0.45
                 for item in self.canvas.find_all():
                     # keep the black cover & game over text for now
                     if item in (self.go_black_cover, self.go_anim_text):
                         continue
                     try: self.canvas.delete(item)
                     except Exception: pass
+                self.item_pool.discard()
+                self.particles.discard()
             if self.go_black_alpha >= 1.0:
                 # Remove text as screen fully blacks
                 try:
@@ -5313,17 +4470,18 @@ class bullet_hell_game:
                         self.go_anim_subtext = None
                 except Exception: pass
                 self.go_glitch_phase = 2
+                self.go_prompt_time = self.go_anim_time + 2.0
         # --- Phase 2: Hold black, minimal updates ---
         elif self.go_glitch_phase == 2:
             # No further visuals; allow a restart key prompt optionally
-            if self.go_anim_frame % 40 == 0 and getattr(self, 'go_anim_text', None) is None:
+            if self.go_anim_time >= self.go_prompt_time and getattr(self, 'go_anim_text', None) is None:
                 try:
                     self.go_anim_text = self.canvas.create_text(self.width//2, self.height//2, text="PRESS R TO RESTART", fill="#4444ff", font=("Arial", 24))
                 except Exception:
                     pass
         # Pulse text color / scale
         if self.go_anim_text is not None:
-            phase = _sin(self.go_anim_frame * 0.18) * 0.5 + 0.5  # 0..1
+            phase = _sin(self.go_anim_time * 3.6) * 0.5 + 0.5  # 0..1
             # Interpolate color between magenta and white
             def mix(a,b,t):
                 return int(a + (b-a)*t)
@@ -5334,39 +4492,65 @@ class bullet_hell_game:
                 self.canvas.itemconfig(self.go_anim_text, fill=f"#{r:02x}{g:02x}{b:02x}")
             except Exception:
                 pass
-        # Update particles
-        new_particles = []
-        for pid, vx, vy, life in self.go_anim_particles:
-            life -= 1
-            # Move
-            self.canvas.move(pid, vx, vy)
-            # Apply slight drag + outward drift aging effect
-            vx *= 0.96
-            vy *= 0.96 + 0.003
-            # Fade color based on remaining life
-            t = max(0.0, min(1.0, life/70))
-            # Fade from pink -> violet -> dark
-            fr = int(255 * t)
-            fg = int(55 + (20-55)*(1-t))  # narrow shift
-            fb = int(255 * t)
-            try:
-                self.canvas.itemconfig(pid, fill=f"#{fr:02x}{fg:02x}{fb:02x}")
-            except Exception:
-                pass
-            if life > 0:
-                new_particles.append((pid, vx, vy, life))
-            else:
-                self.canvas.delete(pid)
-        self.go_anim_particles = new_particles
+        # Update particles; the main loop is halted, so send the batch here
+        self.particles.update(dt)
+        self.render_batch.flush()
         # Schedule next frame (decoupled from main game loop which is halted)
         # This must be called BEFORE any return to ensure music transition and text display continue
         try:
             self._process_game_over_music()
-            self.root.after(50, self.update_game_over_animation)
+            self.root.after(self.loop_clock.frame_delay(), self.update_game_over_animation)
         except Exception:
             pass
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Rift of Memories and Regrets")
+    parser.add_argument('--seed', type=int, help="seed for the session's runs")
+    parser.add_argument('--record', metavar='FILE', help="record each run's inputs to FILE (the latest run is kept)")
+    parser.add_argument('--replay', metavar='FILE', help="play back a recorded run")
+    parser.add_argument('--bench', type=float, nargs='?', const=300.0, metavar='SECONDS',
+                        help="simulate SECONDS of play without a window as fast as possible and print timings")
+    parser.add_argument('--stress', nargs='?', const='-', metavar='CSV',
+                        help="ramp spawn rates without a window until ticks blow their budget; table to CSV or stdout")
+    parser.add_argument('--profile-csv', metavar='FILE', help="log time per subsystem for every frame to FILE")
+    args, _ = parser.parse_known_args()
+    if args.bench is not None:
+        root = MemoryRoot(*HEADLESS_SIZE)
+        # The session seed, not game.seed: --seed seeds the session RNG the run's seed is drawn from
+        bench_seed = 1 if args.seed is None else args.seed
+        game = bullet_hell_game(root, seed=bench_seed, headless=True,
+                                profile_path=args.profile_csv)
+        game.start_headless()
+        game.practice_mode = True  # the player never dies, so every run covers the same span
+        stats = run_benchmark(game, args.bench)
+        print(f"Benchmark: seed {bench_seed}, tick {rate_label(game.loop_clock.sim_rate)}")
+        print('\n'.join(stats.report()))
+        print('\n'.join(game.profiler.summary()))
+        game.profiler.close_csv()
+        root.destroy()
+        sys.exit(0)
+    if args.stress is not None:
+        root = MemoryRoot(*HEADLESS_SIZE)
+        game = bullet_hell_game(root, seed=1 if args.seed is None else args.seed, headless=True,
+                                profile_path=args.profile_csv)
+        game.start_headless()
+        game.practice_mode = True
+        ramp = run_stress(game, StressRamp(game.loop_clock.sim_dt * 1000.0))
+        ramp.write_csv(sys.stdout if args.stress == '-' else args.stress)
+        if ramp.knee is not None:
+            print(f"# Tick budget ({ramp.budget_ms:.0f}ms) blown from {ramp.knee[0]}s at {ramp.knee[3]} live bullets",
+                  file=sys.stderr)
+        else:
+            print("# Tick budget held for the whole ramp", file=sys.stderr)
+        game.profiler.close_csv()
+        root.destroy()
+        sys.exit(0)
+    replay = Replay.load(args.replay) if args.replay else None
     root = tk.Tk()
-    game = bullet_hell_game(root)
+    game = bullet_hell_game(root, seed=args.seed, record_path=args.record, replay=replay,
+                            profile_path=args.profile_csv)
+    root.protocol("WM_DELETE_WINDOW", game.close_window)
+    if replay is not None:
+        game.start_game()
     root.mainloop()
@@ -0,0 +1,191 @@
+"""Pre-baked vaporwave grid background for Rift of Memories and Regrets.
+
+The live background recomputed the whole colour cycle every frame: the
+interpolated canvas colour, its luminance, a gradient colour for each of the
+58 grid lines and their positions, then sent a configure, a coords and an
+itemconfig per line to Tk. The baked background computes those colours once,
+as tables over a finite number of colour-cycle phases and glow levels, and
+keeps the line positions in Python. Each frame it looks the current entries
+up and only writes what changed: the canvas colour when its phase step
+advances, a line colour when its glow level does, and a line's coords when
+it has scrolled to another whole pixel. set_detail() thins the grid and
+slows the colour refresh when the game sheds cosmetic work.
+"""
+import math
+
+BG_COLOR_CYCLE = ("#0d0221", "#1a0533", "#32054e", "#4b0a67", "#6d117b", "#8f1f85", "#b1387f", "#d25872")
+
+# Baked resolution: canvas colours per step of the cycle, and glow levels
+PHASE_STEPS = 32
+GLOW_STEPS = 32
+
+# Grid geometry
+GRID_DEPTH = 40            # horizontal perspective rows
+GRID_VERTICAL_COUNT = 18
+GRID_SCROLL_SPEED = 12     # px/s
+GRID_PERSPECTIVE_POWER = 1.55
+FREEZE_SCROLL = 0.25       # scroll speed share while time is frozen
+
+# Line gradient endpoints, picked by background luminance
+_GRADIENTS = (
+    ((255, 230, 140), (140, 255, 255)),  # very dark background -> bright neon
+    ((255, 170, 255), (120, 220, 255)),  # medium dark -> mid-high contrast
+    ((180, 40, 200), (40, 160, 255)),    # light background -> darker saturated lines
+)
+
+
+def _rgb(color):
+    return int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+
+
+def _mix(a, b, t):
+    return tuple(int(a[i] + (b[i] - a[i]) * t) for i in range(3))
+
+
+def _hex(rgb):
+    return "#%02x%02x%02x" % rgb
+
+
+def _shade(rgb, brightness):
+    return _hex(tuple(min(255, int(c * brightness)) for c in rgb))
+
+
+def gradient_for(color):
+    """Index into the line gradients for a background colour, by luminance."""
+    r, g, b = _rgb(color)
+    lum = 0.299 * r + 0.587 * g + 0.114 * b
+    return 0 if lum < 90 else 1 if lum < 160 else 2
+
+
+class BakedBackground:
+    """Vaporwave grid that draws from precomputed colour tables."""
+
+    def __init__(self, canvas, width, height, color_interval=6, batch=None, cycle=BG_COLOR_CYCLE):
+        self.canvas = canvas
+        self.out = batch if batch is not None else canvas
+        self.width = width
+        self.color_interval = color_interval
+        self.base_y = height - 10
+        self.horizon_y = height * 0.15
+        self.elapsed = 0.0
+        self.glow_phase = 0.0
+        self.writes = 0  # configure, coords and itemconfig calls actually sent
+        self._bake(cycle)
+        self._create_lines()
+        self.shown_bg = None
+        self.shown_colors = None
+        self.grid_step = 1
+        self.color_every = 1
+        self._frame = 0
+        self.rows = list(range(GRID_DEPTH))  # horizontal rows drawn at this detail
+
+    def _bake(self, cycle):
+        """Build the canvas colour and line colour tables."""
+        rgbs = [_rgb(c) for c in cycle]
+        self.bg_colors = []     # (cycle step * PHASE_STEPS + phase step) -> colour
+        self.bg_gradients = []  # same index -> gradient used by the lines
+        for i, a in enumerate(rgbs):
+            b = rgbs[(i + 1) % len(rgbs)]
+            for step in range(PHASE_STEPS):
+                color = _hex(_mix(a, b, step / PHASE_STEPS))
+                self.bg_colors.append(color)
+                self.bg_gradients.append(gradient_for(color))
+        self.h_t = [i / (GRID_DEPTH - 1) for i in range(GRID_DEPTH)]
+        self.v_t = [j / (GRID_VERTICAL_COUNT - 1) for j in range(GRID_VERTICAL_COUNT)]
+        # (gradient, glow level) -> colour of every line, horizontal rows first
+        self.line_colors = {}
+        for grad in set(self.bg_gradients):
+            grad_a, grad_b = _GRADIENTS[grad]
+            h_rgb = [_mix(grad_a, grad_b, t) for t in self.h_t]
+            v_rgb = [_mix(grad_a, grad_b, t) for t in self.v_t]
+            for level in range(GLOW_STEPS + 1):
+                glow = level / GLOW_STEPS
+                self.line_colors[grad, level] = (
+                    [_shade(rgb, 0.35 + 0.65 * glow * (1 - t * 0.7)) for rgb, t in zip(h_rgb, self.h_t)]
+                    + [_shade(rgb, 0.50 + 0.50 * glow) for rgb in v_rgb])
+
+    def _create_lines(self):
+        canvas = self.canvas
+        span = self.base_y - self.horizon_y
+        self.h_y = []      # current y of each horizontal row
+        self.h_drawn = []  # whole-pixel y last sent to Tk
+        self.h_speed = []  # px/s, closer rows scroll faster
+        self.lines = []    # horizontal rows, then vertical lines
+        for t in self.h_t:
+            depth = t ** GRID_PERSPECTIVE_POWER
+            y = self.horizon_y + span * depth
+            self.lines.append(canvas.create_line(0, y, self.width, y, fill="#222", width=1))
+            self.h_y.append(y)
+            self.h_drawn.append(round(y))
+            self.h_speed.append(GRID_SCROLL_SPEED * (0.3 + depth * 2))
+        # Vertical lines converge on the horizon and never move
+        for x_norm in self.v_t:
+            self.lines.append(canvas.create_line(x_norm * self.width, self.base_y, self.width / 2,
+                                                 self.horizon_y, fill="#222", width=1))
+
+    def set_detail(self, grid_step=1, color_every=1):
+        """Draw every `grid_step`-th grid line and refresh colours every `color_every`-th frame."""
+        self.color_every = max(1, color_every)
+        grid_step = max(1, grid_step)
+        if grid_step == self.grid_step:
+            return
+        self.grid_step = grid_step
+        h_count = GRID_DEPTH
+        self.rows = [i for i in range(h_count) if i % grid_step == 0]
+        for i, line in enumerate(self.lines):
+            j = i if i < h_count else i - h_count
+            self.out.itemconfig(line, state='normal' if j % grid_step == 0 else 'hidden')
+            self.writes += 1
+        self.shown_colors = None  # lines shown again may carry stale colours
+
+    def update(self, dt, frozen=False):
+        """Advance the scroll, colour cycle and glow by dt seconds and write what changed."""
+        out = self.out
+        self.elapsed += dt
+        self.glow_phase += dt
+        self._frame += 1
+        if self._frame % self.color_every == 0:
+            self._update_colors()
+        # Scroll the rows down, wrapping to the horizon past the base
+        scale = dt * FREEZE_SCROLL if frozen else dt
+        base = self.base_y + 4
+        width = self.width
+        h_y = self.h_y
+        drawn = self.h_drawn
+        h_speed = self.h_speed
+        lines = self.lines
+        for i in self.rows:
+            y = h_y[i] + h_speed[i] * scale
+            if y > base:
+                y = self.horizon_y + 2
+            h_y[i] = y
+            y = round(y)
+            if y != drawn[i]:
+                drawn[i] = y
+                out.coords(lines[i], 0, y, width, y)
+                self.writes += 1
+
+    def _update_colors(self):
+        index = int(self.elapsed / self.color_interval * PHASE_STEPS) % len(self.bg_colors)
+        bg = self.bg_colors[index]
+        if bg != self.shown_bg:
+            self.shown_bg = bg
+            try:
+                self.canvas.configure(bg=bg)
+            except Exception:
+                pass
+            self.writes += 1
+        level = int((math.sin(self.glow_phase) + 1) / 2 * GLOW_STEPS + 0.5)
+        colors = self.line_colors[self.bg_gradients[index], level]
+        shown = self.shown_colors
+        if colors is not shown:
+            out = self.out
+            lines = self.lines
+            step = self.grid_step
+            for i, color in enumerate(colors):
+                if shown is None or shown[i] != color:
+                    if step > 1 and (i if i < GRID_DEPTH else i - GRID_DEPTH) % step:
+                        continue  # hidden at this detail
+                    out.itemconfig(lines[i], fill=color)
+                    self.writes += 1
+            self.shown_colors = colors
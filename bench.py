@@ -0,0 +1,184 @@
+"""Headless benchmark driver for Rift of Memories and Regrets.
+
+run_benchmark() plays a started game as fast as the machine allows: it
+calls the game's fixed simulation tick for a given number of simulated
+seconds, redraws after every tick, and times both with perf_counter. Nothing
+waits on after() or the window, so the numbers are the cost of the game's
+own work. BenchStats turns the samples into percentiles and throughput.
+
+StressRamp multiplies every pattern's spawn rate by a boost that keeps
+doubling and logs live bullets against tick cost, one row per window, so the
+table shows the bullet count at which a tick stops fitting its budget.
+run_stress() drives it headless; in practice mode the game can run one live.
+Both close a profiler frame per tick when the game has a FrameProfiler, so
+its CSV log gets one row per tick.
+"""
+import csv
+import math
+import time
+
+
+def percentile(samples, p):
+    """Nearest-rank p-th percentile (0-100) of a sequence; 0.0 when empty."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(p / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class BenchStats:
+    """Tick and redraw timings of one benchmark run."""
+
+    PERCENTILES = (50, 90, 95, 99)
+
+    def __init__(self):
+        self.tick_ms = []
+        self.frame_ms = []
+        self.bullet_updates = 0  # live bullets summed over ticks
+        self.peak_bullets = 0
+        self.sim_seconds = 0.0
+
+    def add_tick(self, seconds, bullets):
+        self.tick_ms.append(seconds * 1000.0)
+        self.bullet_updates += bullets
+        if bullets > self.peak_bullets:
+            self.peak_bullets = bullets
+
+    def add_frame(self, seconds):
+        self.frame_ms.append(seconds * 1000.0)
+
+    def bullets_per_second(self):
+        """Bullet updates per second of wall time spent in ticks."""
+        busy = sum(self.tick_ms) / 1000.0
+        return self.bullet_updates / busy if busy else 0.0
+
+    def report(self):
+        """Summary lines for the console."""
+        lines = [f"Simulated {self.sim_seconds:.1f}s in {len(self.tick_ms)} ticks"]
+        for name, samples in (('tick', self.tick_ms), ('frame', self.frame_ms)):
+            if samples:
+                parts = '  '.join(f"p{p} {percentile(samples, p):.3f}" for p in self.PERCENTILES)
+                lines.append(f"ms/{name}: {parts}  max {max(samples):.3f}")
+        lines.append(f"Bullets updated per second: {self.bullets_per_second():,.0f}")
+        lines.append(f"Peak live bullets: {self.peak_bullets}")
+        return lines
+
+
+def run_benchmark(game, seconds, render=True, clock=time.perf_counter):
+    """Play `seconds` of simulated time on a started game and return its BenchStats."""
+    stats = BenchStats()
+    dt = game.loop_clock.sim_dt
+    sim = game.sim
+    profiler = getattr(game, 'profiler', None)
+    for _ in range(max(1, round(seconds / dt))):
+        bullets = sim.count()
+        if profiler is not None:
+            profiler.start()
+        start = clock()
+        game._simulation_tick(dt)
+        ticked = clock()
+        stats.add_tick(ticked - start, bullets)
+        stats.sim_seconds += dt
+        if render:
+            game._render_frame(dt)
+            stats.add_frame(clock() - ticked)
+        if profiler is not None:
+            profiler.end_frame(game.game_time)
+        if game.game_over:
+            break
+    return stats
+
+
+# Spawn-rate boost doubles every this many simulated seconds
+STRESS_DOUBLING = 20.0
+
+
+class StressRamp:
+    """Spawn-rate ramp that logs live bullets against tick cost.
+
+    The boost starts at 1 and doubles every `doubling` simulated seconds.
+    Samples are summarised once per `window` seconds into a row; the ramp is
+    blown once `blown_windows` rows in a row have a p95 cost over budget.
+    """
+
+    COLUMNS = ('time_s', 'boost', 'bullets_avg', 'bullets_peak', 'cost_p50_ms', 'cost_p95_ms',
+               'cost_max_ms', 'over_budget')
+
+    def __init__(self, budget_ms, start=0.0, doubling=STRESS_DOUBLING, window=1.0, blown_windows=3):
+        self.budget_ms = budget_ms
+        self.start = start
+        self.doubling = doubling
+        self.window = window
+        self.blown_windows = blown_windows
+        self.rows = []
+        self.knee = None  # first row of the run of rows that blew the budget
+        self._cost = []
+        self._bullets = []
+        self._window_end = start + window
+        self._over = 0
+
+    def boost(self, t):
+        """Spawn-rate multiplier at simulated time t."""
+        return 2.0 ** (max(0.0, t - self.start) / self.doubling)
+
+    @property
+    def blown(self):
+        return self.knee is not None
+
+    def sample(self, t, bullets, cost_ms):
+        """Add the cost of one tick (or wake-up) at simulated time t; returns a row when a window closes."""
+        self._cost.append(cost_ms)
+        self._bullets.append(bullets)
+        if t < self._window_end:
+            return None
+        cost = self._cost
+        p95 = percentile(cost, 95)
+        row = (round(t - self.start, 2), round(self.boost(t), 3), round(sum(self._bullets) / len(self._bullets), 1),
+               max(self._bullets), round(percentile(cost, 50), 3), round(p95, 3), round(max(cost), 3),
+               round(sum(1 for c in cost if c > self.budget_ms) / len(cost), 3))
+        self.rows.append(row)
+        self._cost = []
+        self._bullets = []
+        self._window_end += self.window
+        if p95 > self.budget_ms:
+            self._over += 1
+            if self._over == self.blown_windows and self.knee is None:
+                self.knee = self.rows[-self.blown_windows]
+        else:
+            self._over = 0
+        return row
+
+    def write_csv(self, out):
+        """Write the rows as CSV to a path or an open text file."""
+        if isinstance(out, str):
+            with open(out, 'w', newline='', encoding='utf-8') as f:
+                self.write_csv(f)
+            return
+        writer = csv.writer(out)
+        writer.writerow(self.COLUMNS)
+        writer.writerows(self.rows)
+
+
+def run_stress(game, ramp, max_seconds=600.0, clock=time.perf_counter):
+    """Ramp spawns on a started game until the tick budget is blown or `max_seconds` pass.
+
+    Each tick is followed by a redraw, and the pair is what the budget covers.
+    Returns the ramp with its rows.
+    """
+    dt = game.loop_clock.sim_dt
+    sim = game.sim
+    profiler = getattr(game, 'profiler', None)
+    game.stress = ramp
+    for _ in range(max(1, round(max_seconds / dt))):
+        if profiler is not None:
+            profiler.start()
+        start = clock()
+        game._simulation_tick(dt)
+        game._render_frame(dt)
+        if profiler is not None:
+            profiler.end_frame(game.game_time)
+        ramp.sample(game.game_time, sim.count(), (clock() - start) * 1000.0)
+        if ramp.blown or game.game_over:
+            break
+    return ramp
@@ -0,0 +1,374 @@
+"""Canvas view for the headless bullet simulation.
+
+The view owns the Tk canvas items that mirror simulation bullets. It never
+decides anything about gameplay: once per frame it creates items for newly
+spawned bullets, deletes items for removed ones and pushes coordinates.
+The canvas is duck-typed so the view can run against any object that
+implements the Tk canvas methods it uses.
+
+Items come from an ItemPool: a removed bullet's item is hidden and handed to
+the next spawn of the same shape instead of being deleted and recreated, so
+bursts do not pay for Tk item allocation. Per-frame coordinate and option
+updates go through a CanvasBatch, which sends the whole frame to Tcl as one
+script instead of one tkinter call per item. CanvasLayers fixes the stacking
+order once: items are slotted into their layer when created, so nothing has
+to be lifted or lowered again every frame. Every bullet item carries a tag
+for its kind, so a whole kind can be recoloured with one command (see
+tint_ramp() and BulletCanvasView.tint()).
+"""
+import math
+
+_sin = math.sin
+_cos = math.cos
+_pi = math.pi
+
+# Shape and item options per bullet family
+BULLET_STYLES = {
+    'vertical': ('oval', {'fill': 'red'}),
+    'horizontal': ('oval', {'fill': 'yellow'}),
+    'diag': ('oval', {'fill': 'green'}),
+    'triangle': ('triangle', {'fill': '#bfff00'}),
+    'boss': ('oval', {'fill': 'purple'}),
+    'zigzag': ('oval', {'fill': 'cyan'}),
+    'fast': ('oval', {'fill': 'orange'}),
+    'star': ('star', {'fill': 'magenta', 'outline': 'white', 'width': 2}),
+    'rect': ('rectangle', {'fill': 'blue'}),
+    'egg': ('oval', {'fill': 'tan'}),
+    'quad': ('oval', {'fill': 'red'}),
+    'bouncing': ('oval', {'fill': 'pink'}),
+    'exploding': ('oval', {'fill': 'white'}),
+    'fragment': ('oval', {'fill': 'white'}),
+    'homing': ('oval', {'fill': '#ffdd00'}),
+    'spiral': ('oval', {'fill': '#00ff88'}),
+    'radial': ('oval', {'fill': '#ff00ff'}),
+    'split_shard': ('oval', {'fill': '#ff55ff'}),
+    'ring': ('oval', {'fill': '#55ffdd', 'outline': '#ffffff'}),
+    'fan': ('oval', {'fill': '#ffcc55', 'outline': '#ffffff'}),
+    'wave': ('oval', {'fill': '#33aaff'}),
+    'boomerang': ('oval', {'fill': '#ffaa33'}),
+    'split': ('oval', {'fill': '#ffffff', 'outline': '#ff55ff', 'width': 2}),
+    'static': ('oval', {'fill': '#bbbbbb', 'outline': '#ffffff', 'width': 2}),
+    'laser_indicator': ('line', {'fill': 'red', 'dash': (5, 2), 'width': 3}),
+    'laser': ('line', {'fill': 'red', 'width': 8}),
+}
+
+STAR_INNER_RATIO = 0.45
+
+# Steps in a precomputed tint ramp
+TINT_STEPS = 32
+
+# Tk colour names used by BULLET_STYLES, so ramps can be built without Tk
+_NAMED_COLORS = {
+    'red': (255, 0, 0), 'yellow': (255, 255, 0), 'green': (0, 128, 0),
+    'purple': (128, 0, 128), 'cyan': (0, 255, 255), 'orange': (255, 165, 0),
+    'magenta': (255, 0, 255), 'blue': (0, 0, 255), 'tan': (210, 180, 140),
+    'pink': (255, 192, 203), 'white': (255, 255, 255), 'black': (0, 0, 0),
+}
+
+# Tk defaults per item type, reapplied on reuse so options set by a
+# previous owner (outline, dash, width...) do not leak into the next one
+_ITEM_DEFAULTS = {
+    'oval': {'fill': '', 'outline': 'black', 'width': 1, 'dash': '', 'stipple': '', 'tags': ''},
+    'rectangle': {'fill': '', 'outline': 'black', 'width': 1, 'dash': '', 'stipple': '', 'tags': ''},
+    'polygon': {'fill': 'black', 'outline': '', 'width': 1, 'dash': '', 'stipple': '', 'tags': ''},
+    'line': {'fill': 'black', 'width': 1, 'dash': '', 'stipple': '', 'tags': ''},
+}
+
+
+def kind_tag(kind):
+    """Canvas tag shared by every item of a bullet kind."""
+    return 'bullet.' + kind
+
+
+def color_rgb(color):
+    """(r, g, b) of a '#rrggbb' colour or one of the Tk names in _NAMED_COLORS."""
+    if color.startswith('#') and len(color) == 7:
+        return int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+    return _NAMED_COLORS[color.lower()]
+
+
+def tint_ramp(start, end, steps=TINT_STEPS):
+    """steps + 1 colours blending `start` into `end`, as '#rrggbb' strings."""
+    a = color_rgb(start)
+    b = color_rgb(end)
+    return tuple('#%02x%02x%02x' % tuple(int(a[c] + (b[c] - a[c]) * i / steps) for c in range(3))
+                 for i in range(steps + 1))
+
+
+# Unrotated star points as (cos, sin, radius share), for when stars don't spin
+_STAR_POINTS = tuple((_cos(-_pi / 2 + i * (_pi / 5)), _sin(-_pi / 2 + i * (_pi / 5)),
+                      1.0 if i % 2 == 0 else STAR_INNER_RATIO) for i in range(10))
+
+
+def bullet_coords(shape, x, y, w, h, phase=0.0):
+    """Canvas coordinates for a bullet box drawn as `shape`."""
+    if shape == 'triangle':
+        return (x, y, x + w, y, x + w / 2, y + h)
+    if shape == 'star':
+        cx = x + w / 2
+        cy = y + h / 2
+        outer = w / 2
+        pts = []
+        if not phase:
+            for c, s, r in _STAR_POINTS:
+                pts.append(cx + c * outer * r)
+                pts.append(cy + s * outer * r)
+            return pts
+        inner = outer * STAR_INNER_RATIO
+        for i in range(10):
+            ang = -_pi / 2 + phase + i * (_pi / 5)
+            r = outer if i % 2 == 0 else inner
+            pts.append(cx + _cos(ang) * r)
+            pts.append(cy + _sin(ang) * r)
+        return pts
+    if shape == 'line':
+        return (x, y, x + w, y)
+    return (x, y, x + w, y + h)
+
+
+# Characters that end or change the meaning of a Tcl word
+_TCL_SPECIAL = frozenset(' \t\n\r;"\\{}[]$')
+
+
+def tcl_word(value):
+    """Quote a Python value as one word of a Tcl command."""
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, (tuple, list)):
+        return '{' + ' '.join(tcl_word(v) for v in value) + '}'
+    value = str(value)
+    if not value:
+        return '{}'
+    if _TCL_SPECIAL.isdisjoint(value):
+        return value
+    return ''.join('\\n' if ch == '\n' else '\\' + ch if ch in _TCL_SPECIAL else ch
+                   for ch in value)
+
+
+class CanvasBatch:
+    """Queue of canvas updates sent to Tcl as one script by flush().
+
+    Accepts coords() and itemconfig() calls for items that already exist.
+    Queued commands keep their order; create and delete calls bypass the
+    queue, so callers flush before reading state back. A canvas without a
+    Tcl interpreter (a test double) gets every call applied immediately.
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.commands = []
+        tk = getattr(canvas, 'tk', None)
+        self._eval = getattr(tk, 'eval', None)
+        self._path = str(canvas)
+        self.flushes = 0
+        self.failed = 0  # queued commands Tcl rejected, over all flushes
+
+    def coords(self, item, *coords):
+        if self._eval is None:
+            self.canvas.coords(item, *coords)
+            return
+        self.commands.append(f"{self._path} coords {item} {' '.join(map(str, coords))}")
+
+    def itemconfig(self, item, **opts):
+        if self._eval is None:
+            self.canvas.itemconfig(item, **opts)
+            return
+        words = ' '.join(f"-{name} {tcl_word(value)}" for name, value in opts.items())
+        self.commands.append(f"{self._path} itemconfigure {item} {words}")
+
+    def discard(self, items):
+        """Drop queued commands addressed to `items`, e.g. items handed back to a pool.
+
+        A released item can be acquired again before the next flush; its old
+        owner's queued updates would then land on the new owner.
+        """
+        if not self.commands or not len(items):
+            return
+        path = self._path
+        prefixes = tuple(f"{path} {op} {item} " for item in items for op in ('coords', 'itemconfigure'))
+        self.commands = [command for command in self.commands if not command.startswith(prefixes)]
+
+    def flush(self):
+        """Send every queued command in one Tcl eval.
+
+        Each command runs under its own catch, so one that fails (an item
+        deleted behind the batch's back, say) is counted in `failed` and the
+        rest still run exactly once.
+        """
+        commands = self.commands
+        if not commands:
+            return
+        self.commands = []
+        self.flushes += 1
+        body = '\n'.join(f"incr n [catch {{{command}}}]" for command in commands)
+        self.failed += int(self._eval(f"apply {{{{}} {{\nset n 0\n{body}\nreturn $n}}}}") or 0)
+
+
+# Stacking layers, bottom to top
+LAYERS = ('background', 'tint', 'player', 'bullets', 'actors', 'effects', 'hud', 'overlay')
+
+
+class CanvasLayers:
+    """Named stacking layers kept apart by hidden marker items.
+
+    Each layer ends at a marker; place() slots an item just under its
+    layer's marker, i.e. on top of that layer. Items created before the
+    layers end up in the bottom layer, items never placed stay above all
+    layers (menus and screens drawn over the game).
+    """
+
+    def __init__(self, canvas, names=LAYERS):
+        self.canvas = canvas
+        self.markers = {}
+        for name in names:
+            self.markers[name] = canvas.create_line(0, 0, 0, 0, state='hidden')
+
+    def place(self, item, layer):
+        """Move `item` (id or tag) to the top of `layer`."""
+        try:
+            self.canvas.tag_lower(item, self.markers[layer])
+        except Exception:
+            pass
+        return item
+
+
+class ItemPool:
+    """Hidden canvas items per item type, reused instead of created and deleted.
+
+    acquire() returns a visible item with the given coords and options, on top
+    of the requested layer (or of the whole canvas, like a freshly created
+    item, when the pool has no layers); release() hides it for reuse. Items
+    are only valid until the canvas is cleared, so build a new pool after
+    canvas.delete('all').
+    """
+
+    def __init__(self, canvas, layers=None):
+        self.canvas = canvas
+        self.layers = layers
+        self.free = {item_type: [] for item_type in _ITEM_DEFAULTS}
+        self.created = 0
+        self.reused = 0
+
+    def prewarm(self, item_type, count):
+        """Create `count` hidden items up front so the first bursts do not allocate."""
+        create = getattr(self.canvas, 'create_' + item_type)
+        coords = (0, 0, 0, 0, 0, 0) if item_type == 'polygon' else (0, 0, 0, 0)
+        free = self.free[item_type]
+        for _ in range(count):
+            free.append(create(*coords, state='hidden'))
+        self.created += count
+
+    def acquire(self, item_type, coords, layer=None, **opts):
+        """A visible item of `item_type` at `coords`, recycled when one is free."""
+        free = self.free[item_type]
+        canvas = self.canvas
+        if not free:
+            item = getattr(canvas, 'create_' + item_type)(*coords, **opts)
+            self.created += 1
+        else:
+            item = free.pop()
+            canvas.coords(item, *coords)
+            options = dict(_ITEM_DEFAULTS[item_type])
+            options.update(opts)
+            canvas.itemconfig(item, state='normal', **options)
+            self.reused += 1
+            if layer is None or self.layers is None:
+                canvas.tag_raise(item)
+        if layer is not None and self.layers is not None:
+            self.layers.place(item, layer)
+        return item
+
+    def release(self, item_type, item):
+        """Hide `item` and keep it for the next acquire() of the same type."""
+        try:
+            self.canvas.itemconfig(item, state='hidden')
+        except Exception:
+            return
+        self.free[item_type].append(item)
+
+    def discard(self):
+        """Forget every free item, e.g. after they were deleted from the canvas."""
+        for free in self.free.values():
+            free.clear()
+
+
+class BulletCanvasView:
+    """Mirror of a BulletSimulation on a Tk canvas, synced once per frame."""
+
+    def __init__(self, canvas, sim, pool=None, batch=None, layer='bullets'):
+        self.canvas = canvas
+        self.sim = sim
+        self.pool = pool if pool is not None else ItemPool(canvas)
+        self.batch = batch if batch is not None else CanvasBatch(canvas)
+        self.layer = layer  # used when the pool has layers
+        self.items = {}  # bullet id -> (canvas item, kind)
+        self.fills = {}  # kind -> fill overriding its style, see tint()
+        self.spin = True  # False draws stars unrotated
+
+    @staticmethod
+    def _item_type(kind):
+        shape = BULLET_STYLES[kind][0]
+        # Triangles and stars are polygons
+        return shape if shape in _ITEM_DEFAULTS else 'polygon'
+
+    def _create(self, kind, coords):
+        opts = BULLET_STYLES[kind][1]
+        fill = self.fills.get(kind)
+        if fill is not None:
+            opts = dict(opts, fill=fill)
+        return self.pool.acquire(self._item_type(kind), coords, self.layer, tags=kind_tag(kind), **opts)
+
+    def tint(self, fills=None):
+        """Recolour bullets by kind: one queued itemconfig per kind on screen.
+
+        `fills` maps kind -> fill and also applies to bullets spawned later;
+        None puts every tinted kind back to its style fill.
+        """
+        if fills is None:
+            fills = {kind: BULLET_STYLES[kind][1].get('fill', '') for kind in self.fills}
+            self.fills = {}
+        else:
+            self.fills = dict(fills)
+        present = {kind for _, kind in self.items.values()}
+        for kind, fill in fills.items():
+            if kind in present:
+                self.batch.itemconfig(kind_tag(kind), fill=fill)
+
+    def sync(self):
+        """Apply removals, spawns and movement from the simulation to the canvas.
+
+        Movement is queued on the batch, which is flushed before returning.
+        """
+        items = self.items
+        release = self.pool.release
+        for bid in self.sim.drain_removed():
+            entry = items.pop(bid, None)
+            if entry is not None:
+                release(self._item_type(entry[1]), entry[0])
+        if not self.sim.dirty:
+            self.batch.flush()
+            return
+        self.sim.dirty = False
+        st = self.sim.store
+        n = st.n
+        kinds = self.sim.KINDS
+        move = self.batch.coords
+        spin = self.spin
+        for bid, code, x, y, w, h, phase in zip(st.bid[:n].tolist(), st.kind[:n].tolist(),
+                                                 st.x[:n].tolist(), st.y[:n].tolist(),
+                                                 st.w[:n].tolist(), st.h[:n].tolist(),
+                                                 st.phase[:n].tolist()):
+            kind = kinds[code]
+            coords = bullet_coords(BULLET_STYLES[kind][0], x, y, w, h, phase if spin else 0.0)
+            entry = items.get(bid)
+            if entry is None:
+                # First frame this bullet is visible
+                items[bid] = (self._create(kind, coords), kind)
+            else:
+                move(entry[0], *coords)
+        self.batch.flush()
+
+    def clear(self):
+        for item, kind in self.items.values():
+            self.pool.release(self._item_type(kind), item)
+        self.items.clear()
@@ -0,0 +1,154 @@
+"""Tick and frame scheduling for the Tk game loop.
+
+Tk has no frame loop of its own; the game re-arms itself with root.after().
+LoopClock decides, for each wake-up, how many fixed simulation ticks are due,
+whether the canvas should be redrawn, and how long to sleep before the next
+wake-up. Simulation rate and render rate are independent:
+
+- the simulation always advances in fixed ticks of 1 / sim_rate seconds,
+  running several per wake-up when the loop falls behind;
+- the canvas is redrawn at most render_rate times a second (0 = after every
+  wake-up that advanced the game), and less often when drawing itself gets
+  too expensive, so weak machines drop frames instead of slowing down.
+  Redraws only follow ticks and nothing is interpolated between them, so a
+  cap at or above the tick rate is the same as 0.
+
+The clock measures the cost of every wake-up and how late Tk fires its
+timers, and shortens the next delay accordingly. It never touches Tk itself,
+so it can be driven by a fake clock in tests.
+"""
+import math
+import time
+
+# Settings choices offered in the settings menu
+SIM_RATES = (20, 30, 60, 120)
+RENDER_RATES = (15, 30, 60, 0)  # 0 = every tick
+
+# Smoothing for the measured loop costs (share of the newest sample)
+_SMOOTHING = 0.1
+
+
+def rate_label(rate):
+    """Display text for a render rate setting."""
+    return "Every tick" if not rate else f"{rate} Hz"
+
+
+def render_choices(sim_rate):
+    """Render caps that make a difference at `sim_rate`: those below it, and every tick."""
+    return tuple(rate for rate in RENDER_RATES if not rate or rate < sim_rate)
+
+
+class LoopClock:
+    """Fixed-timestep accumulator plus render pacing for an after() loop."""
+
+    def __init__(self, sim_rate=20, render_rate=60, max_catchup=0.25, clock=time.perf_counter):
+        self.clock = clock
+        self.max_catchup = max_catchup  # most game time one wake-up may catch up on (s)
+        self.configure(sim_rate, render_rate)
+        self.reset()
+
+    def configure(self, sim_rate, render_rate):
+        """Set the simulation rate (Hz) and render cap (Hz, 0 = every tick; caps at or above the tick rate mean the same)."""
+        self.sim_rate = max(1, int(sim_rate))
+        self.render_rate = max(0, int(render_rate or 0))
+        if self.render_rate >= self.sim_rate:
+            self.render_rate = 0
+        self.sim_dt = 1.0 / self.sim_rate
+        self.render_period = 1.0 / self.render_rate if self.render_rate else 0.0
+
+    def reset(self):
+        """Forget elapsed time and measurements, e.g. at game start or unpause."""
+        self.hold()
+        self.pending_render_time = 0.0  # game time advanced since the last redraw
+        self.wake_cost = 0.0            # smoothed seconds of work per wake-up
+        self.render_cost = 0.0          # smoothed seconds per redraw
+        self.lateness = 0.0             # smoothed seconds Tk fires after the requested delay
+        self._last_render_clock = None
+        self._last_frame_clock = None
+        self._wake_clock = None
+        self._wake_target = None
+        self._render_clock = None
+
+    def hold(self):
+        """Stop banking game time until the next advance(), e.g. while the static trap runs."""
+        self.accumulator = 0.0
+        self._last_tick_clock = None
+
+    # ---------------- Game loop ----------------
+    def advance(self):
+        """Start a wake-up: bank the real time since the last one and return how many ticks are due."""
+        now = self.clock()
+        self._wake_clock = now
+        if self._wake_target is not None:
+            late = min(max(0.0, now - self._wake_target), self.sim_dt)
+            self.lateness += (late - self.lateness) * _SMOOTHING
+        if self._last_tick_clock is None:
+            elapsed = self.sim_dt  # first wake-up after a reset runs one tick
+        else:
+            elapsed = now - self._last_tick_clock
+        self._last_tick_clock = now
+        # Cap the backlog so a long stall does not turn into a burst of catch-up ticks
+        self.accumulator = min(self.accumulator + elapsed, max(self.sim_dt, self.max_catchup))
+        ticks = 0
+        # Tolerance keeps a wake-up that lands exactly on the tick boundary from slipping a tick
+        while self.accumulator >= self.sim_dt * (1 - 1e-6):
+            self.accumulator = max(0.0, self.accumulator - self.sim_dt)
+            ticks += 1
+        self.pending_render_time += ticks * self.sim_dt
+        return ticks
+
+    def render_due(self):
+        """Game time the next redraw covers, or None when this wake-up should not redraw.
+
+        Nothing is redrawn until the game has advanced. Redraws are spaced by the
+        render period, stretched to twice the measured redraw cost so drawing
+        never takes more than about half the loop. Wake-ups only happen on tick
+        boundaries, so a redraw up to half a tick early counts as on time.
+        """
+        if self.pending_render_time <= 0:
+            return None
+        now = self.clock()
+        period = max(self.render_period, 2 * self.render_cost)
+        if self._last_render_clock is not None and now - self._last_render_clock < period - self.sim_dt / 2:
+            return None
+        self._last_render_clock = now
+        self._render_clock = now
+        dt, self.pending_render_time = self.pending_render_time, 0.0
+        return dt
+
+    def next_delay(self):
+        """End a wake-up: after() delay in ms until the next tick is due."""
+        now = self.clock()
+        if self._wake_clock is not None:
+            self.wake_cost += ((now - self._wake_clock) - self.wake_cost) * _SMOOTHING
+        if self._render_clock is not None:
+            self.render_cost += ((now - self._render_clock) - self.render_cost) * _SMOOTHING
+            self._render_clock = None
+        if self._last_tick_clock is None:
+            due = now + self.sim_dt
+        else:
+            due = self._last_tick_clock + (self.sim_dt - self.accumulator)
+        return self._arm(due - now)
+
+    # ---------------- Animation-only loops ----------------
+    def frame_time(self, limit=0.25):
+        """Real seconds since the previous call (capped), for loops that only animate."""
+        now = self.clock()
+        last, self._last_frame_clock = self._last_frame_clock, now
+        if last is None:
+            return self.sim_dt
+        return min(limit, now - last)
+
+    def restart_frame_time(self):
+        """Make the next frame_time() count from now, e.g. when an animation-only loop starts."""
+        self._last_frame_clock = self.clock()
+
+    def frame_delay(self):
+        """after() delay in ms for loops that only animate (game over, static trap)."""
+        return self._arm(self.render_period or self.sim_dt)
+
+    def _arm(self, wait):
+        # Round up: waking a fraction of a millisecond early would find no tick due
+        ms = max(1, math.ceil((wait - self.lateness) * 1000 - 1e-6))
+        self._wake_target = self.clock() + ms / 1000.0
+        return ms
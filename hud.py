@@ -0,0 +1,88 @@
+"""Retained-mode HUD layer for Rift of Memories and Regrets.
+
+The HUD keeps its canvas items (score, time, counters, hearts...) for the
+whole game and remembers what each one shows. Setting a value that is
+already displayed costs nothing; only real changes reach Tk, where text
+items are expensive to re-layout. Given canvas layers, HUD items are slotted
+into the 'hud' layer once when created; without them, every HUD item carries
+the 'hud' tag so the whole layer can be raised with one call.
+"""
+
+HUD_TAG = 'hud'
+
+# Heart icon row under the score
+HEART_X = 20
+HEART_Y = 46
+HEART_SPACING = 28
+
+
+class Hud:
+    """Named canvas items whose options are only written when they change."""
+
+    def __init__(self, canvas, layers=None):
+        self.canvas = canvas
+        self.layers = layers
+        self.items = {}   # name -> canvas item
+        self.shown = {}   # name -> last text written
+        self.hearts = []  # heart items, shown left to right
+        self.heart_count = 0
+        self.writes = 0   # itemconfig calls actually sent
+
+    def add_text(self, name, x, y, text='', **opts):
+        """Create a text item kept for the session and return its id."""
+        item = self.canvas.create_text(x, y, text=text, tags=(HUD_TAG,), **opts)
+        self._place(item)
+        self.items[name] = item
+        self.shown[name] = text
+        return item
+
+    def set_text(self, name, text):
+        """Show `text` in the named item, skipping the write when it is already shown."""
+        if self.shown.get(name) == text:
+            return False
+        self.shown[name] = text
+        try:
+            self.canvas.itemconfig(self.items[name], text=text)
+        except Exception:
+            return False
+        self.writes += 1
+        return True
+
+    def set_hearts(self, count):
+        """Show `count` heart icons. Items are created on first need and hidden, not deleted."""
+        count = max(0, count)
+        if count == self.heart_count:
+            return
+        canvas = self.canvas
+        existing = self.hearts[:]
+        while len(self.hearts) < count:
+            x = HEART_X + len(self.hearts) * HEART_SPACING
+            try:
+                heart = canvas.create_text(x, HEART_Y, text='❤', fill='#ff4d6d',
+                                           font=("Arial", 22, 'bold'), tags=(HUD_TAG,))
+            except Exception:
+                # fallback rectangle if emoji not supported
+                heart = canvas.create_rectangle(x, HEART_Y, x + 20, HEART_Y + 20,
+                                                outline='#ff4d6d', tags=(HUD_TAG,))
+            self._place(heart)
+            self.hearts.append(heart)
+        for i, heart in enumerate(existing):
+            # New hearts start visible; only touch old ones whose visibility flips
+            if (i < count) != (i < self.heart_count):
+                try:
+                    canvas.itemconfig(heart, state='normal' if i < count else 'hidden')
+                except Exception:
+                    pass
+                self.writes += 1
+        self.heart_count = count
+
+    def _place(self, item):
+        if self.layers is not None:
+            self.layers.place(item, 'hud')
+
+    def lift(self):
+        """Raise every HUD item above the playfield in one call."""
+        try:
+            self.canvas.tag_raise(HUD_TAG)
+        except Exception:
+            pass
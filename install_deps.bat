@@ -1,6 +1,6 @@
 @echo off
 REM Install required Python libraries for the game
-REM Only external dependency currently used is pygame (tkinter is built-in)
+REM External dependencies are pygame and numpy (tkinter is built-in)
 
 ECHO Detecting Python executable...
 set PY_CMD=
@@ -20,7 +20,7 @@ REM Ensure pip is available and updated
 %PY_CMD% -m pip install --upgrade pip
 
 ECHO Installing dependencies...
-%PY_CMD% -m pip install pygame
+%PY_CMD% -m pip install pygame numpy
 
 ECHO.
 ECHO All done! You can now run the game.
@@ -0,0 +1,442 @@
+"""In-memory stand-ins for the Tk root and canvas.
+
+MemoryCanvas implements the part of the tkinter Canvas API the game and its
+view modules use (create_*, coords, move, bbox, itemconfig, itemcget,
+delete, lift/lower, find_all, type, after...) on plain Python containers:
+items are records keyed by id, the display list is a list of ids and tags
+are indexed per name. Nothing is drawn, so tests can play the game without a
+display and benchmarks measure the game's own work instead of Tk's.
+
+MemoryRoot stands in for tk.Tk. Its after() callbacks run on a virtual clock
+that only moves when advance() is called, so a run can be fast-forwarded as
+quickly as the callbacks execute. Like Tk, a canvas built without a master
+gets a root of its own.
+
+Behaviour follows Tk where it is cheap to: ids count up from 1, tags may be
+ids, digit strings, tag names or 'all', coords/type/itemcget answer for the
+lowest matching item, and bbox covers every match. Text extents are an
+estimate from the font size, and tag expressions are not supported.
+"""
+import heapq
+import itertools
+
+# Text extent estimate: average glyph width and line height per point of font size
+TEXT_WIDTH_RATIO = 0.6
+TEXT_HEIGHT_RATIO = 1.3
+DEFAULT_FONT_SIZE = 10
+
+
+class MemoryRoot:
+    """tk.Tk stand-in whose after() queue runs on a virtual millisecond clock."""
+
+    def __init__(self, width=1280, height=720):
+        self.width = width
+        self.height = height
+        self.now = 0.0  # virtual ms
+        self.bindings = {}
+        self.protocols = {}
+        self.alive = True
+        self._queue = []  # (due ms, sequence, after id)
+        self._callbacks = {}  # after id -> (func, args)
+        self._seq = itertools.count(1)
+
+    def clock(self):
+        """Virtual time in seconds, usable as a LoopClock clock."""
+        return self.now / 1000.0
+
+    def after(self, ms, func=None, *args):
+        if func is None:
+            self.now += ms  # like Tk's after(ms) sleep
+            return None
+        seq = next(self._seq)
+        after_id = f"after#{seq}"
+        self._callbacks[after_id] = (func, args)
+        heapq.heappush(self._queue, (self.now + max(0, ms), seq, after_id))
+        return after_id
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after_cancel(self, after_id):
+        self._callbacks.pop(after_id, None)
+
+    def pending(self):
+        return len(self._callbacks)
+
+    def advance(self, ms):
+        """Move the clock forward by `ms`, running every callback that falls due; returns how many ran."""
+        end = self.now + ms
+        queue = self._queue
+        ran = 0
+        while queue and queue[0][0] <= end:
+            due, _, after_id = heapq.heappop(queue)
+            entry = self._callbacks.pop(after_id, None)
+            if entry is None:
+                continue  # cancelled
+            self.now = max(self.now, due)
+            entry[0](*entry[1])
+            ran += 1
+        self.now = end
+        return ran
+
+    def bind(self, sequence=None, func=None, add=None):
+        self.bindings[sequence] = func
+        return sequence
+
+    def unbind(self, sequence, funcid=None):
+        self.bindings.pop(sequence, None)
+
+    def protocol(self, name=None, func=None):
+        self.protocols[name] = func
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+    def winfo_exists(self):
+        return self.alive
+
+    def title(self, *args):
+        pass
+
+    def state(self, *args):
+        pass
+
+    def withdraw(self):
+        pass
+
+    def update(self):
+        pass
+
+    def update_idletasks(self):
+        pass
+
+    def quit(self):
+        pass
+
+    def destroy(self):
+        self.alive = False
+        self._queue.clear()
+        self._callbacks.clear()
+
+
+class _Item:
+    __slots__ = ('type', 'coords', 'opts', 'tags')
+
+    def __init__(self, item_type, coords, opts, tags):
+        self.type = item_type
+        self.coords = coords
+        self.opts = opts
+        self.tags = tags
+
+
+def _flat(coords):
+    """Coordinates given inline or as one sequence (of numbers or pairs), as a flat list.
+
+    Numbers are kept as given; coords() converts them to floats when read back.
+    """
+    if len(coords) == 1 and isinstance(coords[0], (list, tuple)):
+        coords = coords[0]
+    if coords and isinstance(coords[0], (list, tuple)):
+        return [v for pair in coords for v in pair]
+    return list(coords)
+
+
+def _tag_tuple(tags):
+    if not tags:
+        return ()
+    if isinstance(tags, str):
+        return tuple(tags.split())
+    return tuple(str(t) for t in tags)
+
+
+def _font_size(font):
+    """Point size of a Tk font spec such as ('Arial', 14, 'bold') or 'Arial 14'."""
+    if isinstance(font, str):
+        font = font.split()
+    if isinstance(font, (list, tuple)):
+        for part in font[1:]:
+            try:
+                return abs(int(part))
+            except (TypeError, ValueError):
+                pass
+    return DEFAULT_FONT_SIZE
+
+
+class MemoryCanvas:
+    """tk.Canvas stand-in that keeps items in memory and draws nothing."""
+
+    def __init__(self, master=None, width=None, height=None, **options):
+        self.master = master if master is not None else MemoryRoot()
+        self.width = width if width is not None else getattr(self.master, 'width', 1280)
+        self.height = height if height is not None else getattr(self.master, 'height', 720)
+        self.options = dict(options, width=self.width, height=self.height)
+        self.items = {}    # id -> _Item
+        self.order = []    # display list, bottom to top
+        self.tagged = {}   # tag -> {id: None}, in tagging order
+        self.bindings = {}
+        self.calls = 0     # canvas commands received
+        self._next_id = 1
+        self._alive = True
+
+    # ---------------- Widget ----------------
+    def configure(self, cnf=None, **options):
+        self.calls += 1
+        if cnf:
+            options.update(cnf)
+        self.options.update(options)
+
+    config = configure
+
+    def cget(self, option):
+        return self.options.get(option, '')
+
+    def after(self, ms, func=None, *args):
+        return self.master.after(ms, func, *args)
+
+    def after_cancel(self, after_id):
+        self.master.after_cancel(after_id)
+
+    def bind(self, sequence=None, func=None, add=None):
+        self.bindings[None, sequence] = func
+        return sequence
+
+    def unbind(self, sequence, funcid=None):
+        self.bindings.pop((None, sequence), None)
+
+    def tag_bind(self, tag, sequence=None, func=None, add=None):
+        self.bindings[tag, sequence] = func
+        return sequence
+
+    def pack(self, **options):
+        pass
+
+    def focus_set(self):
+        pass
+
+    def update_idletasks(self):
+        pass
+
+    def winfo_exists(self):
+        return self._alive and bool(self.master.winfo_exists())
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+    def destroy(self):
+        self._alive = False
+
+    # ---------------- Items ----------------
+    def _create(self, item_type, coords, options):
+        self.calls += 1
+        item = self._next_id
+        self._next_id += 1
+        tags = _tag_tuple(options.pop('tags', None))
+        self.items[item] = _Item(item_type, _flat(coords), options, tags)
+        self.order.append(item)
+        tagged = self.tagged
+        for tag in tags:
+            tagged.setdefault(tag, {})[item] = None
+        return item
+
+    def create_oval(self, *coords, **options):
+        return self._create('oval', coords, options)
+
+    def create_rectangle(self, *coords, **options):
+        return self._create('rectangle', coords, options)
+
+    def create_polygon(self, *coords, **options):
+        return self._create('polygon', coords, options)
+
+    def create_line(self, *coords, **options):
+        return self._create('line', coords, options)
+
+    def create_arc(self, *coords, **options):
+        return self._create('arc', coords, options)
+
+    def create_text(self, *coords, **options):
+        return self._create('text', coords, options)
+
+    def create_image(self, *coords, **options):
+        return self._create('image', coords, options)
+
+    def create_window(self, *coords, **options):
+        return self._create('window', coords, options)
+
+    def _find(self, tag):
+        """Ids matching an id or tag, bottom to top."""
+        items = self.items
+        if isinstance(tag, int):
+            return [tag] if tag in items else []
+        if tag == 'all':
+            return list(self.order)
+        if isinstance(tag, str) and tag.isdigit():
+            tag = int(tag)
+            return [tag] if tag in items else []
+        ids = self.tagged.get(tag)
+        if not ids:
+            return []
+        if len(ids) == 1:
+            return list(ids)
+        index = self.order.index
+        return sorted(ids, key=index)
+
+    def _first(self, tag):
+        """The lowest item matching `tag`, or None."""
+        if isinstance(tag, int):
+            return self.items.get(tag)
+        found = self._find(tag)
+        return self.items[found[0]] if found else None
+
+    def coords(self, tag, *coords):
+        self.calls += 1
+        item = self.items.get(tag) if type(tag) is int else self._first(tag)
+        if coords:
+            if item is not None:
+                item.coords = _flat(coords)
+            return None
+        return [float(c) for c in item.coords] if item is not None else []
+
+    def move(self, tag, dx, dy):
+        self.calls += 1
+        items = self.items
+        for i in self._find(tag):
+            c = items[i].coords
+            for j in range(0, len(c) - 1, 2):
+                c[j] += dx
+                c[j + 1] += dy
+
+    def _extent(self, item):
+        c = item.coords
+        if item.type == 'text' and len(c) >= 2:
+            size = _font_size(item.opts.get('font'))
+            lines = str(item.opts.get('text', '')).split('\n')
+            half_w = max(len(line) for line in lines) * size * TEXT_WIDTH_RATIO / 2
+            half_h = len(lines) * size * TEXT_HEIGHT_RATIO / 2
+            return c[0] - half_w, c[1] - half_h, c[0] + half_w, c[1] + half_h
+        if not c:
+            return None
+        xs = c[0::2]
+        ys = c[1::2]
+        return min(xs), min(ys), max(xs), max(ys)
+
+    def bbox(self, *tags):
+        self.calls += 1
+        box = None
+        for tag in tags:
+            for i in self._find(tag):
+                item = self.items[i]
+                if item.opts.get('state') == 'hidden':
+                    continue  # Tk leaves hidden items out
+                e = self._extent(item)
+                if e is None:
+                    continue
+                box = e if box is None else (min(box[0], e[0]), min(box[1], e[1]),
+                                             max(box[2], e[2]), max(box[3], e[3]))
+        if box is None:
+            return None
+        return int(box[0]), int(box[1]), int(box[2] + 0.999), int(box[3] + 0.999)
+
+    def itemconfig(self, tag, cnf=None, **options):
+        self.calls += 1
+        if cnf:
+            options.update(cnf)
+        tags = options.pop('tags', None)
+        items = self.items
+        for i in self._find(tag):
+            item = items[i]
+            item.opts.update(options)
+            if tags is not None:
+                self._retag(i, item, _tag_tuple(tags))
+
+    itemconfigure = itemconfig
+
+    def _retag(self, i, item, tags):
+        tagged = self.tagged
+        for tag in item.tags:
+            ids = tagged.get(tag)
+            if ids is not None:
+                ids.pop(i, None)
+                if not ids:
+                    del tagged[tag]
+        item.tags = tags
+        for tag in tags:
+            tagged.setdefault(tag, {})[i] = None
+
+    def itemcget(self, tag, option):
+        self.calls += 1
+        item = self._first(tag)
+        if item is None:
+            return ''
+        if option == 'tags':
+            return ' '.join(item.tags)
+        value = item.opts.get(option, '')
+        return value if isinstance(value, str) else str(value)
+
+    def delete(self, *tags):
+        self.calls += 1
+        for tag in tags:
+            if tag == 'all':
+                self.items.clear()
+                self.order.clear()
+                self.tagged.clear()
+                continue
+            for i in self._find(tag):
+                item = self.items.pop(i)
+                self.order.remove(i)
+                self._retag(i, item, ())
+
+    def _restack(self, tag, reference, above):
+        """Move the items matching `tag` above (or below) `reference`, or to the top (bottom)."""
+        self.calls += 1
+        moving = self._find(tag)
+        if not moving:
+            return
+        order = self.order
+        if reference is not None:
+            ref = self._find(reference)
+            if not ref:
+                return
+            # Tk places relative to the topmost (lift) or lowest (lower) reference item
+            anchor = ref[-1] if above else ref[0]
+            if anchor in moving:
+                return
+        for i in moving:
+            order.remove(i)
+        if reference is None:
+            if above:
+                order.extend(moving)
+            else:
+                order[:0] = moving
+            return
+        at = order.index(anchor) + (1 if above else 0)
+        order[at:at] = moving
+
+    def lift(self, tag, above=None):
+        self._restack(tag, above, True)
+
+    tag_raise = lift
+
+    def lower(self, tag, below=None):
+        self._restack(tag, below, False)
+
+    tag_lower = lower
+
+    def find_all(self):
+        return tuple(self.order)
+
+    def find_withtag(self, tag):
+        return tuple(self._find(tag))
+
+    def type(self, tag):
+        item = self._first(tag)
+        return item.type if item is not None else None
+
+    def gettags(self, tag):
+        item = self._first(tag)
+        return item.tags if item is not None else ()
@@ -0,0 +1,228 @@
+"""Pooled particle system for Rift of Memories and Regrets.
+
+Every short-lived visual that drifts, grows and fades (shield and slow-motion
+bursts, freeze flakes and thaw shards, rewind ghosts, focus-pulse rings, the
+game-over burst) is a particle here. Particles live in preallocated NumPy
+columns and are advanced together once per frame; their canvas items come
+from the shared ItemPool. The number of live particles is capped, so
+overlapping effects retire the oldest particles instead of adding Tk items
+without bound.
+
+Each particle belongs to a ParticleStyle that fixes its item type, colour
+option and fade. Fades use a colour ramp built once per style, and an item's
+colour is only rewritten when its ramp step changes.
+"""
+import numpy as np
+
+from canvas_view import tint_ramp
+
+# Most particles alive at once, across all styles
+MAX_PARTICLES = 800
+
+# Steps in a fade ramp
+FADE_STEPS = 16
+
+
+class ParticleStyle:
+    """How one family of particles looks.
+
+    item_type -- pooled canvas item type ('oval' or 'rectangle')
+    color     -- colour while the particle is not fading
+    fade      -- seconds before death over which it fades (0 = no fade)
+    fade_from -- colour when the fade starts (default: `color`)
+    fade_to   -- colour at death
+    option    -- item option the colour goes to ('fill' or 'outline')
+    drag      -- (x, y) velocity kept per legacy 20 Hz frame
+    layer     -- canvas layer the items go into
+    opts      -- other item options, set once when the item is acquired
+    """
+    __slots__ = ('name', 'item_type', 'color', 'option', 'fade', 'drag', 'layer', 'opts', 'colors')
+
+    def __init__(self, name, item_type='oval', color='#ffffff', fade=0.0, fade_from=None,
+                 fade_to='#000000', option='fill', drag=(1.0, 1.0), layer='effects', **opts):
+        self.name = name
+        self.item_type = item_type
+        self.color = color
+        self.option = option
+        self.fade = fade
+        self.drag = drag
+        self.layer = layer
+        self.opts = opts
+        # Ramp step -> colour, from death (0) to fade start (FADE_STEPS); one more
+        # entry for the colour before the fade
+        self.colors = tint_ramp(fade_to, fade_from or color, FADE_STEPS) + (color,)
+
+
+PARTICLE_STYLES = {}
+
+
+def register_style(name, **spec):
+    """Declare a particle style. Registration order fixes style codes."""
+    style = ParticleStyle(name, **spec)
+    PARTICLE_STYLES[name] = style
+    return style
+
+
+register_style('shield', color='#9966ff', fade=0.4, fade_from='#ff66ff', fade_to='#0066ff', outline='')
+register_style('slowmo', color='#ff9933', fade=0.5, fade_from='#ffff33', fade_to='#ff0033', outline='')
+register_style('freeze', color='#c9f6ff', fade=0.5, fade_from='#99ddee', fade_to='#99ddee', outline='')
+register_style('shatter', color='#ffffff', fade=0.5, fade_from='#99ddee', fade_to='#99ddee', outline='')
+register_style('ghost', item_type='rectangle', color='#66ffcc', fade=0.5, option='outline', layer='tint', width=1)
+register_style('pulse', color='#66ffdd', fade=0.9, option='outline', width=3)
+register_style('game_over', color='#ff37ff', fade=3.5, fade_to='#001400', drag=(0.96, 0.963),
+               layer='overlay', outline='')
+
+STYLE_CODES = {name: code for code, name in enumerate(PARTICLE_STYLES)}
+_STYLES = tuple(PARTICLE_STYLES.values())
+_FADE = np.array([s.fade for s in _STYLES])
+_DRAG_X = np.array([s.drag[0] for s in _STYLES])
+_DRAG_Y = np.array([s.drag[1] for s in _STYLES])
+
+
+class ParticleSystem:
+    """All live particles, stored by column and drawn through pooled items."""
+
+    FIELDS = ('x', 'y', 'vx', 'vy', 'hw', 'hh', 'grow', 'life')
+
+    def __init__(self, pool, batch, cap=MAX_PARTICLES):
+        self.pool = pool
+        self.batch = batch
+        self.cap = cap
+        self.n = 0
+        for name in self.FIELDS:
+            setattr(self, name, np.zeros(cap))
+        self.style = np.zeros(cap, dtype=np.int16)
+        self.item = np.zeros(cap, dtype=np.int64)
+        self.shown = np.zeros(cap, dtype=np.int16)  # ramp step the item is drawn with
+        self.retired = 0  # particles dropped early to stay under the cap
+
+    def set_cap(self, cap):
+        """Lower or raise the live-particle cap, up to the allocated size; retires the excess."""
+        cap = max(0, min(cap, len(self.x)))
+        self.cap = cap
+        if self.n > cap:
+            self._retire(self.n - cap)
+
+    def count(self, style=None):
+        if style is None:
+            return self.n
+        return int(np.count_nonzero(self.style[:self.n] == STYLE_CODES[style]))
+
+    def spawn(self, style, x, y, vx=0.0, vy=0.0, life=1.0, w=4.0, h=None, grow=0.0):
+        """Add particles of `style`; any argument may be an array of one value per particle.
+
+        (x, y) is the center, w x h the size. Returns the number spawned.
+        """
+        cols = np.broadcast_arrays(x, y, vx, vy, life, w, w if h is None else h, grow)
+        k = cols[0].size
+        if k == 0:
+            return 0
+        if k > self.cap:
+            cols = [c.ravel()[k - self.cap:] for c in cols]
+            k = self.cap
+        if self.n + k > self.cap:
+            self._retire(self.n + k - self.cap)
+        x, y, vx, vy, life, w, h, grow = (np.ravel(c).astype(float) for c in cols)
+        st = PARTICLE_STYLES[style]
+        code = STYLE_CODES[style]
+        s, e = self.n, self.n + k
+        self.x[s:e] = x
+        self.y[s:e] = y
+        self.vx[s:e] = vx
+        self.vy[s:e] = vy
+        self.hw[s:e] = w / 2
+        self.hh[s:e] = h / 2
+        self.grow[s:e] = grow
+        self.life[s:e] = life
+        self.style[s:e] = code
+        self.shown[s:e] = FADE_STEPS + 1
+        acquire = self.pool.acquire
+        opts = dict(st.opts)
+        opts[st.option] = st.color
+        for i, (cx, cy, hw, hh) in enumerate(zip(x.tolist(), y.tolist(), (w / 2).tolist(), (h / 2).tolist()), s):
+            self.item[i] = acquire(st.item_type, (cx - hw, cy - hh, cx + hw, cy + hh), st.layer, **opts)
+        self.n = e
+        return k
+
+    def _retire(self, count):
+        """Release the `count` oldest particles."""
+        self._release(np.arange(count))
+        self._keep(np.arange(count, self.n))
+        self.retired += count
+
+    def _release(self, rows):
+        items = self.item[rows].tolist()
+        # Updates queued earlier in the frame must not reach the item's next owner
+        self.batch.discard(items)
+        release = self.pool.release
+        for item, code in zip(items, self.style[rows].tolist()):
+            release(_STYLES[code].item_type, item)
+
+    def _keep(self, rows):
+        m = len(rows)
+        for name in self.FIELDS + ('style', 'item', 'shown'):
+            arr = getattr(self, name)
+            arr[:m] = arr[rows]
+        self.n = m
+
+    def clear(self, style=None):
+        """Release every particle, or every particle of one style."""
+        n = self.n
+        if style is None:
+            self._release(np.arange(n))
+            self.n = 0
+            return
+        mine = self.style[:n] == STYLE_CODES[style]
+        if mine.any():
+            self._release(np.flatnonzero(mine))
+            self._keep(np.flatnonzero(~mine))
+
+    def discard(self):
+        """Forget every particle without touching its item, e.g. after the canvas was cleared."""
+        self.n = 0
+
+    def update(self, dt):
+        """Age, move, grow and fade every particle by dt seconds; updates are queued on the batch."""
+        n = self.n
+        if not n:
+            return
+        life = self.life[:n]
+        life -= dt
+        dead = life <= 0
+        if dead.any():
+            self._release(np.flatnonzero(dead))
+            self._keep(np.flatnonzero(~dead))
+            n = self.n
+            if not n:
+                return
+            life = self.life[:n]
+        style = self.style[:n]
+        vx, vy = self.vx[:n], self.vy[:n]
+        ticks = dt * 20  # drag is quoted per legacy 20 Hz frame
+        vx *= _DRAG_X[style] ** ticks
+        vy *= _DRAG_Y[style] ** ticks
+        x, y = self.x[:n], self.y[:n]
+        x += vx * dt
+        y += vy * dt
+        grow = self.grow[:n]
+        hw, hh = self.hw[:n], self.hh[:n]
+        hw += grow * dt
+        hh += grow * dt
+        batch = self.batch
+        moving = np.flatnonzero((vx != 0) | (vy != 0) | (grow != 0))
+        if len(moving):
+            mx, my, mw, mh = x[moving], y[moving], hw[moving], hh[moving]
+            for item, x1, y1, x2, y2 in zip(self.item[moving].tolist(), (mx - mw).tolist(), (my - mh).tolist(),
+                                            (mx + mw).tolist(), (my + mh).tolist()):
+                batch.coords(item, x1, y1, x2, y2)
+        # Ramp step from the share of the fade left; FADE_STEPS + 1 before the fade
+        fade = _FADE[style]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = np.where(life < fade, np.ceil(life / fade * FADE_STEPS), FADE_STEPS + 1).astype(np.int16)
+        shown = self.shown[:n]
+        changed = np.flatnonzero(step != shown)
+        if len(changed):
+            shown[changed] = step[changed]
+            for item, code, i in zip(self.item[changed].tolist(), style[changed].tolist(), step[changed].tolist()):
+                st = _STYLES[code]
+                batch.itemconfig(item, **{st.option: st.colors[i]})
@@ -0,0 +1,113 @@
+"""Bullet pattern registry for Rift of Memories and Regrets.
+
+Every bullet kind is declared once here: how it moves (a named motion kernel
+run by the simulation), when it leaves the field, what it is worth and when
+the game starts spawning it. The simulation runs all kinds through one
+generic pipeline, so adding a pattern is a register_pattern() call plus a
+spawner instead of another update loop.
+"""
+
+
+class BulletPattern:
+    """Declaration of one bullet kind.
+
+    motion   -- name of the simulation kernel that moves it ('linear', 'homing', ...)
+    bounds   -- (left, top, right, bottom) cull margins in px. A bullet is culled
+                once it is more than the margin beyond that edge of the field
+                (negative margins cull while it still overlaps the edge).
+                None disables that edge.
+    score    -- points for a bullet that leaves the field without hitting
+    expire_score -- points when its kernel retires it (bursts, spent bounces);
+                defaults to `score`
+    graze    -- points for grazing it (0 = cannot be grazed)
+    slowmo   -- movement is scaled by the slow-motion factor
+    expires  -- culled (and scored) when its timer runs out
+    bullet   -- False for hazards that are not bullets (lasers): excluded from
+                graze, shatter, ghosts, rewind and the focus pulse
+    unlock   -- key into the game's unlock_times; None for child kinds
+    chance   -- spawn chance once unlocked (1 in `chance` per CHANCE_PERIOD)
+    spawner  -- name of the game method that spawns it
+    """
+    __slots__ = ('name', 'motion', 'bounds', 'score', 'expire_score', 'graze', 'slowmo', 'expires',
+                 'bullet', 'unlock', 'chance', 'spawner')
+
+    def __init__(self, name, motion='linear', bounds=(None, None, None, 0), score=0,
+                 graze=1, slowmo=False, expires=False, bullet=True, unlock=None,
+                 chance=0, spawner=None, expire_score=None):
+        self.name = name
+        self.motion = motion
+        self.bounds = bounds
+        self.score = score
+        self.expire_score = score if expire_score is None else expire_score
+        self.graze = graze
+        self.slowmo = slowmo
+        self.expires = expires
+        self.bullet = bullet
+        self.unlock = unlock
+        self.chance = chance
+        self.spawner = spawner
+
+
+# Spawn odds are quoted per legacy 20 Hz frame, whatever the tick rate
+CHANCE_PERIOD = 0.05
+
+PATTERNS = {}
+
+
+def register_pattern(name, **spec):
+    """Declare a bullet kind. Registration order fixes kind codes and spawn order."""
+    pattern = BulletPattern(name, **spec)
+    PATTERNS[name] = pattern
+    return pattern
+
+
+# Edge margin presets
+FALL = (None, None, None, 0)            # culled once it falls past the bottom
+CONTAINED = (-20, None, -20, 0)         # culled as soon as it touches a side
+BURST = (20, 20, 20, 20)                # culled 20px beyond any edge
+
+# Spawned patterns, in the order the game rolls their spawn chances
+register_pattern('vertical', score=1, slowmo=True, unlock='vertical', chance=18, spawner='shoot_bullet')
+register_pattern('horizontal', bounds=(None, None, 0, None), score=1, slowmo=True,
+                 unlock='horizontal', chance=22, spawner='shoot_bullet2')
+register_pattern('diag', score=2, slowmo=True, unlock='diag', chance=28, spawner='shoot_diag_bullet')
+register_pattern('boss', score=5, graze=2, slowmo=True, unlock='boss', chance=140, spawner='shoot_boss_bullet')
+register_pattern('zigzag', motion='zigzag', bounds=CONTAINED, score=2, slowmo=True,
+                 unlock='zigzag', chance=40, spawner='shoot_zigzag_bullet')
+register_pattern('fast', score=2, slowmo=True, unlock='fast', chance=30, spawner='shoot_fast_bullet')
+register_pattern('star', score=3, slowmo=True, unlock='star', chance=55, spawner='shoot_star_bullet')
+register_pattern('rect', score=2, slowmo=True, unlock='rect', chance=48, spawner='shoot_rect_bullet')
+register_pattern('laser_indicator', motion='laser_warning', bounds=(None, None, None, None),
+                 graze=0, bullet=False, unlock='laser', chance=160, spawner='shoot_horizontal_laser')
+register_pattern('triangle', bounds=CONTAINED, score=2, graze=0, slowmo=True,
+                 unlock='triangle', chance=46, spawner='shoot_triangle_bullet')
+register_pattern('quad', score=2, slowmo=True, unlock='quad', chance=52, spawner='shoot_quad_bullet')
+register_pattern('egg', score=2, slowmo=True, unlock='egg', chance=50, spawner='shoot_egg_bullet')
+register_pattern('bouncing', motion='bounce', bounds=(None, None, None, None), score=2, graze=0,
+                 slowmo=True, unlock='bouncing', chance=70, spawner='shoot_bouncing_bullet')
+register_pattern('exploding', motion='explode', score=2, graze=0,
+                 unlock='exploding', chance=90, spawner='shoot_exploding_bullet')
+register_pattern('homing', motion='homing', bounds=(44, None, 44, 0), score=3, expires=True,
+                 unlock='homing', chance=110, spawner='shoot_homing_bullet')
+register_pattern('spiral', motion='spiral', bounds=(30, 30, 30, 30), score=2,
+                 unlock='spiral', chance=130, spawner='shoot_spiral_bullet')
+register_pattern('radial', bounds=BURST, score=1, unlock='radial', chance=150, spawner='shoot_radial_burst')
+# Wave culls once its center is 30px below the field (size 18)
+register_pattern('wave', motion='wave', bounds=(None, None, None, 21), score=2,
+                 unlock='wave', chance=160, spawner='shoot_wave_bullet')
+register_pattern('boomerang', motion='boomerang', bounds=(None, 30, None, 40), score=3,
+                 unlock='boomerang', chance=170, spawner='shoot_boomerang_bullet')
+register_pattern('split', motion='split', score=2, expire_score=3, unlock='split', chance=180, spawner='shoot_split_bullet')
+
+# Child kinds and patterns without a spawn schedule
+register_pattern('fragment', bounds=(-12, 0, -12, 0), score=1)
+register_pattern('split_shard', bounds=BURST, score=1)
+register_pattern('laser', motion='laser', bounds=(None, None, None, None), graze=0, bullet=False)
+register_pattern('ring', bounds=BURST, score=1)
+register_pattern('fan', bounds=BURST, score=1)
+register_pattern('static', score=2, slowmo=True)
+
+
+def spawn_schedule():
+    """Patterns the game spawns on its own, in roll order."""
+    return [p for p in PATTERNS.values() if p.unlock is not None]
@@ -0,0 +1,121 @@
+"""Per-subsystem frame profiler for Rift of Memories and Regrets.
+
+The game marks the end of each subsystem's work in a wake-up with lap(name),
+which charges the time since the previous mark to that section; a section
+that runs several times in one wake-up (once per sim tick, say) adds up.
+end_frame() closes the wake-up: its sections join a rolling window of recent
+frames, and a row goes to the CSV log when one is open. Timings are integer
+nanoseconds from perf_counter_ns, so a lap costs one clock read and one dict
+update.
+
+Sections named 'bullets.<motion>' are the simulation's motion kernels and the
+shared settle pass, timed inside BulletSimulation.step(). They are a
+breakdown of the 'bullets' section, not extra time.
+"""
+import csv
+import time
+from collections import deque
+
+from simulation import MOTIONS
+
+# Subsystems the game times, in the order a wake-up runs them
+GAME_SECTIONS = ('input', 'player', 'powerups', 'spawning', 'snapshot', 'bullets', 'rewind',
+                 'background', 'hud', 'lore', 'particles', 'effects', 'sync', 'debug')
+BULLET_SECTIONS = tuple('bullets.' + name for name in MOTIONS + ('settle',))
+
+# Frames in the rolling window shown on the debug HUD
+PROFILE_WINDOW = 120
+
+
+class FrameProfiler:
+    """Named timing sections accumulated per frame, with a rolling window and an optional CSV log."""
+
+    def __init__(self, sections=GAME_SECTIONS + BULLET_SECTIONS, window=PROFILE_WINDOW, clock=time.perf_counter_ns):
+        self.sections = tuple(sections)
+        self.clock = clock
+        self.window = window
+        self.frame = dict.fromkeys(self.sections, 0)  # ns charged in the current frame
+        self.history = deque()  # (total ns, section ns tuple) of recent frames
+        self.sums = [0] * len(self.sections)  # section ns over the window
+        self.frames = 0  # frames ended since the start
+        self._start = self._mark = clock()
+        self._csv_file = None
+        self._csv = None
+
+    def start(self):
+        """Begin a frame: the next lap counts from now."""
+        self._start = self._mark = self.clock()
+
+    def lap(self, name):
+        """Charge the time since the previous mark to section `name`."""
+        now = self.clock()
+        self.frame[name] += now - self._mark
+        self._mark = now
+
+    def add(self, name, ns):
+        """Charge `ns` measured elsewhere to section `name`."""
+        self.frame[name] += ns
+
+    def end_frame(self, game_time=0.0):
+        """Close the frame: roll its sections into the window and log them."""
+        total = self.clock() - self._start
+        frame = self.frame
+        values = tuple(frame.values())
+        self.history.append((total, values))
+        sums = self.sums
+        for i, v in enumerate(values):
+            sums[i] += v
+        if len(self.history) > self.window:
+            for i, v in enumerate(self.history.popleft()[1]):
+                sums[i] -= v
+        self.frames += 1
+        if self._csv is not None:
+            self._csv.writerow([self.frames, round(game_time, 3), round(total / 1e6, 4)]
+                               + [round(v / 1e6, 4) for v in values])
+        self.frame = dict.fromkeys(self.sections, 0)
+
+    def averages(self):
+        """Section -> average ms per frame over the window."""
+        count = len(self.history)
+        if not count:
+            return {}
+        return {name: total / count / 1e6 for name, total in zip(self.sections, self.sums)}
+
+    def slowest(self):
+        """(total ms, {section: ms}) of the slowest frame in the window, or None."""
+        if not self.history:
+            return None
+        total, values = max(self.history, key=lambda entry: entry[0])
+        return total / 1e6, {name: v / 1e6 for name, v in zip(self.sections, values)}
+
+    def summary(self, top=6):
+        """Debug HUD lines: top sections on average, the bullet breakdown and the slowest frame."""
+        avg = self.averages()
+        if not avg:
+            return ['Profile: no frames yet']
+
+        def ranked(names, data, limit=None):
+            shown = sorted((n for n in names if data[n] >= 0.005), key=data.get, reverse=True)[:limit]
+            return '  '.join(f"{n.rsplit('.', 1)[-1]} {data[n]:.2f}" for n in shown) or '-'
+
+        main = [n for n in self.sections if not n.startswith('bullets.')]
+        kernels = [n for n in self.sections if n.startswith('bullets.')]
+        lines = [f"Profile ms/frame ({len(self.history)}f): {ranked(main, avg, top)}",
+                 f"  bullets: {ranked(kernels, avg, top)}"]
+        total, worst = self.slowest()
+        lines.append(f"  slowest {total:.1f}ms: {ranked(main, worst, 3)}")
+        return lines
+
+    # ---------------- CSV log ----------------
+    def open_csv(self, path):
+        """Log every frame from now on to `path` (ms per section, one row per frame)."""
+        self.close_csv()
+        self._csv_file = open(path, 'w', newline='', encoding='utf-8')
+        self._csv = csv.writer(self._csv_file)
+        self._csv.writerow(('frame', 'game_time', 'total_ms') + self.sections)
+
+    def close_csv(self):
+        if self._csv_file is not None:
+            self._csv_file.close()
+        self._csv_file = None
+        self._csv = None
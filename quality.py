@@ -0,0 +1,97 @@
+"""Adaptive effect quality for Rift of Memories and Regrets.
+
+The QualityGovernor watches measured frame times and steps through
+QUALITY_TIERS: when the worst frame of a window blows the budget, cosmetic
+work (background grid detail, particles, rewind ghosts, freeze flakes, star
+spin, background colour refresh) is shed one tier at a time before gameplay
+stutters; after several calm windows in a row it steps back up. It only
+decides the tier; the game applies it. Like LoopClock it never touches Tk, so
+it can be driven by recorded samples in tests.
+"""
+from collections import deque
+
+
+class QualityTier:
+    """Effect settings for one quality level.
+
+    grid_step    -- draw every n-th background grid line
+    particle_cap -- most particles alive at once
+    ghost_cap    -- most rewind ghosts alive at once
+    flake_rate   -- freeze flakes spawned per second
+    star_spin    -- star bullets rotate
+    color_every  -- background colours are refreshed every n-th frame
+    """
+    __slots__ = ('name', 'grid_step', 'particle_cap', 'ghost_cap', 'flake_rate', 'star_spin', 'color_every')
+
+    def __init__(self, name, grid_step, particle_cap, ghost_cap, flake_rate, star_spin, color_every):
+        self.name = name
+        self.grid_step = grid_step
+        self.particle_cap = particle_cap
+        self.ghost_cap = ghost_cap
+        self.flake_rate = flake_rate
+        self.star_spin = star_spin
+        self.color_every = color_every
+
+
+# Best first
+QUALITY_TIERS = (
+    QualityTier('High', grid_step=1, particle_cap=800, ghost_cap=300, flake_rate=60, star_spin=True, color_every=1),
+    QualityTier('Medium', grid_step=1, particle_cap=500, ghost_cap=150, flake_rate=40, star_spin=True, color_every=2),
+    QualityTier('Low', grid_step=2, particle_cap=250, ghost_cap=60, flake_rate=20, star_spin=False, color_every=4),
+    QualityTier('Minimal', grid_step=4, particle_cap=100, ghost_cap=0, flake_rate=8, star_spin=False, color_every=8),
+)
+
+# A frame over this many expected frame intervals counts as a stutter
+STUTTER_FACTOR = 2.0
+# Frames under this many expected intervals count as calm
+CALM_FACTOR = 1.25
+
+
+class QualityGovernor:
+    """Picks a QUALITY_TIERS index from windows of frame-time samples."""
+
+    def __init__(self, frame_ms, window=30, calm_windows=5, tiers=QUALITY_TIERS):
+        self.tiers = tiers
+        self.window = window              # samples per decision
+        self.calm_windows = calm_windows  # calm windows in a row before stepping up
+        self.samples = deque(maxlen=window)
+        self.tier = 0
+        self.calm = 0
+        self.changes = 0
+        self.set_frame_time(frame_ms)
+
+    def set_frame_time(self, frame_ms):
+        """Expected ms between frames, e.g. after the tick or frame rate changed."""
+        self.frame_ms = frame_ms
+        self.budget_ms = frame_ms * STUTTER_FACTOR
+        self.samples.clear()
+
+    @property
+    def current(self):
+        return self.tiers[self.tier]
+
+    def sample(self, frame_ms):
+        """Add one frame time; returns True when the tier changed."""
+        samples = self.samples
+        samples.append(frame_ms)
+        if len(samples) < self.window:
+            return False
+        worst = max(samples)
+        samples.clear()
+        if worst > self.budget_ms:
+            self.calm = 0
+            if self.tier < len(self.tiers) - 1:
+                self.tier += 1
+                self.changes += 1
+                return True
+            return False
+        if worst < self.frame_ms * CALM_FACTOR:
+            self.calm += 1
+            if self.calm >= self.calm_windows and self.tier > 0:
+                self.calm = 0
+                self.tier -= 1
+                self.changes += 1
+                return True
+        else:
+            self.calm = 0
+        return False
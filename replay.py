@@ -0,0 +1,120 @@
+"""Seeded runs and input replays for Rift of Memories and Regrets.
+
+A run is reproducible when everything that shapes it comes from the run's
+seed, the simulation tick count and the player's inputs. The game draws all
+gameplay randomness from a random.Random seeded per run, times power-ups and
+unlocks in simulation time, and routes every player input through one place
+where a Replay can record it, stamped with the tick it was applied before.
+Static trap mashes happen while game time stands still, so they also carry
+the trap time they were made at and are held back until the replayed trap
+gets that far.
+
+Replay files are gzipped JSON: the seed, the settings that change gameplay,
+the inputs as [ticks since the previous input, kind, args...] and a state
+digest every CHECK_EVERY ticks. Playing one back feeds the same inputs before
+the same ticks and reports the first tick whose digest differs. Like
+LoopClock, nothing here touches Tk.
+"""
+import gzip
+import json
+
+REPLAY_VERSION = 1
+
+# Ticks between state digests
+CHECK_EVERY = 100
+
+# Settings recorded with a run and put back before it is played
+REPLAY_SETTINGS = ('sim_rate', 'difficulty_multiplier', 'player_speed', 'unlock_times')
+
+
+class Replay:
+    """Inputs of one run, recorded or being played back."""
+
+    def __init__(self, seed, settings=None, events=None, digests=None, ticks=0):
+        self.seed = seed
+        self.settings = dict(settings or {})
+        self.events = list(events or [])    # (tick, kind, args)
+        self.digests = dict(digests or {})  # tick -> state digest
+        self.ticks = ticks                  # length of the recorded run
+        self.playing = False
+        self.cursor = 0
+        self.diverged = None  # first tick whose digest did not match
+
+    @classmethod
+    def record_new(cls, seed, settings):
+        return cls(seed, {name: settings[name] for name in REPLAY_SETTINGS if name in settings})
+
+    def record(self, tick, kind, args=()):
+        self.events.append((tick, kind, tuple(args)))
+        self.ticks = max(self.ticks, tick)
+
+    def inputs_at(self, tick, ready=None):
+        """The recorded inputs applied before `tick`, each returned once.
+
+        `ready`, when given, is asked about each due input in order; the first
+        one it turns down and those after it stay queued for a later call.
+        """
+        events = self.events
+        start = self.cursor
+        end = start
+        while end < len(events) and events[end][0] <= tick and (ready is None or ready(events[end])):
+            end += 1
+        self.cursor = end
+        return events[start:end]
+
+    def check(self, tick, digest):
+        """Record a digest, or compare it while playing; False on the first mismatch."""
+        if not self.playing:
+            self.digests[tick] = digest
+            self.ticks = max(self.ticks, tick)
+            return True
+        expected = self.digests.get(tick)
+        if expected is None or expected == digest:
+            return True
+        if self.diverged is None:
+            self.diverged = tick
+        return False
+
+    def finished(self, tick):
+        return self.playing and tick >= self.ticks and self.cursor >= len(self.events)
+
+    def start_playback(self):
+        self.playing = True
+        self.cursor = 0
+        self.diverged = None
+
+    def to_dict(self):
+        events = []
+        last = 0
+        for tick, kind, args in self.events:
+            events.append([tick - last, kind, *args])
+            last = tick
+        return {
+            'version': REPLAY_VERSION,
+            'seed': self.seed,
+            'settings': self.settings,
+            'ticks': self.ticks,
+            'events': events,
+            'digests': [[tick, value] for tick, value in sorted(self.digests.items())],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get('version') != REPLAY_VERSION:
+            raise ValueError(f"unsupported replay version {data.get('version')!r}")
+        events = []
+        tick = 0
+        for entry in data['events']:
+            tick += entry[0]
+            events.append((tick, entry[1], tuple(entry[2:])))
+        digests = {tick: value for tick, value in data.get('digests', ())}
+        return cls(data['seed'], data.get('settings'), events, digests, data.get('ticks', 0))
+
+    def save(self, path):
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path):
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
@@ -0,0 +1,618 @@
+"""Headless bullet simulation for Rift of Memories and Regrets.
+
+The simulation owns every bullet's state (position, velocity, timers and
+shape) and advances it without touching Tk. The game's canvas is only a view
+of this model that is synced once per frame (see canvas_view.py), so physics
+no longer pays a Tcl round-trip per bullet and the field can run headless.
+
+Bullets are kept in a columnar store (one NumPy array per field plus a live
+mask). Each step runs the motion kernels declared in the pattern registry
+(patterns.py) over all bullets that use them, then one shared pass handles
+collision, culling, scoring and grazing for every kind. Hit and graze tests
+only look at bullets whose centers fall in a window around the player.
+
+All rates are per second: velocities are px/s, timers count down seconds and
+step() advances the field by an explicit dt, so the game's fixed-timestep
+loop can run as many steps as it needs to catch up.
+
+Rewind history is a RewindHistory: a ring of packed frames of the complete
+field state in preallocated arrays, so recording a tick is a few slice
+copies, its memory does not grow with the bullet count, and a rewound bullet
+resumes with the velocity, timer and phase it had at that tick.
+"""
+import math
+import time
+import zlib
+
+import numpy as np
+
+from patterns import PATTERNS
+
+# Kind code = index in registration order
+KINDS = tuple(PATTERNS)
+KIND_CODES = {name: code for code, name in enumerate(KINDS)}
+
+# Bits in the flags column
+FLAG_GRAZED = 1
+FLAG_RETURNING = 2  # boomerang on its way back up
+
+# Motion kernels, in the order the pipeline runs them
+MOTIONS = ('zigzag', 'linear', 'bounce', 'explode', 'homing', 'spiral', 'wave',
+           'boomerang', 'split', 'laser_warning', 'laser')
+
+# Profiler section per motion kernel
+_KERNEL_SECTIONS = tuple('bullets.' + name for name in MOTIONS)
+
+# Slack for timers that are a whole number of steps long, so float error in
+# `timer -= dt` does not push expiry back by one step
+TIMER_EPSILON = 1e-9
+# Seconds between zigzag direction flips
+ZIGZAG_PERIOD = 0.5
+# Homing bullets: cruise speed (px/s) and the share of the velocity steered
+# toward the player per 1/20 s
+HOMING_SPEED = 120.0
+HOMING_STEER = 0.15
+# Seconds a laser stays lit after its warning line runs out
+LASER_DURATION = 1.0
+# A bullet is grazed when its center comes within grazing_radius + GRAZE_MARGIN
+# of the player's center
+GRAZE_MARGIN = 10
+
+
+def _pattern_table(field, dtype=float, convert=None):
+    """Lookup array indexed by kind code, built from one registry field."""
+    values = [getattr(PATTERNS[name], field) for name in KINDS]
+    if convert is not None:
+        values = [convert(v) for v in values]
+    return np.array(values, dtype=dtype)
+
+
+_MOTION = _pattern_table('motion', np.int16, MOTIONS.index)
+_SLOWMO = _pattern_table('slowmo', bool)
+_SCORE = _pattern_table('score', np.int64)
+_EXPIRE_SCORE = _pattern_table('expire_score', np.int64)
+_GRAZE = _pattern_table('graze', np.int64)
+_EXPIRES = _pattern_table('expires', bool)
+_BULLET = _pattern_table('bullet', bool)
+# Edge margins; an edge that never culls gets an infinite margin
+_MARGINS = [np.array([np.inf if p.bounds[edge] is None else p.bounds[edge]
+                      for p in PATTERNS.values()]) for edge in range(4)]
+
+
+def contacts(x1, y1, x2, y2, player_rect, graze_reach):
+    """Hit and graze masks for arrays of bullet boxes against the player.
+
+    A hit is an overlap of the bullet box with the player rectangle, a graze
+    a box center within graze_reach of the player's center. Stars and
+    triangles are tested by their box like every other shape.
+    """
+    px1, py1, px2, py2 = player_rect
+    hit = (px1 < x2) & (px2 > x1) & (py1 < y2) & (py2 > y1)
+    graze = np.hypot((px1 + px2 - x1 - x2) / 2, (py1 + py2 - y1 - y2) / 2) < graze_reach
+    return hit, graze
+
+
+class BulletStore:
+    """Columnar bullet storage: one array per field, rows [0, n) in use.
+
+    Rows stay in spawn order, so bullet ids are sorted within [0, n).
+    Removal clears the live mask; compact() drops dead rows in one pass.
+    """
+    FLOAT_FIELDS = ('x', 'y', 'vx', 'vy', 'w', 'h', 'timer', 'phase', 'ox', 'oy', 'amp', 'rate')
+    # Everything a bullet is, i.e. what a snapshot has to keep
+    STATE_FIELDS = FLOAT_FIELDS + ('kind', 'flags', 'bid')
+
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.n = 0
+        for name in self.FLOAT_FIELDS:
+            setattr(self, name, np.zeros(capacity))
+        self.kind = np.zeros(capacity, dtype=np.int16)
+        self.flags = np.zeros(capacity, dtype=np.uint8)
+        self.bid = np.zeros(capacity, dtype=np.int64)
+        self.live = np.zeros(capacity, dtype=bool)
+
+    def _columns(self):
+        return self.STATE_FIELDS + ('live',)
+
+    def _grow(self):
+        new_capacity = self.capacity * 2
+        for name in self._columns():
+            old = getattr(self, name)
+            arr = np.zeros(new_capacity, dtype=old.dtype)
+            arr[:self.capacity] = old
+            setattr(self, name, arr)
+        self.capacity = new_capacity
+
+    def add(self, bid, kind, x, y, w, h, vx, vy, timer, phase, ox, oy, amp, rate, flags):
+        if self.n >= self.capacity:
+            self._grow()
+        i = self.n
+        self.bid[i] = bid
+        self.kind[i] = kind
+        self.x[i] = x
+        self.y[i] = y
+        self.w[i] = w
+        self.h[i] = h
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.timer[i] = timer
+        self.phase[i] = phase
+        self.ox[i] = ox
+        self.oy[i] = oy
+        self.amp[i] = amp
+        self.rate[i] = rate
+        self.flags[i] = flags
+        self.live[i] = True
+        self.n = i + 1
+        return i
+
+    def compact(self):
+        """Drop dead rows, keeping the survivors in order."""
+        n = self.n
+        keep = self.live[:n]
+        m = int(np.count_nonzero(keep))
+        if m == n:
+            return
+        for name in self._columns():
+            arr = getattr(self, name)
+            arr[:m] = arr[:n][keep]
+        self.live[m:n] = False
+        self.n = m
+
+
+# Rows a RewindHistory keeps by default (59 bytes each, about 15 MB)
+REWIND_ROW_BUDGET = 1 << 18
+
+
+class RewindHistory:
+    """Ring buffer of complete bullet-field frames with a fixed memory budget.
+
+    A frame holds every store column (positions, velocities, timers, phases,
+    motion parameters, flags, kinds and ids) of every bullet alive at that
+    tick, floats packed as float32. Frames are laid out one after another in
+    preallocated arrays of `rows` entries; a frame that would run past the
+    end starts over at row 0. Recording a frame drops the oldest frames
+    whose rows it overwrites, and the oldest frame once `frames` are held.
+    history[i] is the i-th oldest frame as a dict of column views, valid
+    until the next capture.
+    """
+
+    def __init__(self, frames, rows=REWIND_ROW_BUDGET):
+        self.frames = max(1, int(frames))
+        self.rows = max(1, int(rows))
+        self.columns = {name: np.zeros(self.rows, dtype=np.float32) for name in BulletStore.FLOAT_FIELDS}
+        self.columns['kind'] = np.zeros(self.rows, dtype=np.int16)
+        self.columns['flags'] = np.zeros(self.rows, dtype=np.uint8)
+        self.columns['bid'] = np.zeros(self.rows, dtype=np.int64)
+        # Per frame slot: first row (counted from the start of recording) and row count
+        self.start = np.zeros(self.frames, dtype=np.int64)
+        self.count = np.zeros(self.frames, dtype=np.int64)
+        self.clear()
+
+    def clear(self):
+        self.first = 0  # number of the oldest frame held
+        self.next = 0   # number of the next frame recorded
+        self.head = 0   # row after the newest frame, counted from the start
+
+    def __len__(self):
+        return self.next - self.first
+
+    def __getitem__(self, i):
+        size = self.next - self.first
+        if i < 0:
+            i += size
+        if not 0 <= i < size:
+            raise IndexError('rewind frame out of range')
+        slot = (self.first + i) % self.frames
+        s = int(self.start[slot] % self.rows)
+        e = s + int(self.count[slot])
+        return {name: col[s:e] for name, col in self.columns.items()}
+
+    def capture(self, store):
+        """Record every row of a BulletStore (all live between steps) as the newest frame."""
+        rows = self.rows
+        k = min(store.n, rows)
+        head = self.head
+        if head % rows + k > rows:
+            head += rows - head % rows  # wrap to row 0
+        # Drop frames whose rows this one overwrites, and the oldest when all slots are used
+        start = self.start
+        frames = self.frames
+        limit = head + k - rows
+        while self.first < self.next and (start[self.first % frames] < limit
+                                          or self.next - self.first >= frames):
+            self.first += 1
+        s = head % rows
+        for name, col in self.columns.items():
+            col[s:s + k] = getattr(store, name)[:k]
+        slot = self.next % frames
+        start[slot] = head
+        self.count[slot] = k
+        self.next += 1
+        self.head = head + k
+
+
+class StepResult:
+    """What happened to the player during one simulation step."""
+    __slots__ = ('hits', 'grazes', 'points')
+
+    def __init__(self):
+        self.hits = []      # kinds of bullets that hit the player
+        self.grazes = 0     # number of new grazes
+        self.points = 0     # score earned (dodged bullets + grazes)
+
+
+class BulletSimulation:
+    """Bullet field model: spawning, movement, culling, collision and graze."""
+
+    KINDS = KINDS
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.store = BulletStore()
+        self._next_id = 1
+        self._removed = []
+        self.dirty = False
+        # Player hitbox (x1, y1, x2, y2), pushed in by the game every frame
+        self.player_rect = (0.0, 0.0, 0.0, 0.0)
+        self.collisions_enabled = True
+        self.grazing_radius = 40
+        self.difficulty = 1
+        self._kernels = [getattr(self, '_move_' + name) for name in MOTIONS]
+        self.profile = None  # FrameProfiler timing each kernel (see profiler.py)
+
+    # ---------------- Spawning / bookkeeping ----------------
+    def spawn(self, kind, x, y, w, h, vx=0.0, vy=0.0, timer=0, phase=0.0,
+              ox=0.0, oy=0.0, amp=0.0, rate=0.0, flags=0):
+        """Add a bullet of the given family and return its id."""
+        bid = self._next_id
+        self._next_id += 1
+        self.store.add(bid, KIND_CODES[kind], x, y, w, h, vx, vy, timer, phase,
+                       ox, oy, amp, rate, flags)
+        self.dirty = True
+        return bid
+
+    def drain_removed(self):
+        removed, self._removed = self._removed, []
+        return removed
+
+    def _bullet_rows(self):
+        """Mask of rows that are bullets (not lasers)."""
+        st = self.store
+        return _BULLET[st.kind[:st.n]]
+
+    def get(self, bid):
+        """Field values of one bullet as a dict (None if it no longer exists)."""
+        st = self.store
+        i = int(np.searchsorted(st.bid[:st.n], bid))
+        if i >= st.n or st.bid[i] != bid:
+            return None
+        row = {name: float(getattr(st, name)[i]) for name in st.FLOAT_FIELDS}
+        row['kind'] = KINDS[st.kind[i]]
+        row['flags'] = int(st.flags[i])
+        return row
+
+    def boxes(self, include_lasers=False):
+        """(x1, y1, x2, y2) of every bullet, for effects such as shatter and ghosts."""
+        st = self.store
+        n = st.n
+        x = st.x[:n]
+        y = st.y[:n]
+        x2 = x + st.w[:n]
+        y2 = y + st.h[:n]
+        if not include_lasers:
+            rows = self._bullet_rows()
+            x, y, x2, y2 = x[rows], y[rows], x2[rows], y2[rows]
+        return list(zip(x.tolist(), y.tolist(), x2.tolist(), y2.tolist()))
+
+    def counts(self):
+        st = self.store
+        per_kind = np.bincount(st.kind[:st.n], minlength=len(KINDS))
+        return dict(zip(KINDS, per_kind.tolist()))
+
+    def count(self, include_lasers=False):
+        if include_lasers:
+            return self.store.n
+        return int(np.count_nonzero(self._bullet_rows()))
+
+    def set_player_rect(self, x1, y1, x2, y2):
+        self.player_rect = (x1, y1, x2, y2)
+
+    # ---------------- Simulation step ----------------
+    def step(self, dt, speed_multiplier=1.0):
+        """Advance every bullet by dt seconds and return a StepResult."""
+        res = StepResult()
+        st = self.store
+        n = st.n
+        if n == 0:
+            return res
+        later = []  # bullets spawned by this step, added after compaction
+        # Spin (stars), wobble (wave) and orbit (spiral) phases
+        st.phase[:n] += st.rate[:n] * dt
+        # Run each motion kernel once over every row that uses it
+        motion = _MOTION[st.kind[:n]]
+        present = np.bincount(motion, minlength=len(MOTIONS))
+        profile = self.profile
+        if profile is None:
+            for code, kernel in enumerate(self._kernels):
+                if present[code]:
+                    kernel(np.flatnonzero(motion == code), dt, speed_multiplier, res, later)
+            self._settle(n, res)
+        else:
+            clock = time.perf_counter_ns
+            for code, kernel in enumerate(self._kernels):
+                if present[code]:
+                    start = clock()
+                    kernel(np.flatnonzero(motion == code), dt, speed_multiplier, res, later)
+                    profile.add(_KERNEL_SECTIONS[code], clock() - start)
+            start = clock()
+            self._settle(n, res)
+            profile.add('bullets.settle', clock() - start)
+
+        live = st.live[:n]
+        if not live.all():
+            self._removed.extend(st.bid[:n][~live].tolist())
+            st.compact()
+        for kind_name, bx, by, bw, bh, bvx, bvy, btimer in later:
+            self.spawn(kind_name, bx, by, bw, bh, vx=bvx, vy=bvy, timer=btimer)
+        self.dirty = True
+        return res
+
+    def near_player(self, reach, rows=None):
+        """Row indices of bullets whose center is within `reach` px of the player's
+        center on both axes, optionally limited to a row mask."""
+        st = self.store
+        n = st.n
+        px1, py1, px2, py2 = self.player_rect
+        cx = st.x[:n] + st.w[:n] / 2
+        cy = st.y[:n] + st.h[:n] / 2
+        window = (np.abs(cx - (px1 + px2) / 2) < reach) & (np.abs(cy - (py1 + py2) / 2) < reach)
+        if rows is not None:
+            window &= rows
+        return np.flatnonzero(window)
+
+    def _settle(self, n, res):
+        """Shared hit / cull / graze pass over every bullet still alive.
+
+        Culling looks at every row; hits and grazes only at the rows
+        near_player() finds.
+        """
+        st = self.store
+        x = st.x[:n]
+        y = st.y[:n]
+        w = st.w[:n]
+        h = st.h[:n]
+        x2 = x + w
+        y2 = y + h
+        kind = st.kind[:n]
+        flags = st.flags[:n]
+        live = st.live[:n]
+        px1, py1, px2, py2 = self.player_rect
+        active = live & _BULLET[kind]
+        # Broad phase: a bullet can only touch the player if its center is within
+        # half its size plus half the player's; it is grazed within graze_reach.
+        # Sizes are taken over bullets only, a full-width laser would widen the
+        # query to the whole field.
+        graze_reach = self.grazing_radius + GRAZE_MARGIN
+        if active.any():
+            reach = max(graze_reach, (px2 - px1 + float(w[active].max())) / 2,
+                        (py2 - py1 + float(h[active].max())) / 2)
+        else:
+            reach = graze_reach
+        near = self.near_player(reach, active)
+        hit_near, graze_near = contacts(x[near], y[near], x2[near], y2[near],
+                                        self.player_rect, graze_reach)
+        if self.collisions_enabled:
+            hit = near[hit_near]
+            if hit.size:
+                res.hits.extend(KINDS[k] for k in kind[hit].tolist())
+                live[hit] = False
+                active[hit] = False
+        left, top, right, bottom = _MARGINS
+        out = active & ((x2 < -left[kind]) | (y2 < -top[kind]) |
+                        (x > self.width + right[kind]) | (y > self.height + bottom[kind]) |
+                        (_EXPIRES[kind] & (st.timer[:n] <= TIMER_EPSILON)))
+        if out.any():
+            res.points += int(_SCORE[kind[out]].sum())
+            live[out] = False
+            active &= ~out
+        graze = near[graze_near & active[near] & ((flags[near] & FLAG_GRAZED) == 0) & (_GRAZE[kind[near]] > 0)]
+        if graze.size:
+            flags[graze] |= FLAG_GRAZED
+            res.points += int(_GRAZE[kind[graze]].sum())
+            res.grazes += graze.size
+
+    # ---------------- Motion kernels ----------------
+    # Each kernel gets the row indices of every bullet using it, the step length,
+    # the slow-motion factor, the StepResult and a list for bullets to spawn
+    # after the step.
+    def _scale(self, idx, m):
+        return np.where(_SLOWMO[self.store.kind[idx]], m, 1.0)
+
+    def _move_linear(self, idx, dt, m, res, later):
+        st = self.store
+        scale = self._scale(idx, m) * dt
+        st.x[idx] += st.vx[idx] * scale
+        st.y[idx] += st.vy[idx] * scale
+
+    def _move_zigzag(self, idx, dt, m, res, later):
+        """Flip horizontal direction every ZIGZAG_PERIOD; the timer counts down to the next flip."""
+        st = self.store
+        flip = idx[st.timer[idx] <= TIMER_EPSILON]
+        st.vx[flip] = -st.vx[flip]
+        st.timer[flip] += ZIGZAG_PERIOD
+        st.x[idx] += st.vx[idx] * dt
+        st.y[idx] += st.vy[idx] * self._scale(idx, m) * dt
+        st.timer[idx] -= dt
+
+    def _move_bounce(self, idx, dt, m, res, later):
+        """Reflect off every wall; the timer counts bounces left."""
+        st = self.store
+        self._move_linear(idx, dt, m, res, later)
+        x = st.x[idx]
+        y = st.y[idx]
+        hit_x = (x <= 0) | (x + st.w[idx] >= self.width)
+        hit_y = (y <= 0) | (y + st.h[idx] >= self.height)
+        st.vx[idx] = np.where(hit_x, -st.vx[idx], st.vx[idx])
+        st.vy[idx] = np.where(hit_y, -st.vy[idx], st.vy[idx])
+        st.timer[idx] -= hit_x | hit_y
+        spent = idx[st.timer[idx] < 0]
+        res.points += int(_EXPIRE_SCORE[st.kind[spent]].sum())
+        st.live[spent] = False
+
+    def _move_explode(self, idx, dt, m, res, later):
+        """Fall, then burst into four diagonal fragments mid-screen."""
+        st = self.store
+        self._move_linear(idx, dt, m, res, later)
+        cy = st.y[idx] + st.h[idx] / 2
+        burst = idx[np.abs(cy - self.height // 2) < 20]
+        size = 12
+        speed = 120
+        for cx, cy in zip((st.x[burst] + st.w[burst] / 2).tolist(),
+                          (st.y[burst] + st.h[burst] / 2).tolist()):
+            for dx, dy in ((speed, speed), (-speed, speed), (speed, -speed), (-speed, -speed)):
+                later.append(('fragment', cx - size // 2, cy - size // 2, size, size, dx, dy, 0))
+        res.points += int(_EXPIRE_SCORE[st.kind[burst]].sum())
+        st.live[burst] = False
+
+    def _move_split(self, idx, dt, m, res, later):
+        """Fall, then burst into a ring of shards when the timer runs out."""
+        st = self.store
+        self._move_linear(idx, dt, m, res, later)
+        st.timer[idx] -= dt
+        burst = idx[st.timer[idx] <= TIMER_EPSILON]
+        frag_count = 6
+        frag_speed = 80 + self.difficulty * 4
+        for cx, cy in zip((st.x[burst] + st.w[burst] / 2).tolist(),
+                          (st.y[burst] + st.h[burst] / 2).tolist()):
+            for i in range(frag_count):
+                ang = (2 * math.pi / frag_count) * i
+                later.append(('split_shard', cx - 10, cy - 10, 20, 20,
+                              math.cos(ang) * frag_speed, math.sin(ang) * frag_speed, 0))
+        res.points += int(_EXPIRE_SCORE[st.kind[burst]].sum())
+        st.live[burst] = False
+
+    def _move_homing(self, idx, dt, m, res, later):
+        """Steer toward the player center; the timer is the remaining life."""
+        st = self.store
+        px1, py1, px2, py2 = self.player_rect
+        homing_speed = HOMING_SPEED * m
+        # Same blend per second whatever the step length
+        steer = 1 - (1 - HOMING_STEER) ** (dt * 20)
+        dx = (px1 + px2) / 2 - (st.x[idx] + st.w[idx] / 2)
+        dy = (py1 + py2) / 2 - (st.y[idx] + st.h[idx] / 2)
+        dist = np.hypot(dx, dy)
+        dist[dist == 0] = 1
+        st.vx[idx] = st.vx[idx] * (1 - steer) + dx / dist * homing_speed * steer
+        st.vy[idx] = st.vy[idx] * (1 - steer) + dy / dist * homing_speed * steer
+        st.x[idx] += st.vx[idx] * dt
+        st.y[idx] += st.vy[idx] * dt
+        st.timer[idx] -= dt
+
+    def _move_spiral(self, idx, dt, m, res, later):
+        """Polar motion around (ox, oy); amp is the radius, growing by vy px/s."""
+        st = self.store
+        st.amp[idx] += st.vy[idx] * dt
+        st.x[idx] = st.ox[idx] + np.cos(st.phase[idx]) * st.amp[idx] - st.w[idx] / 2
+        st.y[idx] = st.oy[idx] + np.sin(st.phase[idx]) * st.amp[idx] - st.h[idx] / 2
+
+    def _move_wave(self, idx, dt, m, res, later):
+        """Fall while wobbling sinusoidally around the spawn column ox."""
+        st = self.store
+        st.y[idx] += st.vy[idx] * dt
+        st.x[idx] = st.ox[idx] + np.sin(st.phase[idx]) * st.amp[idx] - st.w[idx] / 2
+
+    def _move_boomerang(self, idx, dt, m, res, later):
+        """Fall for `timer` seconds, then return upward at 80% speed."""
+        st = self.store
+        back = (st.flags[idx] & FLAG_RETURNING) != 0
+        down = idx[~back]
+        up = idx[back]
+        st.y[down] += st.vy[down] * dt
+        st.timer[down] -= dt
+        st.flags[down[st.timer[down] <= TIMER_EPSILON]] |= FLAG_RETURNING
+        st.y[up] -= st.vy[up] * 0.8 * dt
+
+    def _move_laser_warning(self, idx, dt, m, res, later):
+        """Dashed warning line that becomes a laser when its timer runs out."""
+        st = self.store
+        st.timer[idx] -= dt
+        fire = idx[st.timer[idx] <= TIMER_EPSILON]
+        for ly in st.y[fire].tolist():
+            later.append(('laser', 0, ly, self.width, 0, 0, 0, LASER_DURATION))
+        st.live[fire] = False
+
+    def _move_laser(self, idx, dt, m, res, later):
+        """Full-width laser: hits the player anywhere along its row."""
+        st = self.store
+        st.timer[idx] -= dt
+        if self.collisions_enabled:
+            _px1, py1, _px2, py2 = self.player_rect
+            zapped = idx[(py1 <= st.y[idx]) & (st.y[idx] <= py2)]
+            res.hits.extend(KINDS[k] for k in st.kind[zapped].tolist())
+            st.live[zapped] = False
+        st.live[idx[st.timer[idx] <= TIMER_EPSILON]] = False
+
+    # ---------------- Power-up support ----------------
+    def clear_radius(self, cx, cy, radius):
+        """Remove every bullet whose center lies within radius; return how many."""
+        st = self.store
+        n = st.n
+        bx = st.x[:n] + st.w[:n] / 2
+        by = st.y[:n] + st.h[:n] / 2
+        inside = ((bx - cx) ** 2 + (by - cy) ** 2 <= radius * radius) & self._bullet_rows()
+        removed = int(np.count_nonzero(inside))
+        if removed:
+            st.live[:n][inside] = False
+            self._removed.extend(st.bid[:n][inside].tolist())
+            st.compact()
+            self.dirty = True
+        return removed
+
+    def snapshot(self):
+        """Copy of the complete field state, for restore()."""
+        st = self.store
+        n = st.n
+        return {name: getattr(st, name)[:n].copy() for name in BulletStore.STATE_FIELDS}
+
+    def digest(self, seed=0):
+        """CRC32 of the complete field state, for checking that two runs match."""
+        st = self.store
+        n = st.n
+        crc = zlib.crc32(np.int64(self._next_id).tobytes(), seed)
+        for name in BulletStore.STATE_FIELDS:
+            crc = zlib.crc32(getattr(st, name)[:n].tobytes(), crc)
+        return crc
+
+    def record(self, history):
+        """Append the complete field state to a RewindHistory."""
+        history.capture(self.store)
+
+    def restore(self, frame):
+        """Put every bullet back as it was in a snapshot or history frame.
+
+        Bullets removed since come back, bullets spawned since are removed
+        (and queued for the view). Lasers are not rewound: the ones on the
+        field stay as they are and the frame's are ignored.
+        """
+        st = self.store
+        n = st.n
+        bullets = _BULLET[frame['kind']]
+        lasers = np.flatnonzero(~_BULLET[st.kind[:n]])
+        kept = frame['bid'][bullets]
+        current = st.bid[:n][_BULLET[st.kind[:n]]]
+        self._removed.extend(current[~np.isin(current, kept, assume_unique=True)].tolist())
+        m = len(kept) + len(lasers)
+        while st.capacity < m:
+            st._grow()
+        # Rows must stay in id order
+        order = np.argsort(np.concatenate((kept, st.bid[lasers])), kind='stable')
+        for name in BulletStore.STATE_FIELDS:
+            arr = getattr(st, name)
+            arr[:m] = np.concatenate((frame[name][bullets], arr[lasers]))[order]
+        st.live[:m] = True
+        st.live[m:max(n, m)] = False
+        st.n = m
+        self.dirty = True
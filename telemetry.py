@@ -0,0 +1,173 @@
+"""Per-run performance telemetry for Rift of Memories and Regrets.
+
+SessionTelemetry collects what a run cost while it is played: the time each
+simulation tick took, the interval between loop wake-ups (the frame time the
+player sees), wake-ups that blew the stutter budget, the peak number of live
+bullets and canvas items, and the simulated seconds spent in each power-up
+state. When the run ends it is written as one small JSON report, so runs can
+be compared across builds and machines. A machine is described by its OS
+and Python build only; nothing that names the host or the player goes in.
+
+Times go into a LatencyHistogram: HDR-style log-linear buckets over whole
+microseconds, exact below 2 * SUB_BUCKETS us and within 1 / SUB_BUCKETS of
+the value above that, so memory stays fixed however long the run and
+percentiles are read back from the buckets.
+"""
+import json
+import os
+import platform
+import time
+
+TELEMETRY_VERSION = 1
+
+# Linear buckets per doubling of the value
+SUB_BUCKETS = 32
+
+# Power-up states timed per tick, in the order the game reports them
+POWER_UP_STATES = ('freeze', 'rewind', 'slowmo', 'shield', 'focus')
+
+# Simulated seconds between canvas item counts
+ITEM_SAMPLE_EVERY = 1.0
+
+
+def bucket_index(us):
+    """Bucket of a whole number of microseconds."""
+    if us < 2 * SUB_BUCKETS:
+        return us
+    shift = us.bit_length() - SUB_BUCKETS.bit_length()
+    return shift * SUB_BUCKETS + (us >> shift)
+
+
+def bucket_range(index):
+    """Lowest and highest microsecond values that land in bucket `index`."""
+    if index < 2 * SUB_BUCKETS:
+        return index, index
+    shift = index // SUB_BUCKETS - 1
+    low = (index - shift * SUB_BUCKETS) << shift
+    return low, low + (1 << shift) - 1
+
+
+class LatencyHistogram:
+    """Millisecond samples counted in log-linear microsecond buckets."""
+
+    def __init__(self):
+        self.counts = {}  # bucket index -> samples
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, ms):
+        us = max(0, int(ms * 1000.0))
+        index = bucket_index(us)
+        counts = self.counts
+        counts[index] = counts.get(index, 0) + 1
+        self.total += 1
+        self.sum_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, p):
+        """Upper bound (ms) of the bucket holding the p-th percentile; 0.0 when empty."""
+        if not self.total:
+            return 0.0
+        rank = max(1, -(-p * self.total // 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(bucket_range(index)[1] / 1000.0, self.max_ms)
+        return self.max_ms
+
+    def summary(self):
+        """Percentiles, max, mean and the non-empty buckets as [low us, count]."""
+        return {
+            'count': self.total,
+            'p50': round(self.percentile(50), 3),
+            'p95': round(self.percentile(95), 3),
+            'p99': round(self.percentile(99), 3),
+            'max': round(self.max_ms, 3),
+            'mean': round(self.sum_ms / self.total, 3) if self.total else 0.0,
+            'buckets_us': [[bucket_range(i)[0], self.counts[i]] for i in sorted(self.counts)],
+        }
+
+
+class SessionTelemetry:
+    """Performance counters of one run, written as a JSON report when it ends."""
+
+    def __init__(self, budget_ms, seed=None, settings=None, clock=time.time):
+        self.budget_ms = budget_ms
+        self.seed = seed
+        self.settings = dict(settings or {})
+        self.clock = clock
+        self.started = clock()
+        self.ticks = LatencyHistogram()
+        self.frames = LatencyHistogram()
+        self.over_budget = 0
+        self.peak_bullets = 0
+        self.peak_items = 0
+        self.game_time = 0.0
+        self.state_seconds = dict.fromkeys(POWER_UP_STATES + ('static_trap',), 0.0)
+        self._next_item_sample = 0.0
+
+    def add_tick(self, cost_ms, dt, bullets, states=()):
+        """One simulation tick: its cost, length, live bullets and power-up flags (POWER_UP_STATES order)."""
+        self.ticks.record(cost_ms)
+        self.game_time += dt
+        if bullets > self.peak_bullets:
+            self.peak_bullets = bullets
+        seconds = self.state_seconds
+        for name, active in zip(POWER_UP_STATES, states):
+            if active:
+                seconds[name] += dt
+
+    def add_frame(self, interval_ms):
+        """Time since the previous loop wake-up."""
+        self.frames.record(interval_ms)
+        if interval_ms > self.budget_ms:
+            self.over_budget += 1
+
+    def add_state(self, name, seconds):
+        self.state_seconds[name] += seconds
+
+    def wants_items(self):
+        """True when the canvas item count is due for another sample."""
+        return self.game_time >= self._next_item_sample
+
+    def sample_items(self, count):
+        if count > self.peak_items:
+            self.peak_items = count
+        self._next_item_sample = self.game_time + ITEM_SAMPLE_EVERY
+
+    def report(self, ended='quit', **extra):
+        """The run as a JSON-ready dict."""
+        data = {
+            'version': TELEMETRY_VERSION,
+            'started': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started)),
+            'wall_seconds': round(self.clock() - self.started, 1),
+            'ended': ended,
+            'machine': {
+                'platform': platform.platform(),
+                'python': f"{platform.python_implementation()} {platform.python_version()}",
+            },
+            'seed': self.seed,
+            'settings': self.settings,
+            'game_time': round(self.game_time, 2),
+            'tick_ms': self.ticks.summary(),
+            'frame_ms': self.frames.summary(),
+            'budget_ms': round(self.budget_ms, 2),
+            'frames_over_budget': self.over_budget,
+            'peak_bullets': self.peak_bullets,
+            'peak_canvas_items': self.peak_items,
+            'power_up_seconds': {name: round(s, 2) for name, s in self.state_seconds.items()},
+        }
+        data.update(extra)
+        return data
+
+    def write(self, directory, ended='quit', **extra):
+        """Write the report to a new file in `directory` and return its path."""
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(self.started))
+        path = os.path.join(directory, f"session-{stamp}-{self.seed}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(ended, **extra), f, separators=(',', ':'))
+        return path
@@ -0,0 +1,85 @@
+"""Test module for the pre-baked vaporwave background."""
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from background import BakedBackground, GRID_DEPTH, GRID_VERTICAL_COUNT, PHASE_STEPS, gradient_for
+from memory_canvas import MemoryCanvas
+
+
+class WriteCountingCanvas(MemoryCanvas):
+    """MemoryCanvas that records every write after the lines are created."""
+
+    def __init__(self):
+        super().__init__()
+        self.coords_calls = []
+        self.configs = []
+        self.bg_changes = 0
+
+    def coords(self, tag, *coords):
+        if coords:
+            self.coords_calls.append(tag)
+        return super().coords(tag, *coords)
+
+    def itemconfig(self, tag, cnf=None, **opts):
+        self.configs.append((tag, opts))
+        super().itemconfig(tag, cnf, **opts)
+
+    def configure(self, cnf=None, **opts):
+        self.bg_changes += 1
+        super().configure(cnf, **opts)
+
+
+class TestBakedBackground(unittest.TestCase):
+    """Test that the baked background only writes what changed."""
+
+    def setUp(self):
+        self.canvas = WriteCountingCanvas()
+        self.background = BakedBackground(self.canvas, 800, 600)
+
+    def test_frames_write_far_less_than_every_line(self):
+        """A second of 60 Hz frames sends a fraction of the legacy per-line writes."""
+        for _ in range(60):
+            self.background.update(1 / 60)
+        legacy = 60 * (1 + 2 * (GRID_DEPTH + GRID_VERTICAL_COUNT))
+        self.assertLess(self.background.writes, legacy // 4)
+        self.assertLessEqual(self.canvas.bg_changes, PHASE_STEPS // 6 + 1)
+
+    def test_vertical_lines_are_never_moved(self):
+        """Only horizontal rows scroll; vertical lines keep their creation coords."""
+        for _ in range(120):
+            self.background.update(0.05)
+        vertical = set(self.background.lines[GRID_DEPTH:])
+        self.assertTrue(self.canvas.coords_calls)
+        self.assertFalse(vertical & set(self.canvas.coords_calls))
+
+    def test_colour_tables_follow_the_cycle(self):
+        """The canvas colour starts on the first palette entry and lines get the contrasting gradient."""
+        self.background.update(0.0)
+        self.assertEqual(self.background.shown_bg, "#0d0221")
+        self.assertEqual(gradient_for("#0d0221"), 0)
+        self.assertEqual(len(self.canvas.configs), GRID_DEPTH + GRID_VERTICAL_COUNT)
+        self.background.update(6.0)
+        self.assertEqual(self.background.shown_bg, "#1a0533")
+
+    def test_lower_detail_hides_lines_and_skips_them(self):
+        """At grid step 4 only every fourth line is shown, scrolled or recoloured."""
+        self.background.update(0.0)
+        self.background.set_detail(4, color_every=2)
+        hidden = {item for item, opts in self.canvas.configs if opts.get('state') == 'hidden'}
+        self.assertEqual(len(hidden), GRID_DEPTH * 3 // 4 + GRID_VERTICAL_COUNT - (GRID_VERTICAL_COUNT + 3) // 4)
+        self.canvas.configs.clear()
+        self.canvas.coords_calls.clear()
+        for _ in range(120):
+            self.background.update(0.05)
+        touched = set(self.canvas.coords_calls) | {item for item, _ in self.canvas.configs}
+        self.assertTrue(touched)
+        self.assertFalse(hidden & touched)
+
+
+if __name__ == '__main__':
+    unittest.main()
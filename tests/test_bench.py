@@ -0,0 +1,104 @@
+"""Test module for the headless benchmark driver."""
+import io
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from bench import StressRamp, percentile, run_benchmark
+from game_loop import LoopClock
+from simulation import BulletSimulation
+
+
+class TickingGame:
+    """Game stand-in whose tick spawns one bullet and advances the simulation."""
+
+    def __init__(self, end_after=None):
+        self.loop_clock = LoopClock(20, 60)
+        self.sim = BulletSimulation(800, 600)
+        self.game_over = False
+        self.ticks = 0
+        self.frames = 0
+        self.end_after = end_after
+
+    def _simulation_tick(self, dt):
+        self.ticks += 1
+        self.sim.spawn('vertical', 100, 0, 10, 10, vy=10)
+        self.sim.step(dt)
+        if self.ticks == self.end_after:
+            self.game_over = True
+
+    def _render_frame(self, dt):
+        self.frames += 1
+
+
+class TestBench(unittest.TestCase):
+    """Test benchmark percentiles, throughput and the tick driver."""
+
+    def test_nearest_rank_percentiles(self):
+        """Percentiles pick real samples by nearest rank."""
+        samples = list(range(1, 101))
+        self.assertEqual(percentile(samples, 50), 50)
+        self.assertEqual(percentile(samples, 95), 95)
+        self.assertEqual(percentile(samples, 100), 100)
+        self.assertEqual(percentile([7.0], 99), 7.0)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    def test_runs_simulated_seconds_and_counts_bullets(self):
+        """Ten simulated seconds at 20 Hz are 200 ticks, each redrawn; bullets are counted before each tick."""
+        game = TickingGame()
+        ticks = iter(range(10 ** 6))
+        stats = run_benchmark(game, 10.0, clock=lambda: next(ticks) * 0.001)
+        self.assertEqual(game.ticks, 200)
+        self.assertEqual(game.frames, 200)
+        self.assertEqual(len(stats.tick_ms), 200)
+        self.assertAlmostEqual(stats.sim_seconds, 10.0)
+        self.assertEqual(stats.peak_bullets, 199)
+        self.assertEqual(stats.bullet_updates, sum(range(200)))
+        # Every tick took one fake millisecond
+        self.assertAlmostEqual(percentile(stats.tick_ms, 99), 1.0)
+        self.assertAlmostEqual(stats.bullets_per_second(), sum(range(200)) / 0.2)
+
+    def test_stops_at_game_over(self):
+        """A run that ends early stops the benchmark and still reports."""
+        stats = run_benchmark(TickingGame(end_after=5), 10.0, render=False)
+        self.assertEqual(len(stats.tick_ms), 5)
+        self.assertFalse(stats.frame_ms)
+        self.assertIn('Peak live bullets: 4', stats.report())
+
+
+class TestStressRamp(unittest.TestCase):
+    """Test the spawn-rate ramp and its budget log."""
+
+    def test_boost_doubles_from_the_start(self):
+        """The boost is 1 when the ramp starts and doubles every doubling period."""
+        ramp = StressRamp(50.0, start=10.0, doubling=20.0)
+        self.assertEqual(ramp.boost(0.0), 1.0)
+        self.assertEqual(ramp.boost(10.0), 1.0)
+        self.assertAlmostEqual(ramp.boost(50.0), 4.0)
+
+    def test_knee_is_where_the_budget_starts_to_break(self):
+        """Windows whose p95 cost is over budget, three in a row, blow the ramp at the first of them."""
+        ramp = StressRamp(50.0, window=1.0)
+        t = 0.0
+        for second in range(10):
+            cost = 80.0 if second in (3, 6, 7, 8) else 10.0
+            for _ in range(16):
+                t += 0.0625
+                ramp.sample(t, 100 * second, cost)
+        self.assertTrue(ramp.blown)
+        self.assertEqual(len(ramp.rows), 10)
+        self.assertEqual(ramp.knee, ramp.rows[6])
+        self.assertEqual(ramp.knee[3], 600)
+        out = io.StringIO()
+        ramp.write_csv(out)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[0].split(','), list(StressRamp.COLUMNS))
+        self.assertEqual(len(lines), 11)
+
+
+if __name__ == '__main__':
+    unittest.main()
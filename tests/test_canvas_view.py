@@ -0,0 +1,220 @@
+"""Test module for the bullet canvas view and its item pool."""
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from canvas_view import BulletCanvasView, CanvasBatch, CanvasLayers, ItemPool, kind_tag, tcl_word, tint_ramp
+from memory_canvas import MemoryCanvas
+from simulation import BulletSimulation
+
+
+class RecordingCanvas(MemoryCanvas):
+    """MemoryCanvas that counts deletes."""
+
+    def __init__(self):
+        super().__init__()
+        self.deleted = 0
+
+    def delete(self, *tags):
+        self.deleted += len(tags)
+        super().delete(*tags)
+
+
+class RecordingTcl:
+    """Stand-in for the Tcl interpreter that records evaluated scripts."""
+
+    def __init__(self):
+        self.scripts = []
+
+    def eval(self, script):
+        self.scripts.append(script)
+        return ''
+
+
+class TclCanvas(RecordingCanvas):
+    """RecordingCanvas with a Tcl interpreter and widget path, like tk.Canvas."""
+
+    def __init__(self):
+        super().__init__()
+        self.tk = RecordingTcl()
+        self.direct_coords = 0
+
+    def coords(self, tag, *coords):
+        self.direct_coords += 1
+        return super().coords(tag, *coords)
+
+    def __str__(self):
+        return '.c'
+
+
+class TestCanvasBatch(unittest.TestCase):
+    """Test that per-frame updates reach Tcl as one script."""
+
+    def test_frame_is_sent_in_one_eval(self):
+        """Coords and itemconfig calls are queued until flush() sends them together."""
+        canvas = TclCanvas()
+        batch = CanvasBatch(canvas)
+        batch.coords(3, 1.5, 2, 3, 4)
+        batch.itemconfig(5, fill='#ff66ff', dash=(5, 2))
+        self.assertEqual(canvas.tk.scripts, [])
+        batch.flush()
+        batch.flush()
+        self.assertEqual(canvas.tk.scripts, ['apply {{} {\nset n 0\n'
+                                             'incr n [catch {.c coords 3 1.5 2 3 4}]\n'
+                                             'incr n [catch {.c itemconfigure 5 -fill #ff66ff -dash {5 2}}]\n'
+                                             'return $n}}'])
+
+    def test_failed_command_is_counted_not_replayed(self):
+        """A command Tcl rejects is counted; the others in the script run exactly once."""
+        try:
+            import tkinter
+            tcl = tkinter.Tcl()
+        except (ImportError, RuntimeError) as e:
+            self.skipTest(f"Tcl not available: {e}")
+        # A '.c' command that logs its calls and rejects item 9, like a deleted item
+        tcl.eval('set calls {}\n'
+                 'proc .c {op item args} {if {$item == 9} {error "invalid item"}; lappend ::calls "$op $item"}')
+        canvas = TclCanvas()
+        canvas.tk = tcl
+        batch = CanvasBatch(canvas)
+        batch.coords(3, 0, 0, 1, 1)
+        batch.coords(9, 0, 0, 1, 1)
+        batch.itemconfig(4, text='Score: {10} [x]')
+        batch.flush()
+        self.assertEqual(batch.failed, 1)
+        self.assertEqual(tcl.splitlist(tcl.eval('set calls')), ('coords 3', 'itemconfigure 4'))
+
+    def test_text_is_quoted(self):
+        """Option values with spaces or Tcl syntax stay one literal word."""
+        self.assertEqual(tcl_word('Score: 10'), 'Score:\\ 10')
+        self.assertEqual(tcl_word('[exit]'), '\\[exit\\]')
+        self.assertEqual(tcl_word(''), '{}')
+
+    def test_view_moves_bullets_through_the_batch(self):
+        """Once bullets exist, a sync moves them all with a single Tcl call."""
+        canvas = TclCanvas()
+        sim = BulletSimulation(800, 600)
+        view = BulletCanvasView(canvas, sim)
+        for i in range(20):
+            sim.spawn('vertical', 30 * i, 0, 10, 10, vy=140)
+        view.sync()
+        sim.step(0.05)
+        view.sync()
+        self.assertEqual(len(canvas.tk.scripts), 1)
+        self.assertEqual(canvas.tk.scripts[0].count('coords'), 20)
+        self.assertEqual(canvas.direct_coords, 0)
+
+    def test_tint_recolours_each_kind_with_one_command(self):
+        """Tinting 30 bullets of two kinds queues one itemconfig per kind, addressed by tag."""
+        canvas = TclCanvas()
+        sim = BulletSimulation(800, 600)
+        view = BulletCanvasView(canvas, sim)
+        for i in range(30):
+            sim.spawn('vertical' if i % 2 else 'rect', 20 * i, 0, 10, 10)
+        view.sync()
+        ramp = tint_ramp('red', '#a8ecff')
+        self.assertEqual((ramp[0], ramp[-1]), ('#ff0000', '#a8ecff'))
+        view.tint({'vertical': ramp[16], 'rect': '#a8ffe8', 'laser': '#a8ecff'})
+        view.batch.flush()
+        self.assertEqual(canvas.tk.scripts[-1].splitlines()[2:-1], [
+            f'incr n [catch {{.c itemconfigure {kind_tag("vertical")} -fill {ramp[16]}}}]',
+            f'incr n [catch {{.c itemconfigure {kind_tag("rect")} -fill #a8ffe8}}]'])
+        view.tint(None)
+        view.batch.flush()
+        self.assertIn(f'.c itemconfigure {kind_tag("vertical")} -fill red', canvas.tk.scripts[-1])
+
+
+class StackingCanvas(MemoryCanvas):
+    """MemoryCanvas that counts restacking calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.restacks = 0
+
+    def tag_lower(self, tag, below=None):
+        self.restacks += 1
+        super().tag_lower(tag, below)
+
+    def tag_raise(self, tag, above=None):
+        self.restacks += 1
+        super().tag_raise(tag, above)
+
+
+class TestCanvasLayers(unittest.TestCase):
+    """Test that items land in their layer without per-frame restacking."""
+
+    def setUp(self):
+        self.canvas = StackingCanvas()
+        self.background = self.canvas.create_line(0, 0, 1, 1)
+        self.layers = CanvasLayers(self.canvas)
+
+    def test_items_stack_by_layer_not_creation_order(self):
+        """An item created late in a low layer still ends up under earlier high-layer items."""
+        score = self.layers.place(self.canvas.create_rectangle(0, 0, 1, 1), 'hud')
+        player = self.layers.place(self.canvas.create_rectangle(0, 0, 1, 1), 'player')
+        bullet = self.layers.place(self.canvas.create_oval(0, 0, 1, 1), 'bullets')
+        order = [i for i in self.canvas.order if i in (self.background, score, player, bullet)]
+        self.assertEqual(order, [self.background, player, bullet, score])
+
+    def test_synced_bullets_stay_under_the_hud(self):
+        """The view places new bullets in its layer once; later syncs do not restack."""
+        score = self.layers.place(self.canvas.create_rectangle(0, 0, 1, 1), 'hud')
+        sim = BulletSimulation(800, 600)
+        view = BulletCanvasView(self.canvas, sim, ItemPool(self.canvas, self.layers))
+        for i in range(5):
+            sim.spawn('vertical', 30 * i, 0, 10, 10, vy=140)
+        view.sync()
+        restacks = self.canvas.restacks
+        for _ in range(3):
+            sim.step(0.05)
+            view.sync()
+        self.assertEqual(self.canvas.restacks, restacks)
+        top_bullet = max(self.canvas.order.index(item) for item, _ in view.items.values())
+        self.assertLess(top_bullet, self.canvas.order.index(score))
+
+
+class TestItemPool(unittest.TestCase):
+    """Test that canvas items are hidden and recycled instead of deleted."""
+
+    def setUp(self):
+        self.canvas = RecordingCanvas()
+        self.pool = ItemPool(self.canvas)
+
+    def test_prewarmed_items_are_reused(self):
+        """Acquiring after prewarm shows an existing item instead of creating one."""
+        self.pool.prewarm('oval', 3)
+        item = self.pool.acquire('oval', (0, 0, 4, 4), fill='#fff')
+        self.assertEqual(len(self.canvas.items), 3)
+        self.assertEqual(self.canvas.itemcget(item, 'state'), 'normal')
+        self.assertEqual(self.pool.reused, 1)
+
+    def test_released_items_are_hidden_not_deleted(self):
+        """A released item is hidden and handed back on the next acquire of its type."""
+        item = self.pool.acquire('rectangle', (0, 0, 4, 4))
+        self.pool.release('rectangle', item)
+        self.assertEqual(self.canvas.itemcget(item, 'state'), 'hidden')
+        self.assertEqual(self.pool.acquire('rectangle', (1, 1, 5, 5)), item)
+        self.assertNotEqual(self.pool.acquire('oval', (1, 1, 5, 5)), item)
+        self.assertEqual(self.canvas.deleted, 0)
+
+    def test_view_recycles_bullet_items(self):
+        """Bullets that leave the field give their items to later spawns."""
+        sim = BulletSimulation(800, 600)
+        sim.set_player_rect(0, 560, 20, 580)
+        view = BulletCanvasView(self.canvas, sim, self.pool)
+        for _ in range(2):
+            for i in range(10):
+                sim.spawn('vertical', 40 * i + 100, 590, 20, 20, vy=140)
+            view.sync()
+            sim.step(0.5)
+            view.sync()
+        self.assertEqual(self.pool.created, 10)
+        self.assertEqual(self.canvas.deleted, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+"""Test module for the fixed-timestep loop clock."""
+import importlib.util
+import os
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from game_loop import LoopClock, render_choices
+from memory_canvas import MemoryRoot
+from patterns import CHANCE_PERIOD
+
+
+class FakeClock:
+    """Manually advanced stand-in for time.perf_counter."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLoopClock(unittest.TestCase):
+    """Test tick counting, catch-up, render pacing and delays without Tk."""
+
+    def setUp(self):
+        self.time = FakeClock()
+
+    def make(self, sim_rate=20, render_rate=60):
+        return LoopClock(sim_rate, render_rate, clock=self.time)
+
+    def test_first_wake_runs_one_tick(self):
+        """The first wake-up after a reset advances the game by exactly one tick."""
+        clock = self.make()
+        self.assertEqual(clock.advance(), 1)
+
+    def test_slow_frame_runs_catch_up_ticks(self):
+        """A wake-up 0.2s late at 20 Hz runs four ticks instead of slowing the game."""
+        clock = self.make()
+        clock.advance()
+        self.time.now += 0.2
+        self.assertEqual(clock.advance(), 4)
+
+    def test_catch_up_is_capped(self):
+        """A long stall only catches up a bounded amount of game time."""
+        clock = self.make()
+        clock.advance()
+        self.time.now += 10.0
+        self.assertEqual(clock.advance(), 5)
+
+    def test_render_rate_is_independent_of_tick_rate(self):
+        """At 60 Hz ticks and a 30 Hz render cap, every other wake-up redraws."""
+        clock = self.make(sim_rate=60, render_rate=30)
+        renders = 0
+        for _ in range(60):
+            clock.advance()
+            if clock.render_due() is not None:
+                renders += 1
+            self.time.now += clock.next_delay() / 1000.0
+        self.assertEqual(renders, 30)
+
+    def test_uncapped_render_redraws_every_tick(self):
+        """Render rate 0 redraws after every wake-up that advanced the game."""
+        clock = self.make(sim_rate=60, render_rate=0)
+        renders = 0
+        for _ in range(30):
+            clock.advance()
+            if clock.render_due() is not None:
+                renders += 1
+            self.time.now += clock.next_delay() / 1000.0
+        self.assertEqual(renders, 30)
+
+    def test_render_cap_is_limited_to_the_tick_rate(self):
+        """A render cap at or above the tick rate redraws every tick, and is not offered."""
+        clock = self.make(sim_rate=20, render_rate=60)
+        self.assertEqual(clock.render_rate, 0)
+        renders = 0
+        for _ in range(20):
+            clock.advance()
+            if clock.render_due() is not None:
+                renders += 1
+            self.time.now += clock.next_delay() / 1000.0
+        self.assertEqual(renders, 20)
+        self.assertEqual(render_choices(20), (15, 0))
+        self.assertEqual(render_choices(120), (15, 30, 60, 0))
+
+    def test_delay_subtracts_time_spent_working(self):
+        """The next wake-up is aimed at the next tick, minus what this one cost."""
+        clock = self.make()
+        clock.advance()
+        self.time.now += 0.02  # 20ms of work
+        self.assertEqual(clock.next_delay(), 30)
+
+    def test_hold_stops_banking_time(self):
+        """Time spent on hold (static trap) is not caught up afterwards."""
+        clock = self.make()
+        clock.advance()
+        self.time.now += 2.0
+        clock.hold()
+        self.assertEqual(clock.advance(), 1)
+
+
+
+class FakeJoystick:
+    """Gamepad held fully to the right, with no buttons."""
+
+    def get_numaxes(self):
+        return 2
+
+    def get_axis(self, axis):
+        return 1.0 if axis == 0 else 0.0
+
+    def get_numbuttons(self):
+        return 0
+
+
+class TestTickRateIndependence(unittest.TestCase):
+    """Test that the sim rate does not change how fast the player moves."""
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+        try:
+            spec = importlib.util.spec_from_file_location(
+                'rift_game', PROJECT_ROOT / 'Rift of Memories and Regrets.py')
+            cls.game_module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(cls.game_module)
+        except ImportError as e:
+            raise unittest.SkipTest(f"game dependencies not installed: {e}")
+
+    def travel(self, sim_rate, steer, seconds=0.5):
+        """Pixels per second of player_speed the player moves right, steered by mouse or gamepad."""
+        game = self.game_module.bullet_hell_game(MemoryRoot(), seed=3, headless=True)
+        game.settings['sim_rate'] = sim_rate
+        game.start_headless()
+        x1, y1, x2, y2 = game.canvas.coords(game.player)
+        if steer == 'mouse':
+            game.mouse_target_x = x1 + 600
+            game.mouse_target_y = (y1 + y2) / 2
+            game.mouse_move_active = True
+            update = game.update_mouse_movement
+        else:
+            game.joysticks = [FakeJoystick()]
+            update = game.update_controller_input
+        for _ in range(round(seconds * sim_rate)):
+            update()
+        return (game.canvas.coords(game.player)[0] - x1) / seconds / game.player_speed
+
+    def test_mouse_and_gamepad_speed_is_per_second(self):
+        """Mouse and gamepad cover the same distance per second at 20 Hz and 120 Hz."""
+        for steer in ('mouse', 'gamepad'):
+            slow = self.travel(20, steer)
+            fast = self.travel(120, steer)
+            self.assertAlmostEqual(slow, 1 / CHANCE_PERIOD, msg=steer)
+            self.assertAlmostEqual(fast, slow, msg=steer)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""Test module for the retained-mode HUD layer."""
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from hud import Hud, HUD_TAG
+from memory_canvas import MemoryCanvas
+
+
+class CountingCanvas(MemoryCanvas):
+    """MemoryCanvas that records option writes and raises."""
+
+    def __init__(self):
+        super().__init__()
+        self.configs = []
+        self.raised = []
+
+    def itemconfig(self, tag, cnf=None, **opts):
+        self.configs.append((tag, opts))
+        super().itemconfig(tag, cnf, **opts)
+
+    def tag_raise(self, tag, above=None):
+        self.raised.append(tag)
+        super().tag_raise(tag, above)
+
+
+class TestHud(unittest.TestCase):
+    """Test that HUD items are kept and only rewritten on change."""
+
+    def setUp(self):
+        self.canvas = CountingCanvas()
+        self.hud = Hud(self.canvas)
+        self.hud.add_text('score', 70, 20, text="Score: 0")
+
+    def test_unchanged_text_is_not_rewritten(self):
+        """Setting the text already shown sends nothing to the canvas."""
+        for _ in range(20):
+            self.hud.set_text('score', "Score: 0")
+        self.assertEqual(self.canvas.configs, [])
+        self.hud.set_text('score', "Score: 5")
+        self.hud.set_text('score', "Score: 5")
+        self.assertEqual(self.canvas.configs, [(1, {'text': "Score: 5"})])
+
+    def test_hearts_are_hidden_not_recreated(self):
+        """Losing and regaining lives reuses the same heart items."""
+        self.hud.set_hearts(3)
+        created = len(self.canvas.items)
+        self.hud.set_hearts(2)
+        self.hud.set_hearts(2)
+        self.hud.set_hearts(3)
+        self.assertEqual(len(self.canvas.items), created)
+        self.assertEqual([opts['state'] for _, opts in self.canvas.configs], ['hidden', 'normal'])
+
+    def test_lift_raises_the_whole_layer_at_once(self):
+        """All HUD items share one tag, raised with a single call."""
+        self.hud.set_hearts(3)
+        self.hud.lift()
+        self.assertEqual(self.canvas.raised, [HUD_TAG])
+
+
+if __name__ == '__main__':
+    unittest.main()
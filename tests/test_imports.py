@@ -24,6 +24,14 @@ class TestImports(unittest.TestCase):
         if major == 2:
             self.assertGreaterEqual(minor, 5, "pygame 2.x version should be 2.5 or higher")
 
+    def test_numpy_import(self):
+        """Test that numpy can be imported (used by the bullet simulation)."""
+        try:
+            import numpy
+            self.assertIsNotNone(numpy)
+        except ImportError as e:
+            self.fail(f"Failed to import numpy: {e}")
+
     def test_pyinstaller_import(self):
         """Test that PyInstaller can be imported."""
         try:
@@ -0,0 +1,137 @@
+"""Test module for the in-memory Tk root and canvas stand-ins."""
+import importlib.util
+import os
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from bench import run_benchmark
+from memory_canvas import MemoryCanvas, MemoryRoot
+from canvas_view import BulletCanvasView, CanvasLayers, ItemPool
+from simulation import BulletSimulation
+
+
+class TestMemoryCanvas(unittest.TestCase):
+    """Test that MemoryCanvas answers like a Tk canvas."""
+
+    def test_items(self):
+        """Items are created, moved, measured, configured and deleted by id or tag."""
+        canvas = MemoryCanvas(width=200, height=100)
+        a = canvas.create_rectangle(10, 10, 30, 20, fill='red', tags='box')
+        b = canvas.create_oval((40, 40), (50, 60), tags=('box', 'round'))
+        line = canvas.create_line(0, 0, 5, 5)
+        self.assertEqual((a, b, line), (1, 2, 3))
+        self.assertEqual(canvas.type(b), 'oval')
+        self.assertEqual(canvas.coords(b), [40.0, 40.0, 50.0, 60.0])
+        canvas.move('box', 5, -5)
+        self.assertEqual(canvas.coords(a), [15.0, 5.0, 35.0, 15.0])
+        self.assertEqual(canvas.bbox('box'), (15, 5, 55, 55))
+        canvas.itemconfig('box', fill='blue', width=2)
+        self.assertEqual(canvas.itemcget(a, 'fill'), 'blue')
+        self.assertEqual(canvas.itemcget(str(b), 'width'), '2')
+        canvas.itemconfig(b, state='hidden')
+        self.assertEqual(canvas.bbox('box'), (15, 5, 35, 15))
+        canvas.itemconfig(a, tags='')
+        self.assertEqual(canvas.find_withtag('box'), (b,))
+        canvas.delete('box')
+        self.assertEqual(canvas.find_all(), (a, line))
+        self.assertIsNone(canvas.type(b))
+        self.assertEqual(canvas.coords(b), [])
+        canvas.delete('all')
+        self.assertEqual(canvas.find_all(), ())
+        self.assertEqual(canvas.create_text(0, 0, text='x'), 4)
+
+    def test_stacking(self):
+        """lift and lower restack items, relative to the top or to another item."""
+        canvas = MemoryCanvas()
+        a, b, c, d = (canvas.create_oval(0, 0, 1, 1) for _ in range(4))
+        canvas.lift(a)
+        self.assertEqual(canvas.find_all(), (b, c, d, a))
+        canvas.tag_lower(a, c)
+        self.assertEqual(canvas.find_all(), (b, a, c, d))
+        canvas.lift(b, c)
+        self.assertEqual(canvas.find_all(), (a, c, b, d))
+        canvas.lower(d)
+        self.assertEqual(canvas.find_all(), (d, a, c, b))
+
+        # Pooled items land in their layer, below the markers above it
+        canvas = MemoryCanvas()
+        layers = CanvasLayers(canvas)
+        pool = ItemPool(canvas, layers)
+        hud = pool.acquire('oval', (0, 0, 1, 1), 'hud')
+        bullet = pool.acquire('oval', (0, 0, 1, 1), 'bullets')
+        order = canvas.find_all()
+        self.assertLess(order.index(bullet), order.index(layers.markers['bullets']))
+        self.assertLess(order.index(layers.markers['bullets']), order.index(hud))
+
+    def test_after_runs_on_virtual_clock(self):
+        """after() callbacks run in due order when the root's clock advances."""
+        root = MemoryRoot()
+        canvas = MemoryCanvas(root)
+        ran = []
+        root.after(30, ran.append, 'late')
+        canvas.after(10, ran.append, 'early')
+        cancelled = root.after(20, ran.append, 'cancelled')
+        root.after_cancel(cancelled)
+        self.assertEqual(root.advance(15), 1)
+        self.assertEqual(ran, ['early'])
+        root.advance(15)
+        self.assertEqual(ran, ['early', 'late'])
+        self.assertEqual(root.clock(), 0.03)
+        self.assertEqual(root.pending(), 0)
+
+    def test_bullet_view_on_memory_canvas(self):
+        """The bullet view mirrors the simulation onto the memory canvas."""
+        canvas = MemoryCanvas()
+        sim = BulletSimulation(400, 300)
+        view = BulletCanvasView(canvas, sim)
+        bid = sim.spawn('vertical', 100, 100, 10, 10, vy=100)
+        view.sync()
+        item = view.items[bid][0]
+        self.assertEqual(canvas.coords(item), [100.0, 100.0, 110.0, 110.0])
+        sim.step(0.1)
+        view.sync()
+        self.assertEqual(canvas.coords(item), [100.0, 110.0, 110.0, 120.0])
+
+
+class TestHeadlessGame(unittest.TestCase):
+    """Test that the game plays headless on the memory canvas."""
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+        try:
+            spec = importlib.util.spec_from_file_location(
+                'rift_game', PROJECT_ROOT / 'Rift of Memories and Regrets.py')
+            cls.game_module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(cls.game_module)
+        except ImportError as e:
+            raise unittest.SkipTest(f"game dependencies not installed: {e}")
+
+    def play(self, seconds):
+        root = MemoryRoot()
+        game = self.game_module.bullet_hell_game(root, seed=7, headless=True)
+        game.start_headless()
+        game.practice_mode = True
+        game.game_time += 300  # every pattern unlocked
+        run_benchmark(game, seconds)
+        return game
+
+    def test_soak_is_deterministic(self):
+        """Seeded headless runs on the memory canvas end in the same state."""
+        first = self.play(30)
+        second = self.play(30)
+        self.assertIsInstance(first.canvas, MemoryCanvas)
+        self.assertEqual(first.sim_ticks, 600)
+        self.assertGreater(first.score, 0)
+        self.assertEqual(first.sim_ticks, second.sim_ticks)
+        self.assertEqual(first._state_digest(), second._state_digest())
+        self.assertEqual(first.score, second.score)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""Test module for the pooled particle system."""
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from canvas_view import CanvasBatch, ItemPool
+from memory_canvas import MemoryCanvas
+from particles import FADE_STEPS, PARTICLE_STYLES, ParticleSystem
+
+
+class CountingCanvas(MemoryCanvas):
+    """MemoryCanvas that records per-item coordinate and option writes."""
+
+    def __init__(self):
+        super().__init__()
+        self.coords_calls = []
+        self.configs = []
+
+    def coords(self, tag, *coords):
+        if coords:
+            self.coords_calls.append(tag)
+        return super().coords(tag, *coords)
+
+    def itemconfig(self, tag, cnf=None, **opts):
+        self.configs.append((tag, opts))
+        super().itemconfig(tag, cnf, **opts)
+
+
+class RecordingTcl:
+    """Stand-in for the Tcl interpreter that records evaluated scripts."""
+
+    def __init__(self):
+        self.scripts = []
+
+    def eval(self, script):
+        self.scripts.append(script)
+        return '0'
+
+
+class TclCanvas(MemoryCanvas):
+    """MemoryCanvas with a Tcl interpreter and widget path, so batched updates are queued."""
+
+    def __init__(self):
+        super().__init__()
+        self.tk = RecordingTcl()
+
+    def __str__(self):
+        return '.c'
+
+
+class TestParticleSystem(unittest.TestCase):
+    """Test that particles are capped, pooled and only rewritten on change."""
+
+    def setUp(self):
+        self.canvas = CountingCanvas()
+        self.pool = ItemPool(self.canvas)
+        self.particles = ParticleSystem(self.pool, CanvasBatch(self.canvas), cap=50)
+
+    def test_cap_retires_the_oldest(self):
+        """Overlapping bursts never hold more than the cap; retired items go back to the pool."""
+        self.particles.spawn('shield', 100, 100, vx=list(range(40)), life=1.0)
+        self.particles.spawn('slowmo', 200, 200, vy=list(range(30)), life=1.0)
+        self.assertEqual(self.particles.count(), 50)
+        self.assertEqual(self.particles.count('shield'), 20)
+        self.assertEqual(self.particles.retired, 20)
+        # The retired items were handed straight to the new burst
+        self.assertEqual(len(self.canvas.items), 50)
+        self.particles.spawn('freeze', 0, 0, life=[1.0] * 20)
+        self.assertEqual(len(self.canvas.items), 50)
+        self.assertEqual(self.particles.count('shield'), 0)
+
+    def test_fade_writes_once_per_ramp_step(self):
+        """A fading ring is recoloured at most once per ramp step, however many frames it lives."""
+        self.particles.spawn('pulse', 50, 50, life=0.9, w=20, grow=100)
+        self.canvas.configs.clear()
+        for _ in range(201):
+            self.particles.update(0.9 / 200)
+        colors = [opts['outline'] for _, opts in self.canvas.configs if 'outline' in opts]
+        self.assertLessEqual(len(colors), FADE_STEPS)
+        self.assertEqual(colors, sorted(set(colors), key=PARTICLE_STYLES['pulse'].colors.index, reverse=True))
+        self.assertEqual(self.particles.count(), 0)
+        self.assertEqual(len(self.pool.free['oval']), 1)
+
+    def test_static_particles_are_not_moved(self):
+        """Ghosts neither move nor grow, so they only get colour updates."""
+        self.particles.spawn('ghost', [10, 40], [10, 40], life=0.5, w=8, h=12)
+        self.particles.spawn('slowmo', 5, 5, vx=10, life=0.5)
+        for _ in range(3):
+            self.particles.update(0.05)
+        ghosts = set(self.particles.item[:2].tolist())
+        self.assertEqual(len(self.canvas.coords_calls), 3)
+        self.assertFalse(ghosts & set(self.canvas.coords_calls))
+        self.particles.clear('ghost')
+        self.assertEqual(self.particles.count(), 1)
+        self.assertEqual(len(self.pool.free['rectangle']), 2)
+
+
+    def test_retired_items_drop_their_queued_updates(self):
+        """An item retired and handed on in the same frame does not get its old owner's updates."""
+        canvas = TclCanvas()
+        batch = CanvasBatch(canvas)
+        particles = ParticleSystem(ItemPool(canvas), batch, cap=2)
+        particles.spawn('slowmo', [10, 20], 10, vx=50, life=1.0)
+        particles.update(0.05)  # queues a move for both
+        oldest = int(particles.item[0])
+        particles.spawn('freeze', 300, 300, life=1.0)  # retires the oldest, reusing its item
+        self.assertEqual(int(particles.item[1]), oldest)
+        batch.flush()
+        script = canvas.tk.scripts[-1]
+        self.assertNotIn(f".c coords {oldest} ", script)
+        self.assertIn(f".c coords {int(particles.item[0])} ", script)
+        self.assertEqual(canvas.coords(oldest), [298.0, 298.0, 302.0, 302.0])
+
+if __name__ == '__main__':
+    unittest.main()
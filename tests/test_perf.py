@@ -0,0 +1,218 @@
+"""Performance regression tests with per-machine frame-time baselines.
+
+Each scenario starts a seeded headless game on a MemoryRoot and MemoryCanvas
+and plays it through bench.run_benchmark, so a sample is one real simulation
+tick plus the redraw that follows it. Power-ups are triggered through the
+game's own methods (activate_freeze, activate_rewind, _trigger_focus_pulse)
+from inside the timed tick. The median and p95 frame times must stay under
+an absolute ceiling, a fraction of the simulation step, and within a margin
+of the baseline stored for this machine in tests/perf_baselines.json. A
+machine without a baseline records one and is held to the ceiling alone;
+an existing baseline is only rewritten on request.
+
+Timings depend on whatever else the machine is doing, so the module only
+runs when asked to. Environment variables:
+
+  PERF=1                   run these tests (skipped otherwise)
+  PERF_MARGIN=0.5          allowed slowdown over the baseline (0.5 = 50%)
+  PERF_CEILING=0.5         frame time ceiling as a fraction of the sim step
+  PERF_UPDATE_BASELINE=1   re-record this machine's baselines
+  PERF_BASELINES=path      baseline file to use instead
+"""
+import gc
+import importlib.util
+import itertools
+import json
+import os
+import platform
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from bench import percentile, run_benchmark
+from memory_canvas import MemoryRoot
+
+ENABLED = os.environ.get('PERF') == '1'
+BASELINE_FILE = Path(os.environ.get('PERF_BASELINES', Path(__file__).parent / 'perf_baselines.json'))
+MARGIN = float(os.environ.get('PERF_MARGIN', '0.5'))
+CEILING = float(os.environ.get('PERF_CEILING', '0.5'))
+UPDATE = os.environ.get('PERF_UPDATE_BASELINE') == '1'
+# Timer noise allowance, so sub-millisecond scenarios do not fail on jitter
+SLACK_MS = 0.05
+
+# Live bullets the busy scenarios start from
+BUSY_BULLETS = 300
+
+
+def machine_key():
+    """Baselines are only comparable on the same machine and interpreter."""
+    return f"{platform.node()}|{platform.machine()}|{platform.python_implementation()} {platform.python_version()}"
+
+
+def load_game_module():
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    spec = importlib.util.spec_from_file_location('rift_game', PROJECT_ROOT / 'Rift of Memories and Regrets.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def headless_game(module, seed=1, unlocked=True):
+    """A started practice run on a memory canvas, every pattern unlocked or none."""
+    game = module.bullet_hell_game(MemoryRoot(), seed=seed, headless=True)
+    game.start_headless()
+    game.practice_mode = True
+    if unlocked:
+        game.game_time += 300
+    else:
+        game.unlock_times = dict.fromkeys(game.unlock_times, float('inf'))
+    return game
+
+
+def fill(game, bullets=BUSY_BULLETS):
+    """Call the game's pattern spawners in turn until `bullets` are live."""
+    spawners = itertools.cycle([getattr(game, pattern.spawner) for pattern in game._spawn_schedule])
+    while game.sim.count() < bullets:
+        next(spawners)()
+    return game
+
+
+def every(game, ticks, action):
+    """Call `action` before every `ticks`-th simulation tick, inside the time run_benchmark charges to it."""
+    tick = game._simulation_tick
+    count = itertools.count()
+
+    def hooked(dt):
+        if next(count) % ticks == 0:
+            action()
+        tick(dt)
+    game._simulation_tick = hooked
+    return game
+
+
+def run_empty(module):
+    return headless_game(module, unlocked=False)
+
+
+def run_mixed(module):
+    return fill(headless_game(module))
+
+
+def run_freeze_tint(module):
+    # One second frozen in every two: the tint fades in, the thaw shatters and fades it out
+    game = fill(headless_game(module))
+    return every(game, round(2.0 / game.loop_clock.sim_dt), lambda: game.activate_freeze(duration=1.0))
+
+
+def run_rewind(module):
+    # Build up history, then rewind 1.5 s of every 3 s
+    game = fill(headless_game(module))
+    run_benchmark(game, 3.0, render=False)
+    return every(game, round(3.0 / game.loop_clock.sim_dt), lambda: game.activate_rewind(duration=1.5))
+
+
+def run_focus_pulse(module):
+    # Four pulses a second clear whatever has fallen into range of the player
+    game = fill(headless_game(module))
+    return every(game, round(0.25 / game.loop_clock.sim_dt), game._trigger_focus_pulse)
+
+
+SCENARIOS = {
+    'empty': run_empty,
+    'mixed_300': run_mixed,
+    'freeze_tint': run_freeze_tint,
+    'rewind': run_rewind,
+    'focus_pulse': run_focus_pulse,
+}
+
+
+def measure(module, build, seconds=6.0, warmup=0.5, rounds=3):
+    """Best median and p95 frame ms (tick plus redraw) over a few fresh runs of a scenario."""
+    best = None
+    for _ in range(rounds):
+        game = build(module)
+        run_benchmark(game, warmup)
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            stats = run_benchmark(game, seconds)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        samples = [tick + frame for tick, frame in zip(stats.tick_ms, stats.frame_ms)]
+        result = (percentile(samples, 50), percentile(samples, 95))
+        best = result if best is None else (min(best[0], result[0]), min(best[1], result[1]))
+    return {'median_ms': round(best[0], 4), 'p95_ms': round(best[1], 4)}, game.loop_clock.sim_dt
+
+
+class TestPerformanceBudgets(unittest.TestCase):
+    """Test that scenario frame times stay under the ceiling and within this machine's baselines."""
+
+    @classmethod
+    def setUpClass(cls):
+        if not ENABLED:
+            raise unittest.SkipTest("frame-time checks are opt-in; set PERF=1 to run them")
+        try:
+            cls.game_module = load_game_module()
+        except ImportError as e:
+            raise unittest.SkipTest(f"game dependencies not installed: {e}")
+        try:
+            cls.baselines = json.loads(BASELINE_FILE.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            cls.baselines = {}
+        cls.changed = False
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls.changed:
+            try:
+                BASELINE_FILE.write_text(json.dumps(cls.baselines, indent=2, sort_keys=True), encoding='utf-8')
+            except OSError:
+                pass
+
+    def check(self, name):
+        result, sim_dt = measure(self.game_module, SCENARIOS[name])
+        ceiling = CEILING * sim_dt * 1000.0
+        for metric in ('median_ms', 'p95_ms'):
+            self.assertLessEqual(result[metric], ceiling,
+                                 f"{name} {metric} {result[metric]:.3f} ms is over the ceiling "
+                                 f"of {CEILING:.0%} of a {sim_dt * 1000:.0f} ms tick")
+        baseline = self.baselines.get(machine_key(), {}).get(name)
+        if baseline is None or UPDATE:
+            # Only a new machine or an explicit update writes a baseline
+            self.baselines.setdefault(machine_key(), {})[name] = result
+            type(self).changed = True
+            return
+        for metric in ('median_ms', 'p95_ms'):
+            limit = baseline[metric] * (1 + MARGIN) + SLACK_MS
+            self.assertLessEqual(result[metric], limit,
+                                 f"{name} {metric} {result[metric]:.3f} ms is over the baseline "
+                                 f"{baseline[metric]:.3f} ms + {MARGIN:.0%}")
+
+    def test_empty_field(self):
+        """A run with no pattern unlocked stays within budget."""
+        self.check('empty')
+
+    def test_mixed_300_bullets(self):
+        """300 bullets from the game's own spawners, ticked and redrawn every frame."""
+        self.check('mixed_300')
+
+    def test_freeze_with_tint(self):
+        """A busy field frozen and thawed through activate_freeze, tint fading both ways."""
+        self.check('freeze_tint')
+
+    def test_rewind(self):
+        """A busy field played backwards through activate_rewind."""
+        self.check('rewind')
+
+    def test_focus_pulse_clear(self):
+        """Focus pulses fired through _trigger_focus_pulse on a busy field."""
+        self.check('focus_pulse')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""Test module for the per-subsystem frame profiler."""
+import os
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from profiler import BULLET_SECTIONS, FrameProfiler
+from simulation import BulletSimulation
+
+
+class FakeClock:
+    """perf_counter_ns stand-in advanced by hand."""
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class TestFrameProfiler(unittest.TestCase):
+    """Test section timing, the rolling window and the CSV log."""
+
+    def test_laps_accumulate_per_section(self):
+        """Each lap charges the time since the previous mark; repeated sections add up."""
+        clock = FakeClock()
+        prof = FrameProfiler(('input', 'bullets', 'sync'), window=2, clock=clock)
+        prof.start()
+        for _ in range(2):  # two ticks in one wake-up
+            clock.now += 1_000_000
+            prof.lap('input')
+            clock.now += 3_000_000
+            prof.lap('bullets')
+        clock.now += 2_000_000
+        prof.lap('sync')
+        prof.end_frame()
+        self.assertEqual(prof.averages(), {'input': 2.0, 'bullets': 6.0, 'sync': 2.0})
+        total, worst = prof.slowest()
+        self.assertEqual(total, 10.0)
+        self.assertEqual(worst['bullets'], 6.0)
+
+        # Frames older than the window drop out of the averages
+        for _ in range(2):
+            prof.start()
+            clock.now += 1_000_000
+            prof.lap('sync')
+            prof.end_frame()
+        self.assertEqual(prof.averages(), {'input': 0.0, 'bullets': 0.0, 'sync': 1.0})
+        self.assertEqual(prof.slowest()[0], 1.0)
+        self.assertTrue(prof.summary()[0].startswith('Profile ms/frame (2f): sync 1.00'))
+
+    def test_csv_log(self):
+        """An open CSV log gets a header and one row per frame in ms."""
+        clock = FakeClock()
+        prof = FrameProfiler(('input', 'sync'), clock=clock)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'profile.csv')
+            prof.open_csv(path)
+            prof.start()
+            clock.now += 500_000
+            prof.lap('sync')
+            prof.end_frame(game_time=1.25)
+            prof.close_csv()
+            with open(path, encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        self.assertEqual(lines, ['frame,game_time,total_ms,input,sync', '1,1.25,0.5,0.0,0.5'])
+
+    def test_simulation_reports_kernels(self):
+        """A profiled simulation step charges its motion kernels and settle pass."""
+        prof = FrameProfiler()
+        sim = BulletSimulation(400, 300)
+        sim.profile = prof
+        sim.spawn('vertical', 100, 0, 10, 10, vy=100)
+        sim.spawn('homing', 200, 0, 10, 10, vy=100)
+        sim.step(0.05)
+        timed = {name for name in BULLET_SECTIONS if prof.frame[name] > 0}
+        self.assertEqual(timed, {'bullets.linear', 'bullets.homing', 'bullets.settle'})
+
+
+if __name__ == '__main__':
+    unittest.main()
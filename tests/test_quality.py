@@ -0,0 +1,54 @@
+"""Test module for adaptive effect quality."""
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from quality import QUALITY_TIERS, QualityGovernor
+
+
+class TestQualityGovernor(unittest.TestCase):
+    """Test that the tier follows the worst frame of each window."""
+
+    def setUp(self):
+        self.governor = QualityGovernor(50.0, window=10, calm_windows=3)
+
+    def feed(self, frame_ms, count):
+        changed = False
+        for _ in range(count):
+            changed = self.governor.sample(frame_ms) or changed
+        return changed
+
+    def test_one_stutter_steps_down_a_tier(self):
+        """A single frame over budget in a window sheds one tier, not more."""
+        self.feed(50.0, 9)
+        self.assertTrue(self.governor.sample(140.0))
+        self.assertEqual(self.governor.current.name, 'Medium')
+        self.assertFalse(self.feed(52.0, 10))
+        self.assertEqual(self.governor.tier, 1)
+
+    def test_steps_up_after_calm_windows(self):
+        """Quality only comes back after several calm windows in a row."""
+        self.feed(200.0, 20)
+        self.assertEqual(self.governor.tier, 2)
+        self.feed(50.0, 20)
+        self.feed(70.0, 10)  # neither stutter nor calm: resets the streak
+        self.feed(50.0, 20)
+        self.assertEqual(self.governor.tier, 2)
+        self.assertTrue(self.feed(50.0, 10))
+        self.assertEqual(self.governor.tier, 1)
+
+    def test_stays_within_the_tiers(self):
+        """Sustained overload stops at the lowest tier; calm stops at the best."""
+        self.feed(500.0, 100)
+        self.assertIs(self.governor.current, QUALITY_TIERS[-1])
+        self.feed(10.0, 1000)
+        self.assertIs(self.governor.current, QUALITY_TIERS[0])
+        self.assertEqual(self.governor.changes, 2 * (len(QUALITY_TIERS) - 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
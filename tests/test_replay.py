@@ -0,0 +1,128 @@
+"""Test module for seeded runs and input replays."""
+import importlib.util
+import os
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from memory_canvas import MemoryRoot
+from replay import Replay
+
+
+class TestReplay(unittest.TestCase):
+    """Test recording, saving and playing back a run's inputs."""
+
+    def record(self):
+        replay = Replay.record_new(42, {'sim_rate': 20, 'player_speed': 15, 'master_volume': 0.5})
+        replay.record(0, 'move', (15, 0))
+        replay.record(0, 'shoot')
+        replay.record(7, 'move', (-7.5, 0.25))
+        replay.record(300, 'trap', ('a',))
+        replay.check(0, 111)
+        replay.check(100, 222)
+        return replay
+
+    def test_file_round_trip(self):
+        """A saved replay loads back with the same seed, gameplay settings, inputs and digests."""
+        replay = self.record()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'run.replay.gz'
+            replay.save(path)
+            loaded = Replay.load(path)
+        self.assertEqual(loaded.seed, 42)
+        self.assertEqual(loaded.settings, {'sim_rate': 20, 'player_speed': 15})
+        self.assertEqual(loaded.events, replay.events)
+        self.assertEqual(loaded.digests, {0: 111, 100: 222})
+        self.assertEqual(loaded.ticks, 300)
+        # Ticks are stored as gaps between inputs
+        self.assertEqual([e[0] for e in replay.to_dict()['events']], [0, 0, 7, 293])
+
+    def test_inputs_come_back_once_per_tick(self):
+        """Playback hands out each input before the tick it was recorded at, exactly once."""
+        replay = Replay.from_dict(self.record().to_dict())
+        replay.start_playback()
+        self.assertEqual([e[1] for e in replay.inputs_at(0)], ['move', 'shoot'])
+        self.assertEqual(replay.inputs_at(0), [])
+        self.assertEqual(replay.inputs_at(5), [])
+        self.assertEqual(replay.inputs_at(7), [(7, 'move', (-7.5, 0.25))])
+        self.assertFalse(replay.finished(299))
+        self.assertEqual(replay.inputs_at(300), [(300, 'trap', ('a',))])
+        self.assertTrue(replay.finished(300))
+
+    def test_inputs_wait_until_ready(self):
+        """An input the ready check turns down stays queued, with everything after it."""
+        replay = Replay.from_dict(self.record().to_dict())
+        replay.start_playback()
+        self.assertEqual(replay.inputs_at(7, lambda event: event[1] != 'shoot'), [(0, 'move', (15, 0))])
+        self.assertEqual([e[1] for e in replay.inputs_at(7)], ['shoot', 'move'])
+
+    def test_first_divergence_is_kept(self):
+        """Digest mismatches while playing report the first tick that drifted."""
+        replay = Replay.from_dict(self.record().to_dict())
+        replay.start_playback()
+        self.assertTrue(replay.check(0, 111))
+        self.assertTrue(replay.check(50, 999))  # nothing recorded at this tick
+        self.assertFalse(replay.check(100, 223))
+        self.assertFalse(replay.check(100, 224))
+        self.assertEqual(replay.diverged, 100)
+
+
+
+class TestStaticTrapReplay(unittest.TestCase):
+    """Test that the static trap runs on trap time and replays at the recorded pace."""
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+        try:
+            spec = importlib.util.spec_from_file_location(
+                'rift_game', PROJECT_ROOT / 'Rift of Memories and Regrets.py')
+            cls.game_module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(cls.game_module)
+        except ImportError as e:
+            raise unittest.SkipTest(f"game dependencies not installed: {e}")
+
+    def trapped(self, **options):
+        game = self.game_module.bullet_hell_game(MemoryRoot(), seed=5, headless=True, **options)
+        game.start_headless()
+        game.start_static_trap()
+        return game
+
+    def test_trap_times_out_on_trap_time(self):
+        """The trap ends when the frame times it is given add up to its limit."""
+        game = self.trapped()
+        for _ in range(3):
+            game._update_static_trap(1.0)
+        self.assertTrue(game.static_trap_active)
+        game._update_static_trap(1.0)
+        self.assertFalse(game.static_trap_active)
+
+    def test_mashes_replay_at_their_trap_time(self):
+        """Played back with other frame times, the mashes land when they were made, not all at once."""
+        with tempfile.TemporaryDirectory() as tmp:
+            game = self.trapped(record_path=str(Path(tmp) / 'trap.replay.gz'))
+            keys = iter(['a', 'd'] * 20)
+            while game.static_trap_active:
+                game._update_static_trap(0.1)
+                game._static_trap_key(next(keys))
+                game._static_trap_key(next(keys))
+            escaped_at = game.static_trap_elapsed
+            recording = game.replay
+        self.assertEqual([e[1] for e in recording.events], ['trap'] * 16)
+
+        played = self.trapped(replay=Replay.from_dict(recording.to_dict()))
+        played._update_static_trap(0.05)
+        self.assertLess(played.static_trap_progress, 0.2)
+        while played.static_trap_active:
+            played._update_static_trap(0.05)
+        self.assertAlmostEqual(played.static_trap_elapsed, escaped_at, delta=0.051)
+        self.assertGreaterEqual(played.static_trap_progress, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,245 @@
+"""Test module for the headless bullet simulation."""
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import numpy as np
+
+from simulation import BulletSimulation, RewindHistory, contacts
+
+# One legacy 20 Hz frame
+DT = 0.05
+from patterns import PATTERNS, spawn_schedule
+from canvas_view import BULLET_STYLES
+
+
+class TestBulletSimulation(unittest.TestCase):
+    """Test bullet movement, culling, collision and graze without Tk."""
+
+    def setUp(self):
+        self.sim = BulletSimulation(800, 600)
+        # Player parked in the bottom-left corner, out of the way
+        self.sim.set_player_rect(0, 560, 20, 580)
+
+    def test_vertical_bullet_moves_and_scores_when_dodged(self):
+        """A vertical bullet at 140px/s falls 7px per 0.05s step and scores 1 when it leaves the screen."""
+        bid = self.sim.spawn('vertical', 400, 0, 20, 20, vy=140)
+        self.sim.step(DT)
+        self.assertAlmostEqual(self.sim.get(bid)['y'], 7)
+        total = 0
+        for _ in range(100):
+            total += self.sim.step(DT).points
+        self.assertEqual(total, 1)
+        self.assertEqual(self.sim.count(), 0)
+
+    def test_hit_is_reported_once(self):
+        """A bullet overlapping the player is removed and reported as a single hit."""
+        self.sim.spawn('vertical', 0, 550, 20, 20, vy=140)
+        result = self.sim.step(DT)
+        self.assertEqual(result.hits, ['vertical'])
+        self.assertEqual(self.sim.count(), 0)
+
+    def test_collisions_disabled(self):
+        """Practice mode / invulnerability disables hits but not grazes."""
+        self.sim.collisions_enabled = False
+        self.sim.spawn('vertical', 0, 550, 20, 20, vy=140)
+        result = self.sim.step(DT)
+        self.assertEqual(result.hits, [])
+        self.assertEqual(result.grazes, 1)
+
+    def test_graze_counted_once_per_bullet(self):
+        """Grazing the same bullet on consecutive steps only counts once."""
+        self.sim.spawn('horizontal', 30, 560, 20, 20, vx=20)
+        grazes = sum(self.sim.step(DT).grazes for _ in range(3))
+        self.assertEqual(grazes, 1)
+
+    def test_split_bullet_spawns_shards(self):
+        """A split bullet bursts into six shards when its timer runs out."""
+        self.sim.spawn('split', 400, 0, 24, 24, vy=100, timer=DT)
+        result = self.sim.step(DT)
+        self.assertEqual(result.points, PATTERNS['split'].expire_score)
+        self.assertEqual(self.sim.counts()['split_shard'], 6)
+
+    def test_removals_are_queued(self):
+        """Removed bullet ids are queued for the view until drained."""
+        bid = self.sim.spawn('vertical', 400, 0, 20, 20, vy=140)
+        self.sim.spawn('vertical', 100, 300, 20, 20, vy=140)
+        self.assertEqual(self.sim.clear_radius(410, 10, 50), 1)
+        self.assertEqual(self.sim.drain_removed(), [bid])
+        self.assertEqual(self.sim.drain_removed(), [])
+        self.assertIsNone(self.sim.get(bid))
+        self.assertEqual(self.sim.count(), 1)
+
+    def test_ids_survive_compaction(self):
+        """Removing bullets in one step leaves every surviving id resolvable."""
+        ids = [self.sim.spawn('vertical', 20 * i, 600 if i % 2 else 100, 10, 10, vy=140)
+               for i in range(1, 40)]
+        self.sim.step(DT)
+        for i, bid in enumerate(ids, 1):
+            with self.subTest(bullet=i):
+                if i % 2:
+                    self.assertIsNone(self.sim.get(bid))
+                else:
+                    self.assertAlmostEqual(self.sim.get(bid)['x'], 20 * i)
+        self.assertEqual(len(self.sim.drain_removed()), 20)
+
+    def test_broad_phase_finds_only_nearby_rows(self):
+        """The broad phase returns bullets around the player, not the rest of the field."""
+        near = self.sim.spawn('vertical', 30, 540, 10, 10)
+        self.sim.spawn('vertical', 700, 100, 10, 10)
+        self.sim.spawn('vertical', 400, 560, 10, 10)
+        rows = self.sim.near_player(50)
+        self.assertEqual(self.sim.store.bid[rows].tolist(), [near])
+
+    def test_large_bullet_hits_from_a_distant_cell(self):
+        """A bullet wider than the graze window still hits when only its edge reaches the player."""
+        self.sim.spawn('boss', 15, 500, 200, 80)
+        result = self.sim.step(DT)
+        self.assertEqual(result.hits, ['boss'])
+
+    def test_contacts_over_arrays(self):
+        """The narrow phase returns hit and graze masks for a whole batch of boxes."""
+        x1 = np.array([5.0, 40.0, 300.0])
+        y1 = np.array([565.0, 560.0, 300.0])
+        hit, graze = contacts(x1, y1, x1 + 10, y1 + 10, (0, 560, 20, 580), 50)
+        self.assertEqual(hit.tolist(), [True, False, False])
+        self.assertEqual(graze.tolist(), [True, True, False])
+
+    def test_snapshot_restore(self):
+        """Restoring a snapshot moves bullets back to their recorded positions."""
+        bid = self.sim.spawn('vertical', 400, 0, 20, 20, vy=140)
+        frame = self.sim.snapshot()
+        for _ in range(5):
+            self.sim.step(DT)
+        self.sim.restore(frame)
+        row = self.sim.get(bid)
+        self.assertEqual((row['x'], row['y']), (400, 0))
+
+    def test_rewind_history_rewinds_through_the_ring(self):
+        """Frames recorded into the ring restore bullets but not lasers."""
+        bid = self.sim.spawn('vertical', 400, 0, 20, 20, vy=140)
+        laser = self.sim.spawn('laser_indicator', 0, 300, 800, 0, timer=5)
+        history = RewindHistory(8)
+        for _ in range(5):
+            self.sim.record(history)
+            self.sim.step(DT)
+        self.sim.store.y[1] = 250.0
+        self.sim.restore(history[0])
+        self.assertEqual(self.sim.get(bid)['y'], 0)
+        self.assertEqual(self.sim.get(laser)['y'], 250)
+
+    def test_rewind_restores_full_state(self):
+        """Rewinding past a split brings the splitter back with its timer and drops its shards."""
+        split = self.sim.spawn('split', 400, 100, 24, 24, vy=100, timer=0.2)
+        wave = self.sim.spawn('wave', 200, 100, 18, 18, vy=80, phase=0.5)
+        history = RewindHistory(20)
+        self.sim.record(history)
+        for _ in range(6):
+            self.sim.step(DT)
+        self.assertIsNone(self.sim.get(split))
+        self.sim.drain_removed()
+        shards = [bid for bid in self.sim.store.bid[:self.sim.store.n].tolist() if bid not in (split, wave)]
+        self.assertEqual(len(shards), 6)
+        self.sim.restore(history[0])
+        row = self.sim.get(split)
+        self.assertEqual((row['y'], row['vy']), (100, 100))
+        self.assertAlmostEqual(row['timer'], 0.2, places=6)
+        self.assertAlmostEqual(self.sim.get(wave)['phase'], 0.5)
+        self.assertEqual(sorted(self.sim.drain_removed()), shards)
+        self.assertEqual(self.sim.count(), 2)
+
+    def test_rewind_history_memory_is_bounded(self):
+        """Frames beyond the row budget or frame count push out the oldest ones."""
+        for i in range(30):
+            self.sim.spawn('vertical', 20 * i, 0, 10, 10)
+        history = RewindHistory(frames=10, rows=100)
+        for frame in range(12):
+            self.sim.store.y[:30] = frame
+            self.sim.record(history)
+        # 100 rows hold three frames of 30; the newest is intact
+        self.assertEqual(len(history), 3)
+        self.assertEqual(history[-1]['y'].tolist(), [11] * 30)
+        self.assertEqual(history[0]['y'].tolist(), [9] * 30)
+        small = RewindHistory(frames=4, rows=1000)
+        for _ in range(6):
+            self.sim.record(small)
+        self.assertEqual(len(small), 4)
+
+    def test_store_grows_past_initial_capacity(self):
+        """The columnar store keeps every bullet when it outgrows its arrays."""
+        for i in range(600):
+            self.sim.spawn('radial', 400, 300, 16, 16, vx=20 * ((i % 7) - 3), vy=20 * ((i % 5) - 2))
+        self.sim.step(DT)
+        self.assertEqual(self.sim.count(), 600)
+        self.assertEqual(self.sim.counts()['radial'], 600)
+
+    def test_motion_is_independent_of_step_length(self):
+        """Two half steps move a bullet as far as one full step."""
+        full = self.sim.spawn('diag', 200, 0, 20, 20, vx=100, vy=100)
+        other = BulletSimulation(800, 600)
+        other.set_player_rect(0, 560, 20, 580)
+        half = other.spawn('diag', 200, 0, 20, 20, vx=100, vy=100)
+        self.sim.step(DT)
+        other.step(DT / 2)
+        other.step(DT / 2)
+        self.assertAlmostEqual(self.sim.get(full)['x'], other.get(half)['x'])
+        self.assertAlmostEqual(self.sim.get(full)['y'], other.get(half)['y'])
+
+    def test_timers_count_seconds(self):
+        """A laser warning set to 1.5s turns into a laser after 30 steps of 0.05s."""
+        self.sim.spawn('laser_indicator', 0, 300, 800, 0, timer=1.5)
+        for _ in range(29):
+            self.sim.step(DT)
+        self.assertEqual(self.sim.counts()['laser'], 0)
+        self.sim.step(DT)
+        self.assertEqual(self.sim.counts()['laser'], 1)
+
+
+    def test_digest_matches_identical_runs_only(self):
+        """Two fields built and stepped the same way have the same digest; any drift changes it."""
+        other = BulletSimulation(800, 600)
+        other.set_player_rect(0, 560, 20, 580)
+        for sim in (self.sim, other):
+            sim.spawn('wave', 100, 0, 12, 12, vy=120, amp=30, rate=3)
+            sim.spawn('homing', 400, 0, 16, 16, vy=80)
+            for _ in range(10):
+                sim.step(DT)
+        self.assertEqual(self.sim.digest(), other.digest())
+        other.step(DT)
+        self.assertNotEqual(self.sim.digest(), other.digest())
+
+class TestPatternRegistry(unittest.TestCase):
+    """Test that the pattern registry matches the game and the view."""
+
+    def test_every_pattern_has_a_style(self):
+        """Each registered kind can be drawn by the canvas view."""
+        for name in PATTERNS:
+            with self.subTest(pattern=name):
+                self.assertIn(name, BULLET_STYLES)
+
+    def test_spawners_exist_in_game(self):
+        """Every scheduled pattern names a spawner and unlock key defined by the game."""
+        game_file = PROJECT_ROOT / "Rift of Memories and Regrets.py"
+        content = game_file.read_text(encoding='utf-8')
+        for pattern in spawn_schedule():
+            with self.subTest(pattern=pattern.name):
+                self.assertIn(f"def {pattern.spawner}(self", content)
+                self.assertIn(f"'{pattern.unlock}':", content)
+                self.assertGreater(pattern.chance, 0)
+
+    def test_margins_cull_at_edge(self):
+        """A contained pattern (triangle) is culled as soon as it touches a side."""
+        sim = BulletSimulation(800, 600)
+        sim.set_player_rect(0, 560, 20, 580)
+        sim.spawn('triangle', 775, 100, 20, 20, vx=140, vy=140)
+        result = sim.step(DT)
+        self.assertEqual(result.points, PATTERNS['triangle'].score)
+        self.assertEqual(sim.count(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""Test module for per-run performance telemetry."""
+import json
+import os
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from telemetry import LatencyHistogram, SessionTelemetry, SUB_BUCKETS, bucket_index, bucket_range
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Test the log-linear buckets and percentiles read from them."""
+
+    def test_buckets_cover_values_without_gaps(self):
+        """Every value lands in the bucket whose range holds it, and ranges tile the axis."""
+        low = 0
+        for index in range(bucket_index(10_000_000) + 1):
+            start, end = bucket_range(index)
+            self.assertEqual(start, low)
+            self.assertEqual(bucket_index(start), index)
+            self.assertEqual(bucket_index(end), index)
+            # Relative bucket width stays within one sub-bucket
+            self.assertLessEqual(end - start + 1, max(1, start // SUB_BUCKETS))
+            low = end + 1
+
+    def test_percentiles(self):
+        """Percentiles come back within bucket precision, capped at the max."""
+        hist = LatencyHistogram()
+        for ms in range(1, 101):  # 1..100 ms
+            hist.record(float(ms))
+        self.assertAlmostEqual(hist.percentile(50), 50.0, delta=50.0 / SUB_BUCKETS)
+        self.assertAlmostEqual(hist.percentile(99), 99.0, delta=99.0 / SUB_BUCKETS)
+        self.assertEqual(hist.percentile(100), 100.0)
+        summary = hist.summary()
+        self.assertEqual(summary['count'], 100)
+        self.assertEqual(summary['max'], 100.0)
+        self.assertEqual(sum(count for _, count in summary['buckets_us']), 100)
+        self.assertEqual(LatencyHistogram().percentile(50), 0.0)
+
+
+class TestSessionTelemetry(unittest.TestCase):
+    """Test the counters of a run and the report file."""
+
+    def test_report_file(self):
+        """Ticks, frames, peaks and power-up time end up in the written report."""
+        telemetry = SessionTelemetry(budget_ms=100.0, seed=42, settings={'sim_rate': 20}, clock=lambda: 0.0)
+        for i in range(40):
+            telemetry.add_tick(1.0 + i % 4, 0.05, bullets=i, states=(i < 20, False, False, True, False))
+            if telemetry.wants_items():
+                telemetry.sample_items(100 + i)
+            telemetry.add_frame(150.0 if i == 7 else 50.0)
+        telemetry.add_state('static_trap', 0.5)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = telemetry.write(os.path.join(tmp, 'telemetry'), 'game_over', score=7)
+            with open(path, encoding='utf-8') as f:
+                report = json.load(f)
+        self.assertEqual(report['ended'], 'game_over')
+        self.assertEqual(report['seed'], 42)
+        self.assertEqual(set(report['machine']), {'platform', 'python'})
+        self.assertEqual(report['score'], 7)
+        self.assertEqual(report['game_time'], 2.0)
+        self.assertEqual(report['tick_ms']['count'], 40)
+        self.assertEqual(report['tick_ms']['max'], 4.0)
+        self.assertEqual(report['frames_over_budget'], 1)
+        self.assertEqual(report['peak_bullets'], 39)
+        self.assertEqual(report['peak_canvas_items'], 120)  # sampled once per simulated second
+        self.assertEqual(report['power_up_seconds'],
+                         {'freeze': 1.0, 'rewind': 0.0, 'slowmo': 0.0, 'shield': 2.0, 'focus': 0.0,
+                          'static_trap': 0.5})
+
+
+if __name__ == '__main__':
+    unittest.main()